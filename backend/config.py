@@ -222,6 +222,9 @@ DEFAULT_CONFIG = {
         "poll_interval_seconds": 12,
         "request_timeout_seconds": 20,
         "max_tasks_per_poll": 4,
+        "max_task_concurrency": 4,
+        "signature_alg": "hmac-sha256",
+        "wire_format": "json",
     },
     "security": {
         # Keep local-first UX by default while hardening critical surfaces.
@@ -264,12 +267,32 @@ DEFAULT_CONFIG = {
 }
 
 _config_cache = None
+# Merged config as last read from / written to disk, keyed by the file's stat.
+# force_reload hands out a fresh copy of it instead of re-parsing unchanged YAML.
+_config_disk_state = None
+
+def _config_stat_key() -> Optional[tuple]:
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _remember_disk_state(config: dict):
+    global _config_disk_state
+    stat_key = _config_stat_key()
+    _config_disk_state = (stat_key, copy.deepcopy(config)) if stat_key is not None else None
 
 def load_config(force_reload: bool = False) -> dict:
     global _config_cache
     if _config_cache and not force_reload:
         return _config_cache
-    
+
+    disk_state = _config_disk_state
+    if disk_state is not None and disk_state[0] == _config_stat_key():
+        _config_cache = copy.deepcopy(disk_state[1])
+        return _config_cache
+
     if not os.path.exists(CONFIG_PATH):
         _config_cache = copy.deepcopy(DEFAULT_CONFIG)
         # Generate initial token
@@ -342,6 +365,7 @@ def load_config(force_reload: bool = False) -> dict:
             pass
     else:
         _ensure_private_permissions()
+        _remember_disk_state(_config_cache)
 
     return _config_cache
 
@@ -383,6 +407,7 @@ def save_config(config: dict):
     with open(CONFIG_PATH, "w") as f:
         yaml.dump(merged, f, default_flow_style=False)
     _ensure_private_permissions()
+    _remember_disk_state(merged)
 
 def get_snapshot_token() -> str:
     config = load_config()
@@ -15,6 +15,18 @@ else:
 DB_PATH = os.path.join(DATA_DIR, "lancedb")
 
 _db = None
+# Bumped whenever tables may have been recreated (migrations), so callers that
+# memoize open_table() handles know to reopen them.
+_schema_generation = 0
+
+
+def schema_generation() -> int:
+    return _schema_generation
+
+
+def bump_schema_generation() -> None:
+    global _schema_generation
+    _schema_generation += 1
 
 
 def _extract_listed_tables(value: Any) -> list[str]:
@@ -124,6 +136,7 @@ def init_tables():
         Message,
         Conflict,
         Session,
+        SessionActivityEvent,
         PendingConflict,
         ContextRouteLog,
         MemoryGraphEdge,
@@ -144,6 +157,7 @@ def init_tables():
     _safe_create_table(db, "conflicts", Conflict)
     _safe_create_table(db, "pending_conflicts", PendingConflict)
     _safe_create_table(db, "sessions", Session)
+    _safe_create_table(db, "session_activity_events", SessionActivityEvent)
     _safe_create_table(db, "context_route_logs", ContextRouteLog)
     _safe_create_table(db, "memory_graph_edges", MemoryGraphEdge)
     _safe_create_table(db, "conversation_analysis_jobs", ConversationAnalysisJob)
@@ -147,6 +147,15 @@ class Session(LanceModel):
     memory_ids_written: List[str]
     memory_ids_feedback: List[str]
     end_reason: Optional[str]
+    version: int = 0
+
+
+class SessionActivityEvent(LanceModel):
+    id: str
+    session_id: str
+    kind: str  # "read" | "write" | "feedback"
+    memory_id: str
+    created_at: datetime
 
 
 class ConversationAnalysisJob(LanceModel):
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 import os
 import asyncio
@@ -8,6 +9,11 @@ import threading
 import logging
 import json
 
+try:
+    from pyinstrument import Profiler
+except ImportError:  # pragma: no cover - pyinstrument is an optional dev tool
+    Profiler = None
+
 from backend.database.client import init_tables
 from backend.memory.write_queue import start_write_worker
 from backend.memory.conversation_analysis_jobs import start_analysis_job_worker
@@ -77,6 +83,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ─── Admin Status Profiler (opt-in) ───────────────────────────────────────────
+# With MNESIS_PROFILE_ADMIN=1 and pyinstrument installed, adding ?profile=1 to an
+# /api/v1/admin/background/ request returns a pyinstrument HTML report instead of
+# the JSON body. Added before the access middlewares below, so it runs inside
+# them and tunnelled requests still need an admin-scoped token.
+_PROFILED_PATH_PREFIX = "/api/v1/admin/background/"
+
+
+class AdminProfilerASGIMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not scope["path"].startswith(_PROFILED_PATH_PREFIX)
+            or Request(scope).query_params.get("profile") != "1"
+        ):
+            return await self.app(scope, receive, send)
+
+        async def _discard(message):
+            pass
+
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, _discard)
+        finally:
+            profiler.stop()
+        await HTMLResponse(profiler.output_html())(scope, receive, send)
+
+
+if Profiler is not None and os.environ.get("MNESIS_PROFILE_ADMIN") == "1":
+    app.add_middleware(AdminProfilerASGIMiddleware)
+
 # ─── MCP Auth Middleware ──────────────────────────────────────────────────────
 # Must be added AFTER CORS so CORS headers are still set on 401/403 responses
 app.add_middleware(SecurityHeadersMiddleware)
@@ -242,6 +283,11 @@ async def startup_event():
     start_config_watcher()
     logger.info("Config watcher started")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await admin.close_shared_http_client()
+
+
 # ─── Routers ──────────────────────────────────────────────────────────────────
 app.include_router(memories.router)
 app.include_router(admin.router)
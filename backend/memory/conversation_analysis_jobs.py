@@ -26,6 +26,13 @@ STATUS_FAILED = "failed"
 STATUS_CANCELLED = "cancelled"
 
 _TERMINAL_STATUSES = {STATUS_COMPLETED, STATUS_FAILED, STATUS_CANCELLED}
+# Waiters re-read the job at this interval in case a status change was never signalled
+# (e.g. the row was updated by another process).
+_WAIT_RECHECK_SECONDS = 5.0
+
+# Job id -> one event per waiter, set when that job reaches a terminal status;
+# see wait_for_analysis_job.
+_settled_events: dict[str, set[asyncio.Event]] = {}
 
 _worker_task: asyncio.Task | None = None
 _worker_state: dict[str, Any] = {
@@ -404,6 +411,42 @@ async def enqueue_analysis_job(
     return await enqueue_write(_write_op)
 
 
+def _signal_job_settled(job_id: str, status: str):
+    if status in _TERMINAL_STATUSES:
+        for event in _settled_events.pop(job_id, ()):
+            event.set()
+
+
+async def wait_for_analysis_job(job_id: str, timeout: float) -> Optional[dict]:
+    """
+    Wait until a job reaches a terminal status (or `timeout` seconds pass) and return
+    its latest public row. Woken by the worker as soon as the status is written.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max(0.0, float(timeout))
+    event = asyncio.Event()
+    try:
+        while True:
+            event.clear()
+            _settled_events.setdefault(job_id, set()).add(event)
+            # Read after registering, so a transition in between cannot be missed.
+            current = get_analysis_job(job_id)
+            status = str((current or {}).get("status") or "").strip().lower()
+            remaining = deadline - loop.time()
+            if status in _TERMINAL_STATUSES or remaining <= 0:
+                return current
+            try:
+                await asyncio.wait_for(event.wait(), timeout=min(remaining, _WAIT_RECHECK_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        waiters = _settled_events.get(job_id)
+        if waiters is not None:
+            waiters.discard(event)
+            if not waiters:
+                _settled_events.pop(job_id, None)
+
+
 def get_analysis_job(job_id: str) -> Optional[dict]:
     _ensure_tables()
     db = get_db()
@@ -500,7 +543,10 @@ async def cancel_analysis_job(job_id: str) -> Optional[dict]:
         updated = tbl.search().where(f"id = '{escaped}'").limit(1).to_list()
         return _public_job(updated[0]) if updated else None
 
-    return await enqueue_write(_write_op)
+    cancelled = await enqueue_write(_write_op)
+    if cancelled:
+        _signal_job_settled(job_id, str(cancelled.get("status") or ""))
+    return cancelled
 
 
 async def _recover_running_jobs():
@@ -622,7 +668,9 @@ async def _set_job_status(
         rows = tbl.search().where(f"id = '{escaped}'").limit(1).to_list()
         return rows[0] if rows else None
 
-    return await enqueue_write(_write_op)
+    updated = await enqueue_write(_write_op)
+    _signal_job_settled(job_id, status)
+    return updated
 
 
 async def _run_job(job: dict):
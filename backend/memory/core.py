@@ -16,7 +16,7 @@ from backend.memory.context_router import categories_for_domain, classify_query_
 from backend.memory.decay import infer_decay_profile
 from backend.memory.embedder import embed, get_model, get_status
 from backend.memory.graph_layer import sync_memory_node, update_graph_on_memory_create
-from backend.memory.write_queue import enqueue_write
+from backend.memory.write_queue import enqueue_add, enqueue_write
 
 logger = logging.getLogger(__name__)
 
@@ -245,24 +245,16 @@ async def _log_context_route(query: str, domain: str, scores: dict[str, float]):
     if not query:
         return
 
-    async def _write_op():
-        db = get_db()
-        tbl = db.open_table("context_route_logs")
-        now = datetime.now(timezone.utc)
-        tbl.add(
-            [
-                ContextRouteLog(
-                    id=str(uuid.uuid4()),
-                    query_preview=query[:240],
-                    detected_domain=domain,
-                    scores_json=json.dumps(scores),
-                    created_at=now,
-                )
-            ]
-        )
+    row = ContextRouteLog(
+        id=str(uuid.uuid4()),
+        query_preview=query[:240],
+        detected_domain=domain,
+        scores_json=json.dumps(scores),
+        created_at=datetime.now(timezone.utc),
+    )
 
     try:
-        await enqueue_write(_write_op)
+        await enqueue_add(get_db().open_table("context_route_logs"), [row])
     except Exception as e:
         logger.warning(f"Failed to log context routing event: {e}")
 
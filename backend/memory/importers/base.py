@@ -1,8 +1,58 @@
+import hashlib
+import json
+import os
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Generator
+from typing import Iterable, Optional, Any, Generator
 from pydantic import BaseModel
 from datetime import datetime
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    _json_loads = json.loads
+
+# Exports above this size are streamed with ijson instead of decoded in one shot.
+STREAMING_THRESHOLD_BYTES = 100 * 1024 * 1024
+
+
+def iter_array_items(file_path: str) -> Generator[Any, None, None]:
+    """Stream the items of a top-level JSON array with ijson."""
+    import ijson
+
+    with open(file_path, 'rb') as f:
+        yield from ijson.items(f, 'item')
+
+
+def peek_array_item(file_path: str) -> Any:
+    """Return the first item of a top-level JSON array, or None for anything else."""
+    if not _starts_with_array(file_path):
+        return None
+    return next(iter_array_items(file_path), None)
+
+
+def _starts_with_array(file_path: str) -> bool:
+    with open(file_path, 'rb') as f:
+        head = f.read(64).lstrip(b"\xef\xbb\xbf \t\r\n")
+    return head.startswith(b"[")
+
+
+def load_json(file_path: str) -> Any:
+    """
+    Load an export file. Decodes with orjson when available; very large
+    top-level arrays are streamed item by item to bound peak memory.
+    """
+    if os.path.getsize(file_path) > STREAMING_THRESHOLD_BYTES and _starts_with_array(file_path):
+        return iter_array_items(file_path)
+    with open(file_path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def content_fingerprint(content: str) -> bytes:
+    """Case- and whitespace-insensitive digest used to drop duplicate memories."""
+    return hashlib.blake2b(content.strip().lower().encode("utf-8"), digest_size=16).digest()
+
+
 class RawMemory(BaseModel):
     content: str
     source: str # "claude", "chatgpt", "gemini"
@@ -13,8 +63,11 @@ class RawMemory(BaseModel):
 
 class BaseImporter(ABC):
     @abstractmethod
-    def parse_memories(self, file_path: str) -> List[RawMemory]:
-        """Parse memories file into standard RawMemory objects."""
+    def parse_memories(self, file_path: str) -> Iterable[RawMemory]:
+        """
+        Parse memories file into standard RawMemory objects.
+        May return a list or a generator; callers should iterate it once.
+        """
         pass
 
     @abstractmethod
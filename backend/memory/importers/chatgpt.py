@@ -1,11 +1,19 @@
 import logging
 import json
-import hashlib
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Generator, List, Optional, Tuple
 
-from backend.memory.importers.base import BaseImporter, RawMemory
+import xxhash
+
+from backend.memory.importers.base import (
+    BaseImporter,
+    RawMemory,
+    content_fingerprint,
+    iter_array_items,
+    load_json,
+    peek_array_item,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,31 +28,49 @@ CHATGPT_KEYWORD_MAP: List[Tuple[List[str], str, str]] = [
     (["_default"], "semantic", "preferences"),
 ]
 
+# Flattened once at import: (utf-8 keyword, level, category) in priority order.
+# Matching on bytes goes straight to the C-level fastsearch without str overhead.
+_FLAT_KEYWORDS: Tuple[Tuple[bytes, str, str], ...] = tuple(
+    (kw.lower().encode("utf-8"), level, category)
+    for keywords, level, category in CHATGPT_KEYWORD_MAP
+    if keywords != ["_default"]
+    for kw in keywords
+)
+_DEFAULT_CLASSIFICATION: Tuple[str, str] = next(
+    ((level, category) for keywords, level, category in CHATGPT_KEYWORD_MAP if keywords == ["_default"]),
+    ("semantic", "preferences"),
+)
+
 class ChatGPTImporter(BaseImporter):
+    def __init__(self, deduplicate: bool = True):
+        self.deduplicate = deduplicate
+
     def _classify(self, content: str) -> Tuple[str, str]:
-        content_lower = content.lower()
-        for keywords, level, category in CHATGPT_KEYWORD_MAP:
-            if keywords == ["_default"]:
+        buf = content.lower().encode("utf-8")
+        for kw, level, category in _FLAT_KEYWORDS:
+            if buf.find(kw) != -1:
                 return level, category
-            for kw in keywords:
-                if kw in content_lower:
-                    return level, category
-        return "semantic", "preferences"
+        return _DEFAULT_CLASSIFICATION
 
     def parse_memories(self, file_path: str) -> List[RawMemory]:
         results = []
+        seen: set[bytes] = set()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
             # ChatGPT export: usually "memories" key inside a larger JSON or just a list?
             # PROMPT.md implies "memories.json" is the file.
             # Format: [{"memory": "...", "created_at": "..."}]
-            
-            if isinstance(data, list):
-                items = data
+
+            first = peek_array_item(file_path)
+            if isinstance(first, dict) and "mapping" in first:
+                # Looks like conversations.json: stream it rather than decoding
+                # every conversation tree just to find the odd memory row.
+                items = iter_array_items(file_path)
             else:
-                items = data.get("memories") or data.get("list") or data.get("items") or []
+                data = load_json(file_path)
+                if isinstance(data, dict):
+                    items = data.get("memories") or data.get("list") or data.get("items") or []
+                else:
+                    items = data
             
             for item in items:
                 if not isinstance(item, dict):
@@ -57,7 +83,12 @@ class ChatGPTImporter(BaseImporter):
                 content = raw_content if isinstance(raw_content, str) else ""
                 if not content:
                     continue
-                    
+                if self.deduplicate:
+                    fingerprint = content_fingerprint(content)
+                    if fingerprint in seen:
+                        continue
+                    seen.add(fingerprint)
+
                 created_at_str = item.get("created_at")
                 created_at = None
                 if created_at_str:
@@ -108,7 +139,12 @@ class ChatGPTImporter(BaseImporter):
                 return ""
             parts = content.get("parts")
             if isinstance(parts, list):
-                chunks = [str(part).strip() for part in parts if isinstance(part, str) and part.strip()]
+                chunks = []
+                for part in parts:
+                    if isinstance(part, str):
+                        stripped = part.strip()
+                        if stripped:
+                            chunks.append(stripped)
                 if chunks:
                     return "\n".join(chunks)
             text = content.get("text")
@@ -117,18 +153,21 @@ class ChatGPTImporter(BaseImporter):
             return ""
 
         def _extract_messages(mapping: Any, conversation_id: str, fallback_time: Optional[datetime]) -> list[dict]:
-            if not isinstance(mapping, dict):
+            try:
+                nodes = mapping.values()
+            except AttributeError:
                 return []
 
             messages: list[dict] = []
-            for node in mapping.values():
-                if not isinstance(node, dict):
-                    continue
-                message = node.get("message")
-                if not isinstance(message, dict):
+            for node in nodes:
+                # ijson yields plain dicts for well-formed exports; anything else
+                # (None, lists, scalars) has no .get and is skipped here.
+                try:
+                    message = node.get("message")
+                    metadata = message.get("metadata")
+                except AttributeError:
                     continue
 
-                metadata = message.get("metadata")
                 if isinstance(metadata, dict):
                     if metadata.get("is_visually_hidden_from_conversation") or metadata.get("is_user_system_message"):
                         continue
@@ -168,7 +207,10 @@ class ChatGPTImporter(BaseImporter):
                 if not isinstance(row, dict):
                     continue
                 content = row.get("text", row.get("content", ""))
-                if not isinstance(content, str) or not content.strip():
+                if not isinstance(content, str):
+                    continue
+                content = content.strip()
+                if not content:
                     continue
                 role = row.get("sender", row.get("role", "user"))
                 messages.append(
@@ -176,7 +218,7 @@ class ChatGPTImporter(BaseImporter):
                         "id": str(row.get("id") or uuid.uuid4()),
                         "conversation_id": conversation_id,
                         "role": str(role),
-                        "content": content.strip(),
+                        "content": content,
                         "created_at": _to_datetime(row.get("created_at") or row.get("timestamp")) or fallback_time,
                     }
                 )
@@ -213,7 +255,7 @@ class ChatGPTImporter(BaseImporter):
                 "mapping_ids": mapping_ids,
                 "chat_fingerprint": chat_fingerprint,
             }
-            digest = hashlib.sha1(
+            digest = xxhash.xxh3_128(
                 json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
             ).hexdigest()[:24]
             return f"chatgpt-{digest}"
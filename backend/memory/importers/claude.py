@@ -1,11 +1,13 @@
-import json
+import re
 from datetime import datetime
-from typing import List, Generator
-from backend.memory.importers.base import BaseImporter, RawMemory
+from typing import Generator
+from backend.memory.importers.base import BaseImporter, RawMemory, content_fingerprint, load_json
 import logging
 
 logger = logging.getLogger(__name__)
 
+_HEADER_RE = re.compile(r'^\*\*(.+)\*\*$')
+
 CLAUDE_CATEGORY_MAP = {
     "General Preferences": ("semantic", "preferences"),
     "Personal Information": ("semantic", "identity"),
@@ -20,22 +22,30 @@ CLAUDE_CATEGORY_MAP = {
 }
 
 class ClaudeImporter(BaseImporter):
-    def parse_memories(self, file_path: str) -> List[RawMemory]:
-        results = []
+    def __init__(self, deduplicate: bool = True):
+        self.deduplicate = deduplicate
+
+    def parse_memories(self, file_path: str) -> Generator[RawMemory, None, None]:
+        seen: set[bytes] = set()
+
+        def _is_duplicate(text: str) -> bool:
+            if not self.deduplicate:
+                return False
+            fingerprint = content_fingerprint(text)
+            if fingerprint in seen:
+                return True
+            seen.add(fingerprint)
+            return False
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
+            data = load_json(file_path)
+
             for item in data:
                 # Format 1: Conversations Memory (Markdown)
                 if "conversations_memory" in item:
                     markdown_content = item.get("conversations_memory", "")
                     # Parse markdown sections
-                    # Heuristic: headers are **Title** or ## Title
-                    import re
-                    # Split by **Title** pattern, keeping the delimiters
-                    # Pattern: match start of line or newline, followed by **Title**, followed by newline
-                    
+                    # Heuristic: headers are **Title** lines
                     # Simple approach: iterate lines
                     lines = markdown_content.split('\n')
                     current_section = "_default"
@@ -46,20 +56,20 @@ class ClaudeImporter(BaseImporter):
                         if not line:
                             continue
                             
-                        # Check for header **Title**
-                        header_match = re.match(r'^\*\*(.+)\*\*$', line)
+                        # Check for header **Title** (cheap prefix test before the regex)
+                        header_match = _HEADER_RE.match(line) if line.startswith("**") else None
                         if header_match:
                             # Save previous section if exists
                             if current_content:
                                 text = "\n".join(current_content).strip()
-                                if text:
-                                    results.append(RawMemory(
+                                if text and not _is_duplicate(text):
+                                    yield RawMemory(
                                         content=text,
                                         source="claude",
                                         original_created_at=None,
                                         original_category=current_section,
                                         metadata={"original_id": str(item.get("account_uuid", "")) + f"_{current_section}"}
-                                    ))
+                                    )
                             # Start new section
                             current_section = header_match.group(1)
                             current_content = []
@@ -69,14 +79,14 @@ class ClaudeImporter(BaseImporter):
                     # Save last section
                     if current_content:
                         text = "\n".join(current_content).strip()
-                        if text:
-                            results.append(RawMemory(
+                        if text and not _is_duplicate(text):
+                            yield RawMemory(
                                 content=text,
                                 source="claude",
                                 original_created_at=None,
                                 original_category=current_section,
                                 metadata={"original_id": str(item.get("account_uuid", "")) + f"_{current_section}"}
-                            ))
+                            )
                             
                 else:
                     # Format 2: Standard JSON export (Individual items)
@@ -91,20 +101,18 @@ class ClaudeImporter(BaseImporter):
                         except ValueError:
                             pass
                     
-                    if content:
-                        results.append(RawMemory(
+                    if content and not _is_duplicate(str(content)):
+                        yield RawMemory(
                             content=content,
                             source="claude",
                             original_created_at=created_at,
                             original_category=title,
                             metadata={"original_id": str(item.get("uuid", ""))}
-                        ))
+                        )
 
         except Exception as e:
             logger.error(f"Failed to parse Claude memories: {e}")
             raise e
-            
-        return results
 
     def parse_conversations(self, file_path: str) -> Generator[dict, None, None]:
         # Implementation for streaming conversations.json if needed
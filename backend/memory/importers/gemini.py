@@ -9,6 +9,9 @@ import io
 
 logger = logging.getLogger(__name__)
 
+ZIP_READ_BUFFER_BYTES = 1024 * 1024
+IJSON_BUF_SIZE = 64 * 1024
+
 class GeminiImporter(BaseImporter):
     def parse_memories(self, file_path: str) -> List[RawMemory]:
         # Gemini Takeout typically doesn't have a distinct "memories" file yet
@@ -39,15 +42,11 @@ class GeminiImporter(BaseImporter):
                     logger.warning("No conversation JSON found in Gemini ZIP")
                     return
 
-                # Stream from zip
-                with z.open(target_file) as f:
-                    # ijson needs a seekable stream or bytes? 
-                    # ZipExtFile is seekable if uncompressed? 
-                    # ijson works with file-like objects.
-                    
-                    # PROMPT.md example used open(filepath).
-                    # Here we have a stream.
-                    parser = ijson.items(f, 'item')
+                # Stream from zip. ZipExtFile inflates on every read() call, so
+                # front it with a 1MB buffer to amortize decompression.
+                with z.open(target_file) as raw:
+                    f = io.BufferedReader(raw, buffer_size=ZIP_READ_BUFFER_BYTES)
+                    parser = ijson.items(f, 'item', buf_size=IJSON_BUF_SIZE)
                     for item in parser:
                         yield {
                             "id": str(item.get("conversationId") or item.get("id")),
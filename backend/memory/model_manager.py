@@ -1,8 +1,12 @@
+import hashlib
+import json
 import logging
+import mmap
 import os
+import time
 from pathlib import Path
 
-from huggingface_hub import hf_hub_download
+from huggingface_hub import HfApi, hf_hub_download
 
 # Constants for bge-small-en-v1.5
 MODEL_REPO = "BAAI/bge-small-en-v1.5"
@@ -20,6 +24,9 @@ MODEL_FILES = [
     "1_Pooling/config.json",
 ]
 
+# Folders that hold MODEL_FILES, relative to MODEL_DIR ("" is the root).
+_MODEL_SUBDIRS = tuple(sorted({rel.rsplit("/", 1)[0] if "/" in rel else "" for rel in MODEL_FILES}))
+
 # Local path
 if os.environ.get("MNESIS_APPDATA_DIR"):
     DATA_DIR = os.path.join(os.environ["MNESIS_APPDATA_DIR"], "data")
@@ -29,6 +36,12 @@ else:
     DATA_DIR = os.path.join(os.path.expanduser("~"), ".mnesis", "data")
 
 MODEL_DIR = Path(DATA_DIR) / "models" / "bge-small-en-v1.5"
+# Expected size/sha256 per file, recorded from the Hub manifest after a download.
+MANIFEST_FILE = ".mnesis_manifest.json"
+# Files at or below this size are verified by size only.
+HASH_MIN_BYTES = 1024 * 1024
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_BACKOFF_SECONDS = 0.5
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +53,111 @@ class ModelManager:
     def _file_path(self, rel_path: str) -> Path:
         return MODEL_DIR / rel_path
 
+    def _load_local_manifest(self) -> dict:
+        try:
+            with open(MODEL_DIR / MANIFEST_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _save_local_manifest(self, manifest: dict) -> None:
+        try:
+            with open(MODEL_DIR / MANIFEST_FILE, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+        except Exception as e:
+            logger.warning(f"Could not persist model manifest: {e}")
+
+    def _fetch_remote_manifest(self) -> dict:
+        """Return {rel_path: {"size", "sha256"}} from the Hub, or {} when offline."""
+        try:
+            info = HfApi().model_info(MODEL_REPO, files_metadata=True)
+        except Exception as e:
+            logger.warning(f"Could not fetch model manifest, falling back to presence checks: {e}")
+            return {}
+        manifest = {}
+        for sibling in info.siblings or []:
+            if sibling.rfilename not in MODEL_FILES:
+                continue
+            lfs = sibling.lfs or {}
+            manifest[sibling.rfilename] = {
+                "size": sibling.size if sibling.size is not None else lfs.get("size"),
+                "sha256": lfs.get("sha256"),
+            }
+        return manifest
+
+    @staticmethod
+    def _sha256(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(0, len(mm), HASH_MIN_BYTES):
+                    digest.update(mm[offset:offset + HASH_MIN_BYTES])
+        return digest.hexdigest()
+
+    def _file_matches(self, path: Path, expected: dict | None, verify_hash: bool) -> bool:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return False
+        expected_size = (expected or {}).get("size")
+        if expected_size is None:
+            return True
+        if size != int(expected_size):
+            return False
+        expected_sha = (expected or {}).get("sha256")
+        if verify_hash and expected_sha and size > HASH_MIN_BYTES:
+            return self._sha256(path) == expected_sha
+        return True
+
+    def _scan_model_files(self) -> dict[str, os.DirEntry]:
+        """Index files under MODEL_DIR with one scandir per folder instead of a stat per file."""
+        entries: dict[str, os.DirEntry] = {}
+        for folder in _MODEL_SUBDIRS:
+            try:
+                with os.scandir(MODEL_DIR / folder if folder else MODEL_DIR) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            entries[f"{folder}/{entry.name}" if folder else entry.name] = entry
+            except OSError:
+                continue
+        return entries
+
+    def _download_with_retry(self, filename: str, subfolder: str | None, force_download: bool) -> None:
+        # hf_hub_download already reuses huggingface_hub's shared HTTP client, so
+        # connections are pooled across files; add backoff for transient failures.
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            try:
+                hf_hub_download(
+                    repo_id=MODEL_REPO,
+                    filename=filename,
+                    subfolder=subfolder,
+                    local_dir=str(MODEL_DIR),
+                    force_download=force_download,
+                )
+                return
+            except Exception as e:
+                if attempt >= DOWNLOAD_RETRIES:
+                    raise
+                delay = DOWNLOAD_BACKOFF_SECONDS * (2 ** attempt)
+                logger.warning(f"Download of {filename} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+
     def check_model_exists(self) -> bool:
-        if not MODEL_DIR.exists():
+        entries = self._scan_model_files()
+        if not all(rel_path in entries for rel_path in MODEL_FILES):
             return False
+        # Size checks against the recorded manifest catch truncated files left
+        # behind by an interrupted download; hashing is reserved for downloads.
+        manifest = self._load_local_manifest()
         for rel_path in MODEL_FILES:
-            if not self._file_path(rel_path).exists():
+            expected_size = (manifest.get(rel_path) or {}).get("size")
+            if expected_size is None:
+                continue
+            try:
+                if entries[rel_path].stat().st_size != int(expected_size):
+                    return False
+            except OSError:
                 return False
         return True
 
@@ -65,13 +178,17 @@ class ModelManager:
             self.progress.pop("error", None)
 
             MODEL_DIR.mkdir(parents=True, exist_ok=True)
+            manifest = self._fetch_remote_manifest() or self._load_local_manifest()
 
             total_files = len(MODEL_FILES)
             for idx, rel_path in enumerate(MODEL_FILES):
                 dest_path = self._file_path(rel_path)
                 self.progress["file"] = rel_path
 
+                stale = False
                 if dest_path.exists():
+                    stale = not self._file_matches(dest_path, manifest.get(rel_path), verify_hash=True)
+                if dest_path.exists() and not stale:
                     self.progress["downloaded"] = idx + 1
                     self.progress["percent"] = int(((idx + 1) / total_files) * 100)
                     continue
@@ -85,17 +202,13 @@ class ModelManager:
                 else:
                     subfolder, filename = None, rel_path
 
-                hf_hub_download(
-                    repo_id=MODEL_REPO,
-                    filename=filename,
-                    subfolder=subfolder,
-                    local_dir=str(MODEL_DIR),
-                    force_download=False,
-                )
+                self._download_with_retry(filename, subfolder, force_download=stale)
 
                 self.progress["downloaded"] = idx + 1
                 self.progress["percent"] = int(((idx + 1) / total_files) * 100)
 
+            if manifest:
+                self._save_local_manifest(manifest)
             self.mark_complete()
         except Exception as e:
             logger.error(f"Download failed: {e}")
@@ -1,22 +1,92 @@
+import asyncio
+from collections import OrderedDict
+from functools import lru_cache
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 import uuid
 import logging
 from typing import List, Optional
 
-from backend.database.client import get_db
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from backend.database.client import get_db, schema_generation
 from backend.database.schema import Session
-from backend.memory.write_queue import enqueue_write
+from backend.memory.write_queue import enqueue_add, enqueue_write
 from backend.utils.context import mcp_client_name_ctx
 
 logger = logging.getLogger(__name__)
 
 
-def _escape_sql(value: str) -> str:
-    return str(value or "").replace("'", "''")
+# Append-only journal of per-session memory touches (see _apply_session_activity).
+SESSION_EVENTS_TABLE = "session_activity_events"
+SESSION_EVENTS_SCAN_LIMIT = 2_000_000
+SESSION_EVENTS_DELETE_BATCH = 500
+ACTIVITY_COLUMNS = {
+    "read": "memory_ids_read",
+    "write": "memory_ids_written",
+    "feedback": "memory_ids_feedback",
+}
+
+# Columns the activity path actually reads, so lookups skip the rest of the row.
+SESSION_ACTIVITY_PROJECTION = ["id", "api_key_id", "source_llm", *ACTIVITY_COLUMNS.values()]
+EVENT_COLUMNS = ("kind", "memory_id")
+
+SESSION_CAS_RETRIES = 3
+
+# Hot session rows keyed by id, so activity updates skip the LanceDB lookup.
+SESSION_CACHE_MAX_ENTRIES = 10_000
+_SESSION_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+
+
+def _cache_get(session_id: str) -> Optional[dict]:
+    row = _SESSION_CACHE.get(session_id)
+    if row is not None:
+        _SESSION_CACHE.move_to_end(session_id)
+    return row
+
+
+def _cache_put(session_id: str, row: dict) -> None:
+    _SESSION_CACHE[session_id] = row
+    _SESSION_CACHE.move_to_end(session_id)
+    while len(_SESSION_CACHE) > SESSION_CACHE_MAX_ENTRIES:
+        _SESSION_CACHE.popitem(last=False)
+
+
+def _cache_evict(session_id: str) -> None:
+    _SESSION_CACHE.pop(session_id, None)
+
+
+# open_table() handles keyed by name; reopened when the connection or schema changes.
+_table_handles: dict[str, tuple] = {}
+
+
+def _get_table(db, name: str):
+    generation = schema_generation()
+    cached = _table_handles.get(name)
+    if cached is not None and cached[0] is db and cached[1] == generation:
+        return cached[2]
+    tbl = db.open_table(name)
+    _table_handles[name] = (db, generation, tbl)
+    return tbl
+
+
+def _get_sessions_tbl():
+    return _get_table(get_db(), "sessions")
+
+
+@lru_cache(maxsize=1024)
+def _eq_filter(column: str, value: str) -> str:
+    """
+    Build (and memoize) an equality filter for LanceDB. LanceDB only accepts
+    SQL strings here, so the literal is quoted once per distinct id.
+    """
+    literal = str(value or "").replace("'", "''")
+    return f"{column} = '{literal}'"
+
 
 async def start_session(source_llm: str, api_key_id: Optional[str] = None) -> str:
-    db = get_db()
-    tbl = db.open_table("sessions")
+    tbl = _get_sessions_tbl()
     
     session_id = str(uuid.uuid4())
     now = datetime.now(timezone.utc)
@@ -37,7 +107,8 @@ async def start_session(source_llm: str, api_key_id: Optional[str] = None) -> st
         tbl.add([session])
 
     try:
-        await enqueue_write(_write_op)
+        await enqueue_write(_write_op, key=session_id)
+        _cache_put(session_id, session.model_dump())
         return session_id
     except Exception as e:
         logger.error(f"Failed to create session: {e}")
@@ -50,6 +121,103 @@ def _session_identity_defaults() -> tuple[str, str]:
         return client_name, client_name
     return "mcp", "unknown"
 
+_PLACEHOLDER_API_KEY_IDS = frozenset({"", "unknown"})
+_PLACEHOLDER_SOURCE_LLMS = frozenset({"", "mcp", "unknown"})
+
+
+def _identity_updates(session: dict, inferred_source_llm: str, inferred_api_key_id: str) -> dict:
+    values: dict = {}
+    if inferred_api_key_id != "unknown":
+        cur_api_key = str(session.get("api_key_id") or "").strip().lower()
+        if cur_api_key in _PLACEHOLDER_API_KEY_IDS and cur_api_key != inferred_api_key_id:
+            values["api_key_id"] = inferred_api_key_id
+    if inferred_source_llm:
+        cur_source_llm = str(session.get("source_llm") or "").strip().lower()
+        if cur_source_llm in _PLACEHOLDER_SOURCE_LLMS and cur_source_llm != inferred_source_llm:
+            values["source_llm"] = inferred_source_llm
+    return values
+
+
+def _already_recorded(
+    session_id: str,
+    read_ids: List[str],
+    write_ids: List[str],
+    feedback_ids: List[str],
+    identity: tuple[str, str],
+) -> bool:
+    """True when the cached session already holds every id and needs no identity fix-up."""
+    session = _cache_get(session_id)
+    if session is None:
+        return False
+    for kind, ids in (("read", read_ids), ("write", write_ids), ("feedback", feedback_ids)):
+        if ids and not set(ids).issubset(session.get(ACTIVITY_COLUMNS[kind]) or ()):
+            return False
+    return not _identity_updates(session, *identity)
+
+# Activity updates for one session arriving within this window share a single
+# read-modify-write of the session row.
+SESSION_COALESCE_WINDOW_SECONDS = 0.05
+
+
+class SessionUpdateCoalescer:
+    """
+    Accumulates read/write/feedback ids per session_id and flushes them with one
+    call to ``flush`` after a short window. Every submitter awaits the same flush.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[str, List[str], List[str], List[str]], Awaitable[None]],
+        window_seconds: float = SESSION_COALESCE_WINDOW_SECONDS,
+    ):
+        self._flush = flush
+        self._window_seconds = window_seconds
+        self._pending: dict[str, dict] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        session_id: str,
+        read_ids: List[str],
+        write_ids: List[str],
+        feedback_ids: List[str],
+    ) -> None:
+        entry = self._pending.get(session_id)
+        if entry is None:
+            entry = {
+                "read": [],
+                "write": [],
+                "feedback": [],
+                "future": asyncio.get_running_loop().create_future(),
+            }
+            self._pending[session_id] = entry
+            task = asyncio.create_task(self._flush_later(session_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        entry["read"].extend(read_ids)
+        entry["write"].extend(write_ids)
+        entry["feedback"].extend(feedback_ids)
+        # Shield so one cancelled caller does not cancel the flush for the others.
+        await asyncio.shield(entry["future"])
+
+    async def _flush_later(self, session_id: str) -> None:
+        await asyncio.sleep(self._window_seconds)
+        entry = self._pending.pop(session_id, None)
+        if entry is None:
+            return
+        future = entry["future"]
+        try:
+            await self._flush(session_id, entry["read"], entry["write"], entry["feedback"])
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                # Mark retrieved: callers may all have been cancelled already.
+                future.exception()
+        else:
+            if not future.done():
+                future.set_result(None)
+
+
 async def update_session_activity(
     session_id: str, 
     read_ids: Optional[List[str]] = None,
@@ -58,35 +226,182 @@ async def update_session_activity(
 ):
     if not session_id:
         return
-
     read_ids = read_ids or []
     write_ids = write_ids or []
     feedback_ids = feedback_ids or []
+    # Keep-alive calls and repeat touches never reach LanceDB.
+    if not (read_ids or write_ids or feedback_ids):
+        return
+    if _already_recorded(session_id, read_ids, write_ids, feedback_ids, _session_identity_defaults()):
+        return
+
+    await _session_coalescer.submit(session_id, read_ids, write_ids, feedback_ids)
 
+
+def _merge_activity(row: dict, events: List[dict]) -> dict:
+    """Project journaled activity events onto a session row's id lists."""
+    merged = dict(row)
+    for kind, column in ACTIVITY_COLUMNS.items():
+        ids = [str(e.get("memory_id")) for e in events if e.get("kind") == kind and e.get("memory_id")]
+        if ids:
+            merged[column] = list(dict.fromkeys((merged.get(column) or []) + ids))
+        else:
+            merged[column] = list(merged.get(column) or [])
+    return merged
+
+
+def _load_session(db, session_id: str, columns: Optional[List[str]] = None) -> Optional[dict]:
+    query = _get_table(db, "sessions").search().where(_eq_filter("id", session_id))
+    if columns:
+        query = query.select(columns)
+    matches = query.limit(1).to_list()
+    if not matches:
+        return None
+    events: List[dict] = []
+    if SESSION_EVENTS_TABLE in db.table_names():
+        events = (
+            _get_table(db, SESSION_EVENTS_TABLE)
+            .search()
+            .where(_eq_filter("session_id", session_id))
+            .select(list(EVENT_COLUMNS))
+            .limit(SESSION_EVENTS_SCAN_LIMIT)
+            .to_list()
+        )
+    return _merge_activity(matches[0], events)
+
+
+def get_session(session_id: str) -> Optional[dict]:
+    """Return a session row with its journaled activity folded into the id lists."""
+    if not session_id:
+        return None
+    cached = _cache_get(session_id)
+    # The activity path caches projected rows; only serve complete ones here.
+    if cached is not None and cached.keys() >= Session.model_fields.keys():
+        return dict(cached)
+    session = _load_session(get_db(), session_id)
+    if session is not None:
+        _cache_put(session_id, session)
+    return session
+
+
+def _pending_events_by_session(db) -> dict[str, List[dict]]:
+    by_session: dict[str, List[dict]] = {}
+    if SESSION_EVENTS_TABLE not in db.table_names():
+        return by_session
+    events = (
+        db.open_table(SESSION_EVENTS_TABLE)
+        .search()
+        .select(["session_id", *EVENT_COLUMNS])
+        .limit(SESSION_EVENTS_SCAN_LIMIT)
+        .to_list()
+    )
+    for event in events:
+        by_session.setdefault(str(event.get("session_id") or ""), []).append(event)
+    return by_session
+
+
+def merge_session_activity_table(db, table: pa.Table) -> pa.Table:
+    """Bulk variant of get_session over an Arrow scan; only rows with pending events are rebuilt."""
+    if table.num_rows == 0:
+        return table
+    by_session = _pending_events_by_session(db)
+    if not by_session:
+        return table
+    touched = pc.fill_null(pc.is_in(table.column("id"), value_set=pa.array(list(by_session), pa.string())), False)
+    rows = table.filter(touched).to_pylist()
+    if not rows:
+        return table
+    merged = [_merge_activity(row, by_session.get(str(row.get("id") or ""), [])) for row in rows]
+    return pa.concat_tables([table.filter(pc.invert(touched)), pa.Table.from_pylist(merged, schema=table.schema)])
+
+
+def _cas_update_session(tbl, session_id: str, build_values: Callable[[dict], dict]) -> Optional[bool]:
+    """
+    Read-modify-write one session row under an optimistic ``version`` check.
+    ``build_values`` maps the fresh row to the columns to change. Returns None
+    when the row does not exist, False when every retry lost the race.
+    """
+    for _ in range(SESSION_CAS_RETRIES):
+        matches = (
+            tbl.search()
+            .where(_eq_filter("id", session_id))
+            .select(SESSION_ACTIVITY_PROJECTION + ["version"])
+            .limit(1)
+            .to_list()
+        )
+        if not matches:
+            return None
+        values = build_values(matches[0])
+        if not values:
+            return True
+        version = int(matches[0].get("version") or 0)
+        result = tbl.update(
+            where=f"{_eq_filter('id', session_id)} AND version = {version}",
+            values={**values, "version": version + 1},
+        )
+        # Older LanceDB releases return None here; treat that as applied.
+        if getattr(result, "rows_updated", 1):
+            return True
+    return False
+
+
+def compact_session_activity(db) -> int:
+    """
+    Fold journaled activity into the session rows and drop the folded events.
+    Runs from weekly maintenance so the journal stays small. Returns the number
+    of events folded.
+    """
+    if SESSION_EVENTS_TABLE not in db.table_names() or "sessions" not in db.table_names():
+        return 0
+    events_tbl = db.open_table(SESSION_EVENTS_TABLE)
+    events = events_tbl.search().limit(SESSION_EVENTS_SCAN_LIMIT).to_list()
+    if not events:
+        return 0
+    by_session: dict[str, List[dict]] = {}
+    for event in events:
+        by_session.setdefault(str(event.get("session_id") or ""), []).append(event)
+
+    sessions_tbl = db.open_table("sessions")
+    folded: List[dict] = []
+    for session_id, session_events in by_session.items():
+        def _fold(row: dict, session_events=session_events) -> dict:
+            merged = _merge_activity(row, session_events)
+            return {
+                column: merged[column]
+                for column in ACTIVITY_COLUMNS.values()
+                if len(merged[column]) != len(row.get(column) or [])
+            }
+
+        # Orphaned events (session already purged) are dropped along with the rest.
+        if _cas_update_session(sessions_tbl, session_id, _fold) is not False:
+            folded.extend(session_events)
+        else:
+            logger.warning(f"Session {session_id} kept changing during compaction; retrying next run")
+    event_ids = ["'" + str(e.get("id") or "").replace("'", "''") + "'" for e in folded]
+    for start in range(0, len(event_ids), SESSION_EVENTS_DELETE_BATCH):
+        batch = event_ids[start:start + SESSION_EVENTS_DELETE_BATCH]
+        events_tbl.delete(f"id IN ({', '.join(batch)})")
+    return len(folded)
+
+
+async def _apply_session_activity(
+    session_id: str,
+    read_ids: List[str],
+    write_ids: List[str],
+    feedback_ids: List[str],
+):
     db = get_db()
-    tbl = db.open_table("sessions")
-    
-    # Read-modify-write
-    escaped_session_id = _escape_sql(session_id)
-    matches = tbl.search().where(f"id = '{escaped_session_id}'").limit(1).to_list()
+    tbl = _get_table(db, "sessions")
     inferred_source_llm, inferred_api_key_id = _session_identity_defaults()
-    if not matches:
-        # Auto-create session if not found (lazy init)
-        # We don't have source_llm here easily unless passed. 
-        # But we can default it or try to fetch?
-        # Let's just create with "unknown" or passed param?
-        # We'll allow session_id to be created.
+
+    session = _cache_get(session_id)
+    if session is None:
+        session = _load_session(db, session_id, columns=SESSION_ACTIVITY_PROJECTION)
+    if session is None:
+        # Auto-create session if not found (lazy init), keeping the caller's id.
         logger.info(f"Session {session_id} not found, auto-creating.")
-        # We need source_llm. Maybe we should pass it to update_session_activity too?
-        # For now, "unknown" or "auto".
-        
-        # Calling start_session
-        # We need to await? start_session is async.
-        # But start_session generates new ID. We want to use specific ID.
-        # Let's extract creation logic or just insert here.
-        
         now = datetime.now(timezone.utc)
-        session = Session(
+        new_session = Session(
             id=session_id,
             api_key_id=inferred_api_key_id,
             source_llm=inferred_source_llm,
@@ -98,61 +413,79 @@ async def update_session_activity(
             memory_ids_feedback=[]
         )
         async def _write_create():
-            tbl.add([session])
+            tbl.add([new_session])
 
         try:
-             await enqueue_write(_write_create)
+             await enqueue_write(_write_create, key=session_id)
         except Exception:
              pass # Race condition?
-             
-        matches = [session.model_dump()]
-        
-    session = matches[0]
-    
-    # Merge lists
-    # Note: simple list concatenation. De-dup if needed.
-    new_read = list(set((session['memory_ids_read'] or []) + read_ids))
-    new_write = list(set((session['memory_ids_written'] or []) + write_ids))
-    new_feedback = list(set((session['memory_ids_feedback'] or []) + feedback_ids))
-    
-    # Create updated session object
-    # We need to construct Session model or dict.
-    # session is a dict from to_list().
-    
-    updated_session = session.copy()
-    updated_session['memory_ids_read'] = new_read
-    updated_session['memory_ids_written'] = new_write
-    updated_session['memory_ids_feedback'] = new_feedback
-    if str(updated_session.get("api_key_id") or "").strip().lower() in {"", "unknown"} and inferred_api_key_id != "unknown":
-        updated_session["api_key_id"] = inferred_api_key_id
-    if str(updated_session.get("source_llm") or "").strip().lower() in {"", "mcp", "unknown"} and inferred_source_llm:
-        updated_session["source_llm"] = inferred_source_llm
-    
-    # Verify types (list of str)
-    # LanceDB strict typing might need explicit conversion if they are not strings?
-    # They should be strings.
-    
-    async def _write_update():
-        tbl.delete(f"id = '{escaped_session_id}'")
-        tbl.add([updated_session])
+
+        session = new_session.model_dump()
+
+    # Identity fields are the only in-place row updates left on this path.
+    values = _identity_updates(session, inferred_source_llm, inferred_api_key_id)
+    if values:
+        async def _write_update():
+            return _cas_update_session(
+                tbl,
+                session_id,
+                lambda row: _identity_updates(row, inferred_source_llm, inferred_api_key_id),
+            )
+
+        try:
+            if await enqueue_write(_write_update, key=session_id) is False:
+                raise RuntimeError("concurrent updates kept winning the version check")
+            session = {**session, **values}
+        except Exception as e:
+            logger.error(f"Failed to update session {session_id}: {e}")
+
+    # Activity is journaled append-only: one row per newly touched id, no
+    # rewrite of the (growing) id lists. Lists are materialized on read.
+    now = datetime.now(timezone.utc)
+    events: List[dict] = []
+    session = dict(session)
+    for kind, ids in (("read", read_ids), ("write", write_ids), ("feedback", feedback_ids)):
+        column = ACTIVITY_COLUMNS[kind]
+        current = session.get(column) or []
+        known = set(current)
+        fresh = [memory_id for memory_id in dict.fromkeys(str(i) for i in ids if i) if memory_id not in known]
+        if not fresh:
+            continue
+        session[column] = list(current) + fresh
+        events.extend(
+            {
+                "id": str(uuid.uuid4()),
+                "session_id": session_id,
+                "kind": kind,
+                "memory_id": memory_id,
+                "created_at": now,
+            }
+            for memory_id in fresh
+        )
+    _cache_put(session_id, session)
+    if not events:
+        return
 
     try:
-        await enqueue_write(_write_update)
+        await enqueue_add(_get_table(db, SESSION_EVENTS_TABLE), events, key=session_id)
     except Exception as e:
-        logger.error(f"Failed to update session {session_id}: {e}")
+        _cache_evict(session_id)
+        logger.error(f"Failed to record activity for session {session_id}: {e}")
+
+_session_coalescer = SessionUpdateCoalescer(_apply_session_activity)
+
 
 async def end_session(session_id: str, reason: str = "unknown"):
     if not session_id:
         return
 
-    db = get_db()
-    tbl = db.open_table("sessions")
+    tbl = _get_sessions_tbl()
     now = datetime.now(timezone.utc)
-    escaped_session_id = _escape_sql(session_id)
-    
+    _cache_evict(session_id)
+
     async def _write_op():
         tbl.update(
-            where=f"id = '{escaped_session_id}'",
+            where=_eq_filter("id", session_id),
             values={
                 "ended_at": now,
                 "end_reason": reason
@@ -160,6 +493,6 @@ async def end_session(session_id: str, reason: str = "unknown"):
         )
 
     try:
-        await enqueue_write(_write_op)
+        await enqueue_write(_write_op, key=session_id)
     except Exception as e:
         logger.error(f"Failed to end session {session_id}: {e}")
@@ -1,29 +1,111 @@
 # backend/memory/write_queue.py
 import asyncio
-from collections.abc import Callable, Awaitable
+from collections.abc import Callable, Awaitable, Hashable
 from typing import Any
 
-_queue: asyncio.Queue = asyncio.Queue(maxsize=500)
-_worker_task: asyncio.Task | None = None
+# Writes sharing a key always land on the same queue, so they stay ordered while
+# unrelated keys drain in parallel. Unkeyed writes all go to shard 0 and keep
+# the original strictly-sequential behaviour among themselves.
+WRITE_QUEUE_SHARDS = 4
+WRITE_QUEUE_MAXSIZE = 500
+# Upper bound on writes a worker drains per wakeup; appends to the same table
+# within one drained batch are grouped into a single table.add() commit per table.
+WRITE_BATCH_MAX = 64
 
-async def enqueue_write(operation: Callable[[], Awaitable[Any]]) -> Any:
-    """Submit a write operation and await its result."""
-    future = asyncio.get_event_loop().create_future()
-    await _queue.put((operation, future))
+_queues: list[asyncio.Queue] = [asyncio.Queue(maxsize=WRITE_QUEUE_MAXSIZE) for _ in range(WRITE_QUEUE_SHARDS)]
+_worker_tasks: list[asyncio.Task] = []
+
+def _queue_for(key: Hashable | None) -> asyncio.Queue:
+    if key is None:
+        return _queues[0]
+    return _queues[hash(key) % len(_queues)]
+
+class _AppendRows:
+    """Append-only write that the worker can merge with neighbouring appends."""
+
+    __slots__ = ("table", "rows")
+
+    def __init__(self, table: Any, rows: list):
+        self.table = table
+        self.rows = rows
+
+    async def __call__(self) -> None:
+        self.table.add(self.rows)
+
+async def enqueue_write(operation: Callable[[], Awaitable[Any]], key: Hashable | None = None) -> Any:
+    """Submit a write operation and await its result. Writes with the same key run in order."""
+    future = asyncio.get_running_loop().create_future()
+    await _queue_for(key).put((operation, future))
     return await future
 
-async def _worker():
-    """Single worker that processes writes sequentially."""
-    while True:
-        operation, future = await _queue.get()
+async def enqueue_add(table: Any, rows: list, key: Hashable | None = None) -> None:
+    """Append rows to a LanceDB table; batched with other queued appends to that table."""
+    await enqueue_write(_AppendRows(table, list(rows)), key=key)
+
+def _drain(queue: asyncio.Queue, first: tuple) -> list[tuple]:
+    batch = [first]
+    while len(batch) < WRITE_BATCH_MAX:
         try:
-            result = await operation()
+            batch.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return batch
+
+def _settle(futures: list[asyncio.Future], result: Any = None, error: Exception | None = None) -> None:
+    for future in futures:
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
             future.set_result(result)
+
+def _table_key(table: Any) -> Any:
+    name = getattr(table, "name", None)
+    return name if name is not None else id(table)
+
+async def _run_appends(run: list[tuple]) -> None:
+    # A run of appends only ever adds rows, so grouping it by table (even when
+    # interleaved) cannot reorder a write against a delete/update.
+    groups: dict[Any, tuple[Any, list, list[asyncio.Future]]] = {}
+    for operation, future in run:
+        group = groups.setdefault(_table_key(operation.table), (operation.table, [], []))
+        group[1].extend(operation.rows)
+        group[2].append(future)
+    for table, rows, futures in groups.values():
+        try:
+            await _AppendRows(table, rows)()
+            _settle(futures)
         except Exception as e:
-            future.set_exception(e)
+            _settle(futures, error=e)
+
+async def _run_batch(batch: list[tuple]) -> None:
+    i = 0
+    while i < len(batch):
+        operation, future = batch[i]
+        if isinstance(operation, _AppendRows):
+            j = i + 1
+            while j < len(batch) and isinstance(batch[j][0], _AppendRows):
+                j += 1
+            await _run_appends(batch[i:j])
+            i = j
+            continue
+        try:
+            _settle([future], result=await operation())
+        except Exception as e:
+            _settle([future], error=e)
+        i += 1
+
+async def _worker(queue: asyncio.Queue):
+    """Worker that processes one shard's writes sequentially, a drained batch at a time."""
+    while True:
+        batch = _drain(queue, await queue.get())
+        try:
+            await _run_batch(batch)
         finally:
-            _queue.task_done()
+            for _ in batch:
+                queue.task_done()
 
 async def start_write_worker():
-    global _worker_task
-    _worker_task = asyncio.create_task(_worker())
+    global _worker_tasks
+    _worker_tasks = [asyncio.create_task(_worker(queue)) for queue in _queues]
@@ -43,12 +43,20 @@ def _read_version() -> int:
 def _write_version(v: int):
     path = _get_schema_file()
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
+    # Write-then-rename so a crash never leaves a truncated file (which would
+    # read back as v0 and re-run every migration).
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
         f.write(str(v))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 def run_migrations(db):
     """Run any pending migrations in order."""
+    from backend.database.client import bump_schema_generation
+
     current_version = _read_version()
     pending = sorted(v for v in MIGRATIONS if v > current_version)
 
@@ -61,6 +69,7 @@ def run_migrations(db):
         try:
             logger.info(f"Applying migration v{version}...")
             MIGRATIONS[version](db)
+            bump_schema_generation()
             _write_version(version)
             logger.info(f"Migration v{version} applied successfully")
         except Exception as e:
@@ -82,17 +91,8 @@ def add_confidence_score_column(db):
     """v2: Add confidence_score to memories if missing (for upgrades from pre-v2)."""
     if "memories" not in db.table_names():
         return
-    tbl = db.open_table("memories")
-    # LanceDB supports adding columns via alter_table in newer versions.
     # If the column already exists (new installs), this is a no-op.
-    try:
-        sample = tbl.search().limit(1).to_list()
-        if sample and "confidence_score" not in sample[0]:
-            # Add the column with default value 0.7
-            tbl.add_column("confidence_score", "FLOAT", default=0.7)
-            logger.info("Added confidence_score column to memories")
-    except Exception as e:
-        logger.warning(f"confidence_score migration: {e} (may already exist)")
+    _safe_add_column(db.open_table("memories"), "confidence_score", "FLOAT", 0.7)
 
 
 @migration(3)
@@ -100,14 +100,7 @@ def add_privacy_field(db):
     """v3: Ensure privacy field exists on memories (default: public)."""
     if "memories" not in db.table_names():
         return
-    try:
-        tbl = db.open_table("memories")
-        sample = tbl.search().limit(1).to_list()
-        if sample and "privacy" not in sample[0]:
-            tbl.add_column("privacy", "VARCHAR", default="public")
-            logger.info("Added privacy column to memories")
-    except Exception as e:
-        logger.warning(f"privacy migration: {e} (may already exist)")
+    _safe_add_column(db.open_table("memories"), "privacy", "VARCHAR", "public")
 
 
 def _safe_add_column(tbl, name: str, dtype: str, default):
@@ -240,6 +233,190 @@ def _safe_vector(value, dim: int) -> list[float]:
     return [0.0] * dim
 
 
+# Legacy memories columns and the defaults applied when they are missing/falsy,
+# mirroring the `value or default` coercions of the original row-by-row rewrite.
+_LEGACY_STR_DEFAULTS = {
+    "workspace_id": "default",
+    "user_id": "local",
+    "content": "",
+    "level": "semantic",
+    "category": "preferences",
+    "privacy": "public",
+    "source_llm": "legacy",
+    "status": "active",
+    "decay_profile": "stable",
+    "suggestion_reason": "",
+    "review_note": "",
+}
+_LEGACY_OPTIONAL_STR = ("source_conversation_id", "source_message_id", "source_excerpt")
+_LEGACY_NUM_DEFAULTS = {
+    "importance_score": 0.5,
+    "confidence_score": 0.7,
+    "version": 1,
+    "reference_count": 0,
+}
+_LEGACY_REQUIRED_TS = ("created_at", "updated_at", "last_referenced_at")
+_LEGACY_OPTIONAL_TS = ("expires_at", "review_due_at", "event_date")
+LEGACY_REPAIR_BATCH_ROWS = 8192
+
+
+def _stream_batches(tbl):
+    """Scan a whole table as Arrow record batches without materializing it."""
+    return tbl.search().limit(None).to_batches(LEGACY_REPAIR_BATCH_ROWS)
+
+
+def _legacy_column(batch, name: str):
+    idx = batch.schema.get_field_index(name)
+    return batch.column(idx) if idx >= 0 else None
+
+
+def _legacy_str(col, n: int, default, nullable: bool):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if col is None:
+        return pa.nulls(n, pa.string()) if nullable else pc.fill_null(pa.nulls(n, pa.string()), default)
+    try:
+        col = pc.cast(col, pa.string())
+    except Exception:
+        col = pa.array([None if v is None else str(v) for v in col.to_pylist()], pa.string())
+    empty = pc.fill_null(pc.equal(col, ""), True)
+    if nullable:
+        return pc.if_else(empty, pa.scalar(None, pa.string()), col)
+    return pc.if_else(empty, pa.scalar(default, pa.string()), col)
+
+
+def _legacy_num(col, n: int, dtype, default):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if col is None:
+        return pc.fill_null(pa.nulls(n, dtype), default)
+    try:
+        col = pc.cast(col, dtype)
+    except Exception:
+        col = pa.array([_legacy_num_value(v, dtype) for v in col.to_pylist()], dtype)
+    falsy = pc.fill_null(pc.equal(col, 0), True)
+    return pc.if_else(falsy, pa.scalar(default, dtype), col)
+
+
+def _legacy_num_value(value, dtype):
+    import pyarrow as pa
+
+    try:
+        return int(value) if pa.types.is_integer(dtype) else float(value)
+    except Exception:
+        return None
+
+
+def _legacy_bool(col, n: int):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if col is None:
+        return pc.fill_null(pa.nulls(n, pa.bool_()), False)
+    try:
+        return pc.fill_null(pc.cast(col, pa.bool_()), False)
+    except Exception:
+        return pa.array([bool(v) for v in col.to_pylist()], pa.bool_())
+
+
+def _legacy_ts(col, n: int, now: datetime, required: bool):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    naive = pa.timestamp("us")
+    if col is None:
+        out = pa.nulls(n, naive)
+    elif pa.types.is_timestamp(col.type):
+        # Naive legacy timestamps are already UTC; aware ones cast to UTC wall time.
+        out = pc.cast(col, naive)
+    else:
+        values = [_to_dt(v) if v else None for v in col.to_pylist()]
+        out = pc.cast(pa.array(values, pa.timestamp("us", tz="UTC")), naive)
+    if required:
+        out = pc.fill_null(out, pa.scalar(now.replace(tzinfo=None), naive))
+    return out
+
+
+def _legacy_ids(col, n: int):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    ids = _legacy_str(col, n, None, nullable=True)
+    missing = pc.is_null(ids)
+    count = pc.sum(missing).as_py() or 0
+    if not count:
+        return ids
+    fresh = pa.array([str(uuid.uuid4()) for _ in range(count)], pa.string())
+    return pc.replace_with_mask(ids, missing, fresh)
+
+
+def _legacy_tags(col, n: int):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    dtype = pa.list_(pa.string())
+    empty = pa.scalar([], dtype)
+    if col is None or not (pa.types.is_list(col.type) or pa.types.is_large_list(col.type) or pa.types.is_fixed_size_list(col.type)):
+        return pc.fill_null(pa.nulls(n, dtype), empty)
+    try:
+        return pc.fill_null(pc.cast(col, dtype), empty)
+    except Exception:
+        return pa.array([v if isinstance(v, list) else [] for v in col.to_pylist()], dtype)
+
+
+def _legacy_vectors(col, n: int, dim: int):
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    zeros = pa.FixedSizeListArray.from_arrays(pa.array(np.zeros(n * dim, dtype=np.float32)), dim)
+    if col is None or not (pa.types.is_list(col.type) or pa.types.is_large_list(col.type) or pa.types.is_fixed_size_list(col.type)):
+        return zeros
+    try:
+        ok = pc.fill_null(pc.equal(pc.list_value_length(col), dim), False)
+        as_list = pc.cast(col, pa.list_(pa.float32()))
+        kept = pc.if_else(ok, as_list, pc.cast(zeros, pa.list_(pa.float32())))
+        flat = pc.fill_null(pc.list_flatten(kept), 0.0)
+        return pa.FixedSizeListArray.from_arrays(flat, dim)
+    except Exception:
+        vectors = [_safe_vector(v, dim) for v in col.to_pylist()]
+        return pa.FixedSizeListArray.from_arrays(pa.array(np.asarray(vectors, dtype=np.float32).reshape(-1)), dim)
+
+
+def _normalize_legacy_memories(batch, schema, dim: int, now: datetime):
+    """Coerce one Arrow batch of legacy memory rows to the current Memory schema, column-wise."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    n = batch.num_rows
+    columns = []
+    for field in schema:
+        name = field.name
+        col = _legacy_column(batch, name)
+        if name == "id":
+            out = _legacy_ids(col, n)
+        elif name in _LEGACY_STR_DEFAULTS:
+            out = _legacy_str(col, n, _LEGACY_STR_DEFAULTS[name], nullable=False)
+        elif name in _LEGACY_OPTIONAL_STR:
+            out = _legacy_str(col, n, None, nullable=True)
+        elif name in _LEGACY_NUM_DEFAULTS:
+            out = _legacy_num(col, n, field.type, _LEGACY_NUM_DEFAULTS[name])
+        elif name in _LEGACY_REQUIRED_TS or name in _LEGACY_OPTIONAL_TS:
+            out = _legacy_ts(col, n, now, required=name in _LEGACY_REQUIRED_TS)
+        elif name == "needs_review":
+            out = _legacy_bool(col, n)
+        elif name == "tags":
+            out = _legacy_tags(col, n)
+        elif name == "vector":
+            out = _legacy_vectors(col, n, dim)
+        else:
+            out = pa.nulls(n, field.type)
+        columns.append(out)
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
 @migration(7)
 def repair_legacy_memories_schema(db):
     """
@@ -260,68 +437,50 @@ def repair_legacy_memories_schema(db):
         return
 
     logger.warning(f"Legacy memories schema detected, missing fields: {', '.join(missing)}")
-    rows = tbl.search().limit(2_000_000).to_list()
     old_schema = tbl.schema
 
     from backend.database.schema import Memory, EMBEDDING_DIM
 
+    if tbl.count_rows() == 0:
+        # Nothing to carry over: recreate with the current schema, no backup.
+        db.drop_table("memories", ignore_missing=True)
+        db.create_table("memories", schema=Memory)
+        logger.info("Memories schema repair completed. rows=0")
+        return
+
     backup_name = f"memories_legacy_backup_v7_{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:6]}"
     backup_created = False
+    legacy = None
 
     try:
-        # LanceDB OSS does not support rename_table; create a backup table explicitly.
-        if rows:
-            db.create_table(backup_name, data=rows)
-        else:
-            db.create_table(backup_name, schema=old_schema)
+        # LanceDB OSS does not support rename_table; copy into a backup table
+        # batch by batch so the rebuild below can stream from it.
+        backup_tbl = db.create_table(backup_name, schema=old_schema)
+        for batch in _stream_batches(tbl):
+            if batch.num_rows:
+                backup_tbl.add(batch)
         backup_created = True
     except Exception as e:
         logger.warning(f"Could not create backup table before schema repair: {e}")
+        # Without a backup the source is about to be dropped, so hold it in memory.
+        legacy = tbl.to_arrow()
+
+    def _source_batches():
+        if backup_created:
+            return _stream_batches(db.open_table(backup_name))
+        return legacy.to_batches(max_chunksize=LEGACY_REPAIR_BATCH_ROWS)
 
     try:
         db.drop_table("memories", ignore_missing=True)
         new_tbl = db.create_table("memories", schema=Memory)
 
-        batch: list[dict] = []
+        target_schema = Memory.to_arrow_schema()
+        now = datetime.now(timezone.utc)
         inserted = 0
-        for row in rows:
-            now = datetime.now(timezone.utc)
-            normalized = {
-                "id": str(row.get("id") or uuid.uuid4()),
-                "content": str(row.get("content") or ""),
-                "level": str(row.get("level") or "semantic"),
-                "category": str(row.get("category") or "preferences"),
-                "importance_score": float(row.get("importance_score") or 0.5),
-                "confidence_score": float(row.get("confidence_score") or 0.7),
-                "privacy": str(row.get("privacy") or "public"),
-                "tags": row.get("tags") if isinstance(row.get("tags"), list) else [],
-                "source_llm": str(row.get("source_llm") or "legacy"),
-                "source_conversation_id": str(row.get("source_conversation_id")) if row.get("source_conversation_id") else None,
-                "source_message_id": str(row.get("source_message_id")) if row.get("source_message_id") else None,
-                "source_excerpt": str(row.get("source_excerpt")) if row.get("source_excerpt") else None,
-                "version": int(row.get("version") or 1),
-                "status": str(row.get("status") or "active"),
-                "created_at": _to_dt(row.get("created_at") or now),
-                "updated_at": _to_dt(row.get("updated_at") or now),
-                "last_referenced_at": _to_dt(row.get("last_referenced_at") or now),
-                "reference_count": int(row.get("reference_count") or 0),
-                "decay_profile": str(row.get("decay_profile") or "stable"),
-                "expires_at": _to_dt(row.get("expires_at")) if row.get("expires_at") else None,
-                "needs_review": bool(row.get("needs_review") or False),
-                "review_due_at": _to_dt(row.get("review_due_at")) if row.get("review_due_at") else None,
-                "event_date": _to_dt(row.get("event_date")) if row.get("event_date") else None,
-                "suggestion_reason": str(row.get("suggestion_reason") or ""),
-                "review_note": str(row.get("review_note") or ""),
-                "vector": _safe_vector(row.get("vector"), EMBEDDING_DIM),
-            }
-            batch.append(normalized)
-            if len(batch) >= 1000:
-                new_tbl.add(batch)
-                inserted += len(batch)
-                batch = []
-        if batch:
-            new_tbl.add(batch)
-            inserted += len(batch)
+        for batch in _source_batches():
+            if batch.num_rows:
+                new_tbl.add(_normalize_legacy_memories(batch, target_schema, EMBEDDING_DIM, now))
+                inserted += batch.num_rows
 
         if backup_created:
             logger.info(f"Memories schema repair completed. rows={inserted}, backup_table={backup_name}")
@@ -334,12 +493,12 @@ def repair_legacy_memories_schema(db):
         except Exception:
             pass
         try:
-            if backup_created and backup_name in db.table_names():
-                backup_rows = db.open_table(backup_name).search().limit(2_000_000).to_list()
-                if backup_rows:
-                    db.create_table("memories", data=backup_rows)
-                else:
-                    db.create_table("memories", schema=old_schema)
+            if backup_created and backup_name not in db.table_names():
+                raise RuntimeError(f"backup table {backup_name} is missing")
+            restored = db.create_table("memories", schema=old_schema)
+            for batch in _source_batches():
+                if batch.num_rows:
+                    restored.add(batch)
         except Exception:
             pass
         raise
@@ -396,3 +555,19 @@ def add_client_runtime_metrics_table(db):
     from backend.database.schema import ClientRuntimeMetric
 
     _safe_create_table(db, "client_runtime_metrics", ClientRuntimeMetric)
+
+
+@migration(14)
+def add_session_activity_events_table(db):
+    """v14: Journal session memory activity append-only instead of rewriting session rows."""
+    from backend.database.schema import SessionActivityEvent
+
+    _safe_create_table(db, "session_activity_events", SessionActivityEvent)
+
+
+@migration(15)
+def add_session_version_column(db):
+    """v15: Version sessions for optimistic read-modify-write."""
+    if "sessions" not in db.table_names():
+        return
+    _safe_add_column(db.open_table("sessions"), "version", "BIGINT", 0)
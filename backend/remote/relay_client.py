@@ -1,9 +1,11 @@
 import asyncio
 import hashlib
 import hmac
+import inspect
 import json
 import secrets
 import time
+from collections import deque
 from datetime import datetime, timezone
 from threading import RLock
 from typing import Any, Awaitable, Callable
@@ -12,6 +14,22 @@ import uuid
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack wire format falls back to JSON
+    msgpack = None
+
+try:
+    import h2  # noqa: F401 - only needed so httpx can negotiate HTTP/2
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - falls back to pooled HTTP/1.1
+    _HTTP2_AVAILABLE = False
+
 from backend.config import load_config, save_config
 from backend.mcp_server import conversation_sync, memory_bootstrap, memory_write
 from backend.utils.context import session_id_ctx, mcp_client_name_ctx, mcp_client_scopes_ctx
@@ -19,6 +37,17 @@ from backend.utils.context import session_id_ctx, mcp_client_name_ctx, mcp_clien
 _REGISTER_PATH = "/api/v1/relay/register"
 _POLL_PATH = "/api/v1/relay/poll"
 _REPORT_PATH = "/api/v1/relay/report"
+# Registration is refreshed at most this often while the signing identity and device name stay the same.
+_REGISTER_INTERVAL_SECONDS = 600
+# Finished task results are reported in chunks of this size while later tasks still run.
+_REPORT_BATCH_SIZE = 8
+
+# Request signing schemes the relay can dispatch on via X-Mnesis-Alg.
+# "b2b-256" is keyed BLAKE2b (no HMAC wrapper); HMAC-SHA256 stays the default.
+_SIGNATURE_ALGS = ("hmac-sha256", "b2b-256")
+# Body encodings for relay requests; JSON stays the default for older relays.
+_WIRE_FORMATS = ("json", "msgpack")
+_MSGPACK_CONTENT_TYPE = "application/msgpack"
 
 _TASK_HANDLERS: dict[str, Callable[..., Awaitable[Any]]] = {
     "memory_bootstrap": memory_bootstrap,
@@ -26,6 +55,12 @@ _TASK_HANDLERS: dict[str, Callable[..., Awaitable[Any]]] = {
     "conversation_sync": conversation_sync,
 }
 
+# Immutable, so it can be shared by every payload and status response.
+_TASK_HANDLER_NAMES: tuple[str, ...] = tuple(sorted(_TASK_HANDLERS.keys()))
+_TASK_HANDLER_NAMES_CSV = ", ".join(_TASK_HANDLER_NAMES)
+
+_LAST_RESULTS_MAX = 8
+
 _runtime_lock = RLock()
 _runtime: dict[str, Any] = {
     "worker_alive": False,
@@ -42,11 +77,16 @@ _runtime: dict[str, Any] = {
     "tasks_received": 0,
     "tasks_succeeded": 0,
     "tasks_failed": 0,
-    "last_results": [],
+    # Newest first; the bound drops the oldest entry on appendleft.
+    "last_results": deque(maxlen=_LAST_RESULTS_MAX),
 }
 
 _worker_task: asyncio.Task | None = None
+# One pooled client for the worker's lifetime, so polls reuse the TLS connection.
+_http_client: httpx.AsyncClient | None = None
 _stop_event: asyncio.Event | None = None
+# (identity, monotonic time) of the last accepted registration; None forces the next poll to register.
+_last_registration: tuple[tuple, float] | None = None
 _poll_now_event: asyncio.Event | None = None
 
 
@@ -79,9 +119,22 @@ def _normalize_remote_cfg(raw: dict | None) -> dict:
         "poll_interval_seconds": _clamp_int(source.get("poll_interval_seconds"), 12, 5, 300),
         "request_timeout_seconds": _clamp_int(source.get("request_timeout_seconds"), 20, 5, 120),
         "max_tasks_per_poll": _clamp_int(source.get("max_tasks_per_poll"), 4, 1, 40),
+        "max_task_concurrency": _clamp_int(source.get("max_task_concurrency"), 4, 1, 16),
+        "signature_alg": _normalize_signature_alg(source.get("signature_alg")),
+        "wire_format": _normalize_wire_format(source.get("wire_format")),
     }
 
 
+def _normalize_signature_alg(value: Any) -> str:
+    alg = str(value or "").strip().lower()
+    return alg if alg in _SIGNATURE_ALGS else _SIGNATURE_ALGS[0]
+
+
+def _normalize_wire_format(value: Any) -> str:
+    fmt = str(value or "").strip().lower()
+    return fmt if fmt in _WIRE_FORMATS else _WIRE_FORMATS[0]
+
+
 def _is_ready_for_remote(remote_cfg: dict) -> bool:
     return bool(
         remote_cfg.get("enabled")
@@ -103,6 +156,9 @@ def _public_remote_config(remote_cfg: dict) -> dict:
         "poll_interval_seconds": _clamp_int(remote_cfg.get("poll_interval_seconds"), 12, 5, 300),
         "request_timeout_seconds": _clamp_int(remote_cfg.get("request_timeout_seconds"), 20, 5, 120),
         "max_tasks_per_poll": _clamp_int(remote_cfg.get("max_tasks_per_poll"), 4, 1, 40),
+        "max_task_concurrency": _clamp_int(remote_cfg.get("max_task_concurrency"), 4, 1, 16),
+        "signature_alg": _normalize_signature_alg(remote_cfg.get("signature_alg")),
+        "wire_format": _normalize_wire_format(remote_cfg.get("wire_format")),
     }
 
 
@@ -111,50 +167,150 @@ def _set_runtime(**patch: Any):
         _runtime.update(patch)
 
 
-def _append_result(entry: dict):
+def _incr_runtime(deltas: dict[str, int], **patch: Any):
+    """Add to runtime counters (and apply any plain fields) under one lock, without a snapshot."""
     with _runtime_lock:
-        rows = list(_runtime.get("last_results", []) or [])
-        rows.insert(0, entry)
-        _runtime["last_results"] = rows[:8]
+        for key, by in deltas.items():
+            _runtime[key] = int(_runtime.get(key, 0) or 0) + int(by)
+        _runtime.update(patch)
+
+
+def _commit_poll_runtime(deltas: dict[str, int], results: list[dict], patch: dict[str, Any]):
+    """Apply everything one poll recorded (counters, recent results, fields) under a single lock."""
+    with _runtime_lock:
+        for key, by in deltas.items():
+            _runtime[key] = int(_runtime.get(key, 0) or 0) + int(by)
+        last_results = _runtime["last_results"]
+        for entry in results:
+            last_results.appendleft(entry)
+        _runtime.update(patch)
 
 
 def _snapshot_runtime() -> dict:
     with _runtime_lock:
-        return dict(_runtime)
+        snapshot = dict(_runtime)
+        snapshot["last_results"] = list(_runtime["last_results"])
+        return snapshot
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except Exception:
+            pass
+    return json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _encode_body(remote_cfg: dict, payload: Any) -> tuple[bytes, str]:
+    if msgpack is not None and remote_cfg.get("wire_format") == "msgpack":
+        return msgpack.packb(payload, use_bin_type=True, default=str), _MSGPACK_CONTENT_TYPE
+    return _json_dumps(payload), "application/json"
+
+
+def _decode_response(res: httpx.Response) -> Any:
+    if not res.content:
+        return {}
+    content_type = str(res.headers.get("content-type") or "").split(";", 1)[0].strip().lower()
+    if msgpack is not None and content_type == _MSGPACK_CONTENT_TYPE:
+        return msgpack.unpackb(res.content, raw=False)
+    if orjson is not None:
+        # Parses the body bytes directly, skipping httpx's str decode.
+        return orjson.loads(res.content)
+    return res.json()
 
 
 def _json_serialize(value: Any) -> Any:
     try:
+        if orjson is not None:
+            return orjson.loads(_json_dumps(value))
         return json.loads(json.dumps(value, default=str))
     except Exception:
         return {"value": str(value)}
 
 
-def _signed_headers(*, remote_cfg: dict, body_bytes: bytes) -> dict[str, str]:
-    timestamp = str(int(time.time()))
-    nonce = uuid.uuid4().hex
-    payload_hash = hashlib.sha256(body_bytes).hexdigest()
-    signed = f"{timestamp}.{nonce}.{payload_hash}"
-    signature = hmac.new(
-        str(remote_cfg.get("device_secret") or "").encode("utf-8"),
-        signed.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-    return {
-        "Content-Type": "application/json",
-        "X-Mnesis-Project-Id": str(remote_cfg.get("project_id") or ""),
-        "X-Mnesis-Device-Id": str(remote_cfg.get("device_id") or ""),
-        "X-Mnesis-Timestamp": timestamp,
-        "X-Mnesis-Nonce": nonce,
-        "X-Mnesis-Signature": signature,
-    }
+def _secret_bytes(remote_cfg: dict) -> bytes:
+    return str(remote_cfg.get("device_secret") or "").encode("utf-8")
 
 
-async def _post_signed(client: httpx.AsyncClient, remote_cfg: dict, path: str, payload: dict) -> httpx.Response:
-    url = urljoin(f"{str(remote_cfg.get('relay_url') or '').rstrip('/')}/", path.lstrip("/"))
-    body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
-    headers = _signed_headers(remote_cfg=remote_cfg, body_bytes=body)
-    return await client.post(url, content=body, headers=headers)
+class _RequestSigner:
+    """Signing state reused across polls: MAC key, algorithm, relay base URL and static headers."""
+
+    __slots__ = ("alg", "key", "base_url", "headers", "source")
+
+    @staticmethod
+    def inputs(remote_cfg: dict) -> tuple:
+        return tuple(
+            remote_cfg.get(name)
+            for name in ("device_secret", "signature_alg", "relay_url", "project_id", "device_id")
+        )
+
+    def __init__(self, remote_cfg: dict):
+        # The config values this signer was built from, so callers can reuse it until they change.
+        self.source = self.inputs(remote_cfg)
+        self.alg = _normalize_signature_alg(remote_cfg.get("signature_alg"))
+        key = _secret_bytes(remote_cfg)
+        # BLAKE2b keys must be at most 64 bytes; longer secrets are pre-hashed.
+        if self.alg == "b2b-256" and len(key) > 64:
+            key = hashlib.blake2b(key).digest()
+        self.key = key
+        self.base_url = f"{str(remote_cfg.get('relay_url') or '').rstrip('/')}/"
+        self.headers = {
+            "X-Mnesis-Project-Id": str(remote_cfg.get("project_id") or ""),
+            "X-Mnesis-Device-Id": str(remote_cfg.get("device_id") or ""),
+            "X-Mnesis-Alg": self.alg,
+        }
+
+    def sign(
+        self,
+        body_bytes: bytes,
+        content_type: str = "application/json",
+        timestamp: str | None = None,
+    ) -> dict[str, str]:
+        if timestamp is None:
+            timestamp = str(time.time_ns() // 1_000_000_000)
+        nonce = secrets.token_hex(16)
+        # timestamp, nonce and payload hash are all ASCII, so the signed string encodes as such.
+        if self.alg == "b2b-256":
+            payload_hash = hashlib.blake2b(body_bytes, digest_size=32).hexdigest()
+            signed = f"{timestamp}.{nonce}.{payload_hash}"
+            signature = hashlib.blake2b(signed.encode("ascii"), key=self.key, digest_size=32).hexdigest()
+        else:
+            payload_hash = hashlib.sha256(body_bytes).hexdigest()
+            signed = f"{timestamp}.{nonce}.{payload_hash}"
+            # One-shot hmac.digest goes straight to OpenSSL's HMAC (SHA-NI where available).
+            signature = hmac.digest(self.key, signed.encode("ascii"), "sha256").hex()
+        headers = self.headers.copy()
+        headers["Content-Type"] = content_type
+        headers["X-Mnesis-Timestamp"] = timestamp
+        headers["X-Mnesis-Nonce"] = nonce
+        headers["X-Mnesis-Signature"] = signature
+        return headers
+
+
+def _signed_headers(
+    *,
+    remote_cfg: dict,
+    body_bytes: bytes,
+    content_type: str = "application/json",
+    timestamp: str | None = None,
+) -> dict[str, str]:
+    return _RequestSigner(remote_cfg).sign(body_bytes, content_type=content_type, timestamp=timestamp)
+
+
+async def _post_signed(
+    client: httpx.AsyncClient,
+    remote_cfg: dict,
+    path: str,
+    payload: dict,
+    signer: _RequestSigner | None = None,
+) -> httpx.Response:
+    if signer is None:
+        signer = _RequestSigner(remote_cfg)
+    url = urljoin(signer.base_url, path.lstrip("/"))
+    # The signature covers the raw body bytes, whichever wire format produced them.
+    body, content_type = _encode_body(remote_cfg, payload)
+    return await client.post(url, content=body, headers=signer.sign(body, content_type=content_type))
 
 
 def _resolve_task_handler(tool_name: str) -> Callable[..., Awaitable[Any]] | None:
@@ -165,17 +321,29 @@ def _resolve_task_handler(tool_name: str) -> Callable[..., Awaitable[Any]] | Non
     return _TASK_HANDLERS.get(alias)
 
 
+def _handler_params(handler: Callable[..., Awaitable[Any]]) -> frozenset[str] | None:
+    try:
+        return frozenset(inspect.signature(handler).parameters)
+    except Exception:
+        return None
+
+
+# Handlers are fixed at import, so their accepted kwargs are resolved once here.
+_TASK_HANDLER_PARAMS: dict[Callable[..., Awaitable[Any]], frozenset[str] | None] = {
+    handler: _handler_params(handler) for handler in _TASK_HANDLERS.values()
+}
+
+
 def _tool_args_for_handler(handler: Callable[..., Awaitable[Any]], raw_args: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(raw_args, dict):
         return {}
-    # Avoid hard import at module level; inspect only when needed.
-    import inspect
-
-    try:
-        sig = inspect.signature(handler)
-    except Exception:
-        return dict(raw_args)
-    allowed = set(sig.parameters.keys())
+    allowed = _TASK_HANDLER_PARAMS.get(handler)
+    if allowed is None:
+        if handler in _TASK_HANDLER_PARAMS:
+            return dict(raw_args)
+        allowed = _handler_params(handler)
+        if allowed is None:
+            return dict(raw_args)
     return {k: v for k, v in raw_args.items() if k in allowed}
 
 
@@ -188,7 +356,7 @@ async def _execute_task(remote_cfg: dict, task: dict[str, Any]) -> dict:
             "task_id": task_id,
             "tool": tool,
             "ok": False,
-            "error": f"Unsupported tool '{tool}'. Allowed: {', '.join(sorted(_TASK_HANDLERS.keys()))}",
+            "error": f"Unsupported tool '{tool}'. Allowed: {_TASK_HANDLER_NAMES_CSV}",
         }
 
     raw_args = task.get("args")
@@ -200,7 +368,7 @@ async def _execute_task(remote_cfg: dict, task: dict[str, Any]) -> dict:
         raw_args = {}
     args = _tool_args_for_handler(handler, raw_args)
 
-    session_id = str(task.get("session_id") or f"relay:{uuid.uuid4().hex}")
+    session_id = str(task.get("session_id") or f"relay:{secrets.token_hex(16)}")
     client_name = f"relay:{str(remote_cfg.get('project_id') or 'project')}"
     scopes = ["read", "write", "sync"]
     sid_token = session_id_ctx.set(session_id)
@@ -227,102 +395,175 @@ async def _execute_task(remote_cfg: dict, task: dict[str, Any]) -> dict:
         mcp_client_scopes_ctx.reset(scopes_token)
 
 
-async def _register_device_if_supported(client: httpx.AsyncClient, remote_cfg: dict):
+async def _register_device_if_supported(
+    client: httpx.AsyncClient,
+    remote_cfg: dict,
+    runtime_patch: dict[str, Any],
+    signer: _RequestSigner | None = None,
+):
+    global _last_registration
+    if signer is None:
+        signer = _RequestSigner(remote_cfg)
+    identity = (signer.source, remote_cfg["device_name"])
+    now = time.monotonic()
+    last = _last_registration
+    if last is not None and last[0] == identity and now - last[1] < _REGISTER_INTERVAL_SECONDS:
+        return
+
     payload = {
         "project_id": remote_cfg["project_id"],
         "device_id": remote_cfg["device_id"],
         "device_name": remote_cfg["device_name"],
-        "capabilities": sorted(_TASK_HANDLERS.keys()),
+        "capabilities": _TASK_HANDLER_NAMES,
         "transport": "long-poll",
         "client_version": "mnesis-desktop",
     }
-    res = await _post_signed(client, remote_cfg, _REGISTER_PATH, payload)
-    _set_runtime(last_http_status=int(res.status_code))
+    res = await _post_signed(client, remote_cfg, _REGISTER_PATH, payload, signer)
+    runtime_patch["last_http_status"] = int(res.status_code)
     if res.status_code in {200, 201, 202, 204, 404}:
         if res.status_code != 404:
-            _set_runtime(registered_at=_utc_now_iso())
+            runtime_patch["registered_at"] = _utc_now_iso()
+        _last_registration = (identity, now)
         return
     raise RuntimeError(f"Relay register failed ({res.status_code})")
 
 
-async def _poll_once(remote_cfg: dict) -> int:
+def _build_http_client(remote_cfg: dict) -> httpx.AsyncClient:
     timeout = max(5, int(remote_cfg["request_timeout_seconds"]))
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        await _register_device_if_supported(client, remote_cfg)
+    # The relay URL comes from config, so skip the per-request proxy/netrc environment lookup.
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=_HTTP2_AVAILABLE,
+        trust_env=False,
+        limits=httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=60.0),
+    )
+
 
-        payload = {
+async def _close_http_client():
+    global _http_client
+    client = _http_client
+    _http_client = None
+    if client is not None:
+        try:
+            await client.aclose()
+        except Exception:
+            pass
+
+
+async def _poll_once(
+    remote_cfg: dict,
+    client: httpx.AsyncClient,
+    signer: _RequestSigner | None = None,
+) -> int:
+    # Runtime updates are collected locally and committed under one lock at the end
+    # (or when the poll raises), instead of locking per counter and per task result.
+    deltas = {"tasks_received": 0, "tasks_succeeded": 0, "tasks_failed": 0}
+    recent: list[dict] = []
+    patch: dict[str, Any] = {}
+    try:
+        return await _poll_once_inner(remote_cfg, client, signer or _RequestSigner(remote_cfg), deltas, recent, patch)
+    finally:
+        _commit_poll_runtime(deltas, recent, patch)
+
+
+async def _poll_once_inner(
+    remote_cfg: dict,
+    client: httpx.AsyncClient,
+    signer: _RequestSigner,
+    deltas: dict[str, int],
+    recent: list[dict],
+    patch: dict[str, Any],
+) -> int:
+    await _register_device_if_supported(client, remote_cfg, patch, signer)
+
+    payload = {
+        "project_id": remote_cfg["project_id"],
+        "device_id": remote_cfg["device_id"],
+        "max_tasks": int(remote_cfg["max_tasks_per_poll"]),
+        "capabilities": _TASK_HANDLER_NAMES,
+    }
+    res = await _post_signed(client, remote_cfg, _POLL_PATH, payload, signer)
+    # One timestamp per poll for everything recorded about this round trip.
+    polled_at = _utc_now_iso()
+    patch["last_http_status"] = int(res.status_code)
+    patch["last_poll_at"] = polled_at
+    if res.status_code == 204:
+        return int(remote_cfg["poll_interval_seconds"])
+    if res.status_code != 200:
+        raise RuntimeError(f"Relay poll failed ({res.status_code})")
+
+    data = _decode_response(res)
+    tasks = data.get("tasks", [])
+    if not isinstance(tasks, list):
+        tasks = []
+    tasks = tasks[: int(remote_cfg["max_tasks_per_poll"])]
+    deltas["tasks_received"] += len(tasks)
+
+    # Tasks are independent; run them concurrently, bounded by max_task_concurrency.
+    # Each gathered coroutine gets its own context, so the per-task ContextVars hold.
+    semaphore = asyncio.Semaphore(int(remote_cfg["max_task_concurrency"]))
+
+    pending: list[dict] = []
+    uploads: list[asyncio.Task] = []
+
+    def _flush_reports():
+        if not pending:
+            return
+        report_payload = {
             "project_id": remote_cfg["project_id"],
             "device_id": remote_cfg["device_id"],
-            "max_tasks": int(remote_cfg["max_tasks_per_poll"]),
-            "capabilities": sorted(_TASK_HANDLERS.keys()),
+            "results": pending[:],
         }
-        res = await _post_signed(client, remote_cfg, _POLL_PATH, payload)
-        _set_runtime(last_http_status=int(res.status_code), last_poll_at=_utc_now_iso())
-        if res.status_code == 204:
-            return int(remote_cfg["poll_interval_seconds"])
-        if res.status_code != 200:
-            raise RuntimeError(f"Relay poll failed ({res.status_code})")
-
-        data = res.json() if res.content else {}
-        tasks = data.get("tasks", [])
-        if not isinstance(tasks, list):
-            tasks = []
-        tasks = tasks[: int(remote_cfg["max_tasks_per_poll"])]
-        _set_runtime(tasks_received=int(_snapshot_runtime().get("tasks_received", 0) or 0) + len(tasks))
-
-        results: list[dict] = []
-        success_count = 0
-        failed_count = 0
-        for task in tasks:
-            if not isinstance(task, dict):
-                continue
-            task_result = await _execute_task(remote_cfg, task)
-            results.append(task_result)
-            if task_result.get("ok"):
-                success_count += 1
-            else:
-                failed_count += 1
-            _append_result(
-                {
-                    "at": _utc_now_iso(),
-                    "task_id": str(task_result.get("task_id") or ""),
-                    "tool": str(task_result.get("tool") or ""),
-                    "ok": bool(task_result.get("ok")),
-                    "error": str(task_result.get("error") or "")[:240] if not task_result.get("ok") else "",
-                }
-            )
+        pending.clear()
+        uploads.append(asyncio.create_task(_post_signed(client, remote_cfg, _REPORT_PATH, report_payload, signer)))
 
-        if results:
-            report_payload = {
-                "project_id": remote_cfg["project_id"],
-                "device_id": remote_cfg["device_id"],
-                "results": results,
+    async def _run_task(task: dict):
+        async with semaphore:
+            task_result = await _execute_task(remote_cfg, task)
+        ok = bool(task_result.get("ok"))
+        deltas["tasks_succeeded" if ok else "tasks_failed"] += 1
+        recent.append(
+            {
+                "at": polled_at,
+                "task_id": str(task_result.get("task_id") or ""),
+                "tool": str(task_result.get("tool") or ""),
+                "ok": ok,
+                "error": "" if ok else str(task_result.get("error") or "")[:240],
             }
-            report_res = await _post_signed(client, remote_cfg, _REPORT_PATH, report_payload)
-            _set_runtime(last_http_status=int(report_res.status_code))
-
-        snapshot = _snapshot_runtime()
-        _set_runtime(
-            tasks_succeeded=int(snapshot.get("tasks_succeeded", 0) or 0) + int(success_count),
-            tasks_failed=int(snapshot.get("tasks_failed", 0) or 0) + int(failed_count),
-            last_success_at=_utc_now_iso(),
-            last_error=None,
-            last_error_at=None,
-        )
-
-        poll_after = _clamp_int(
-            data.get("poll_after_seconds", remote_cfg["poll_interval_seconds"]),
-            int(remote_cfg["poll_interval_seconds"]),
-            5,
-            300,
         )
-        return poll_after
+        # Upload finished results in chunks so large outputs are not all held until the poll ends.
+        pending.append(task_result)
+        if len(pending) >= _REPORT_BATCH_SIZE:
+            _flush_reports()
+
+    await asyncio.gather(*(_run_task(task) for task in tasks if isinstance(task, dict)))
+    _flush_reports()
+
+    if uploads:
+        responses = await asyncio.gather(*uploads, return_exceptions=True)
+        for response in responses:
+            if isinstance(response, BaseException):
+                raise response
+        patch["last_http_status"] = int(responses[-1].status_code)
+
+    patch.update(last_success_at=_utc_now_iso(), last_error=None, last_error_at=None)
+
+    poll_after = _clamp_int(
+        data.get("poll_after_seconds", remote_cfg["poll_interval_seconds"]),
+        int(remote_cfg["poll_interval_seconds"]),
+        5,
+        300,
+    )
+    return poll_after
 
 
 async def _run_loop():
+    global _http_client
     _set_runtime(worker_alive=True, running=True, status="running")
     next_wait = 1
     backoff = 0
+    # Secret bytes, MAC key and static headers survive across polls until the config changes them.
+    signer: _RequestSigner | None = None
     while True:
         if _stop_event is not None and _stop_event.is_set():
             break
@@ -340,24 +581,26 @@ async def _run_loop():
             return
 
         try:
-            snapshot = _snapshot_runtime()
-            _set_runtime(
-                polls_total=int(snapshot.get("polls_total", 0) or 0) + 1,
+            _incr_runtime(
+                {"polls_total": 1},
                 status="running",
                 running=True,
                 worker_alive=True,
             )
-            next_wait = await _poll_once(remote_cfg)
+            if _http_client is None:
+                _http_client = _build_http_client(remote_cfg)
+            if signer is None or signer.source != _RequestSigner.inputs(remote_cfg):
+                signer = _RequestSigner(remote_cfg)
+            next_wait = await _poll_once(remote_cfg, _http_client, signer)
             backoff = 0
         except asyncio.CancelledError:
             raise
         except Exception as e:
-            snapshot = _snapshot_runtime()
-            _set_runtime(
+            _incr_runtime(
+                {"polls_failed": 1},
                 status="error",
                 running=True,
                 worker_alive=True,
-                polls_failed=int(snapshot.get("polls_failed", 0) or 0) + 1,
                 last_error=str(e)[:360],
                 last_error_at=_utc_now_iso(),
             )
@@ -380,7 +623,7 @@ async def _run_loop():
 
 
 async def start_remote_access_client() -> dict:
-    global _worker_task, _stop_event, _poll_now_event
+    global _worker_task, _stop_event, _poll_now_event, _http_client
     cfg = load_config(force_reload=True)
     remote_cfg = _normalize_remote_cfg(cfg.get("remote_access"))
     _set_runtime(config=_public_remote_config(remote_cfg))
@@ -394,13 +637,15 @@ async def start_remote_access_client() -> dict:
 
     _stop_event = asyncio.Event()
     _poll_now_event = asyncio.Event()
+    await _close_http_client()
+    _http_client = _build_http_client(remote_cfg)
     _worker_task = asyncio.create_task(_run_loop(), name="mnesis-remote-relay")
     _set_runtime(status="running", worker_alive=True, running=True, last_error=None, last_error_at=None)
     return get_remote_access_status()
 
 
 async def stop_remote_access_client() -> dict:
-    global _worker_task, _stop_event
+    global _worker_task, _stop_event, _last_registration
     task = _worker_task
     if task is None:
         _set_runtime(status="stopped", worker_alive=False, running=False)
@@ -423,6 +668,8 @@ async def stop_remote_access_client() -> dict:
         pass
 
     _worker_task = None
+    _last_registration = None
+    await _close_http_client()
     _set_runtime(status="stopped", worker_alive=False, running=False)
     return get_remote_access_status()
 
@@ -479,5 +726,5 @@ def get_remote_access_status() -> dict:
         "status": str(runtime.get("status") or "disabled"),
         "config": _public_remote_config(remote_cfg),
         "runtime": runtime,
-        "allowed_tools": sorted(_TASK_HANDLERS.keys()),
+        "allowed_tools": _TASK_HANDLER_NAMES,
     }
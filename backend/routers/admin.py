@@ -1,22 +1,50 @@
 import asyncio
+import copy
+import hashlib
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 import logging
+from operator import itemgetter
 from typing import Any
 import uuid
 import json
 import os
-
-from fastapi import APIRouter, Depends, HTTPException, Response
+import threading
+import time
+
+import httpx
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
+
 from backend.auth import normalize_client_scopes
 from backend.config import CONFIG_DIR, CONFIG_PATH, load_config, save_config, rotate_snapshot_token as rotate_token_logic
-from backend.database.client import get_db_dep
+from backend.database.client import bump_schema_generation, get_db_dep, schema_generation
 from backend.database.schema import Conversation, Message, EMBEDDING_DIM
 from backend.insights.service import get_insights_config_public, update_insights_config
+from backend.memory.conversation_analysis_jobs import (
+    cancel_analysis_job,
+    enqueue_analysis_job,
+    get_analysis_jobs_overview,
+    get_analysis_worker_state,
+    wait_for_analysis_job,
+)
+from backend.memory.conversation_mining import get_analysis_llm_gate_status, get_analysis_runtime_status
 from backend.memory.write_queue import enqueue_write
 from backend.memory.embedder import get_status as get_embedding_status
 from backend.memory.model_manager import model_manager
+from backend.memory.sessions import SESSION_ACTIVITY_PROJECTION, merge_session_activity_table
 from backend.remote import get_remote_access_status
 from backend.security import (
     bootstrap_bridge_mcp_key,
@@ -25,15 +53,56 @@ from backend.security import (
     security_runtime_overview,
     strict_security_patch,
 )
-from backend.sync.service import (
-    get_sync_public_status,
-    lock_sync,
-    run_sync_now,
-    unlock_sync,
-    update_sync_config,
-)
 
-router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+
+class _AdminJSONResponse(ORJSONResponse):
+    """orjson rendering that hands anything orjson can't encode to jsonable_encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=jsonable_encoder,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+# Admin payloads (status snapshots, schema lists, counts) render through orjson
+# when it is installed.
+_FAST_JSON_RESPONSE = _AdminJSONResponse if orjson is not None else JSONResponse
+
+
+def _respond(content: Any) -> Response:
+    """Render a handler payload directly, skipping FastAPI's up-front jsonable_encoder walk."""
+    if orjson is None:
+        return JSONResponse(jsonable_encoder(content))
+    return _AdminJSONResponse(content)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _conditional_respond(request: Request, content: Any, volatile: tuple[str, ...] = ()) -> Response:
+    """
+    Render `content` with an ETag of its bytes; answer 304 (no body) when the
+    poller already holds that payload. `volatile` strings (per-request clock
+    stamps) are left out of the tag so they alone never defeat it.
+    """
+    response = _respond(content)
+    tagged = response.body
+    for value in volatile:
+        if value:
+            tagged = tagged.replace(value.encode("utf-8"), b"")
+    etag = f'"{hashlib.blake2b(tagged, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"], default_response_class=_FAST_JSON_RESPONSE)
 logger = logging.getLogger(__name__)
 
 
@@ -49,26 +118,47 @@ def _bad_request(message: str, exc: Exception | None = None) -> HTTPException:
     return HTTPException(status_code=400, detail=message)
 
 
-def _to_dt(value: Any) -> datetime:
-    if isinstance(value, datetime):
-        if value.tzinfo is None:
-            return value.replace(tzinfo=timezone.utc)
-        return value.astimezone(timezone.utc)
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _parse_dt_cached(value: str | int | float) -> datetime:
     if isinstance(value, (int, float)):
         try:
             return datetime.fromtimestamp(float(value), tz=timezone.utc)
         except Exception:
-            pass
-    if isinstance(value, str) and value:
-        try:
-            return datetime.fromtimestamp(float(value), tz=timezone.utc)
-        except Exception:
-            pass
+            return _EPOCH
+    # "YYYY-MM-DD..." is the common case; parse it before trying float() so it
+    # does not pay for a raised-and-caught ValueError.
+    looks_iso = value[4:5] == "-" and value[:4].isdigit()
+    if looks_iso:
         try:
             return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
-        except Exception:
+        except ValueError:
             pass
-    return datetime.fromtimestamp(0, tz=timezone.utc)
+    try:
+        return datetime.fromtimestamp(float(value), tz=timezone.utc)
+    except Exception:
+        pass
+    if looks_iso:
+        return _EPOCH
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+    except Exception:
+        return _EPOCH
+
+
+def _to_dt(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+    if value is None or value == "":
+        return _EPOCH
+    # Observability rows repeat the same timestamps across fields and passes.
+    if isinstance(value, (str, int, float)):
+        return _parse_dt_cached(value)
+    return _EPOCH
 
 
 def _conversation_key(row: dict) -> tuple:
@@ -103,11 +193,35 @@ def _message_key(row: dict) -> tuple:
     return ("fp", str(row.get("conversation_id") or "").strip(), role, content, timestamp)
 
 
-def _is_newer(row_a: dict, row_b: dict) -> bool:
-    # True when row_a should replace row_b.
-    a_updated = _to_dt(row_a.get("updated_at") or row_a.get("timestamp") or row_a.get("imported_at"))
-    b_updated = _to_dt(row_b.get("updated_at") or row_b.get("timestamp") or row_b.get("imported_at"))
-    return a_updated >= b_updated
+def _row_updated_at(row: dict) -> datetime:
+    return _to_dt(row.get("updated_at") or row.get("timestamp") or row.get("imported_at"))
+
+
+def _dedupe_newest(rows: list[dict], key_fn, preview_limit: int = 40) -> tuple[list[dict], int, list[str]]:
+    """
+    Keep one row per key_fn(row), preferring the most recently updated (later rows win ties).
+    Returns (kept rows in first-seen key order, duplicate count, preview of duplicate ids).
+    """
+    # key -> [row, updated_at or None]; a row's timestamp is parsed only once it meets a duplicate.
+    picked: dict[tuple, list] = {}
+    duplicates = 0
+    preview: list[str] = []
+    for row in rows:
+        key = key_fn(row)
+        slot = picked.get(key)
+        if slot is None:
+            picked[key] = [row, None]
+            continue
+        duplicates += 1
+        dup_id = row.get("id")
+        if dup_id and len(preview) < preview_limit:
+            preview.append(str(dup_id))
+        if slot[1] is None:
+            slot[1] = _row_updated_at(slot[0])
+        updated = _row_updated_at(row)
+        if updated >= slot[1]:
+            slot[0], slot[1] = row, updated
+    return [slot[0] for slot in picked.values()], duplicates, preview
 
 
 def _sanitize_conversation_row(row: dict) -> Conversation:
@@ -147,6 +261,7 @@ async def complete_onboarding():
         config = load_config()
         config['onboarding_completed'] = True
         save_config(config)
+        _invalidate_status_cache()
         autoconfig_result = None
         try:
             from backend.config_watcher import run_first_launch_autoconfigure
@@ -162,9 +277,20 @@ async def complete_onboarding():
 _SENSITIVE_CONFIG_KEYS = {"snapshot_read_token", "secret_access_key", "webdav_password"}
 
 
+# load_config() hands out the same cached dict until the config is saved or reloaded,
+# so the masked view is rebuilt only when that object (or its key count) changes.
+_safe_config_memo: tuple[dict, int, dict] | None = None
+
+
 def _safe_config(config: dict) -> dict:
     """Return config with sensitive values masked. Never expose secrets over HTTP."""
-    return {k: ("***" if k in _SENSITIVE_CONFIG_KEYS else v) for k, v in config.items()}
+    global _safe_config_memo
+    memo = _safe_config_memo
+    if memo is not None and memo[0] is config and memo[1] == len(config):
+        return memo[2]
+    masked = config | {key: "***" for key in _SENSITIVE_CONFIG_KEYS if key in config}
+    _safe_config_memo = (config, len(config), masked)
+    return masked
 
 
 @router.get("/config")
@@ -310,6 +436,9 @@ class RemoteAccessConfigUpdate(BaseModel):
     poll_interval_seconds: int | None = None
     request_timeout_seconds: int | None = None
     max_tasks_per_poll: int | None = None
+    max_task_concurrency: int | None = None
+    signature_alg: str | None = None
+    wire_format: str | None = None
     rotate_device_secret: bool | None = None
 
 
@@ -322,68 +451,112 @@ def _load_scheduler_state() -> dict:
     if not os.path.exists(path):
         return {}
     try:
-        with open(path, "r") as f:
-            raw = json.load(f)
+        with open(path, "rb") as f:
+            data = f.read()
+        raw = orjson.loads(data) if orjson is not None else json.loads(data)
         return raw if isinstance(raw, dict) else {}
     except Exception:
         return {}
 
 
+def _dump_scheduler_state(state: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                state,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except Exception:
+            pass
+    return json.dumps(state, default=str, indent=2).encode("utf-8")
+
+
 def _save_scheduler_state(state: dict):
     path = _scheduler_state_path()
     try:
-        with open(path, "w") as f:
-            json.dump(state or {}, f, default=str, indent=2)
+        data = _dump_scheduler_state(state or {})
+        with open(path, "wb") as f:
+            f.write(data)
     except Exception:
         pass
+    _invalidate_status_cache()
+
+
+def _as_dict(value: Any) -> dict:
+    return value if isinstance(value, dict) else {}
 
 
 def _merge_security_config(existing: dict, patch: dict) -> dict:
-    merged = dict(existing or {})
-    for key, value in (patch or {}).items():
-        if value is None:
-            continue
-        if key in {"rate_limit", "audit"} and isinstance(value, dict):
-            current = merged.get(key, {})
-            if not isinstance(current, dict):
-                current = {}
-            merged[key] = {**current, **value}
-            if key == "rate_limit":
-                buckets = value.get("buckets")
-                if isinstance(buckets, dict):
-                    current_buckets = current.get("buckets", {})
-                    if not isinstance(current_buckets, dict):
-                        current_buckets = {}
-                    merged[key]["buckets"] = {**current_buckets, **buckets}
+    existing = existing or {}
+    updates = {key: value for key, value in (patch or {}).items() if value is not None}
+    merged = existing | updates
+    # Nested sections are merged one level deep (rate_limit.buckets two) instead of replaced.
+    for key in ("rate_limit", "audit"):
+        value = updates.get(key)
+        if not isinstance(value, dict):
             continue
-        merged[key] = value
+        current = _as_dict(existing.get(key))
+        merged[key] = current | value
+        if key == "rate_limit" and isinstance(value.get("buckets"), dict):
+            merged[key]["buckets"] = _as_dict(current.get("buckets")) | value["buckets"]
     return merged
 
 
+_ANALYSIS_TAG = "auto:conversation-analysis"
+_ANALYSIS_MSGCOUNT_PREFIX = _ANALYSIS_TAG + ":msgcount:"
+_ANALYZER_SOURCE_PREFIX = "conversation-analyzer:"
+
+
 def _analysis_tag_info(tags: list[str]) -> tuple[bool, bool]:
     has_analysis = False
     has_msgcount = False
     for tag in tags:
-        value = str(tag or "").strip().lower()
-        if value == "auto:conversation-analysis":
+        if not isinstance(tag, str):
+            continue
+        value = tag.strip().lower()
+        if value == _ANALYSIS_TAG:
             has_analysis = True
-        if value.startswith("auto:conversation-analysis:msgcount:"):
+        elif value.startswith(_ANALYSIS_MSGCOUNT_PREFIX):
             has_msgcount = True
+        else:
+            continue
+        if has_analysis and has_msgcount:
+            break
     return has_analysis, has_msgcount
 
 
-def _merge_max_iso(current: str | None, candidate: Any) -> str | None:
+def _merge_max_dt(current: datetime | None, candidate: Any) -> datetime | None:
     if not candidate:
         return current
     candidate_dt = _to_dt(candidate)
-    if not current:
-        return candidate_dt.isoformat()
-    current_dt = _to_dt(current)
-    return candidate_dt.isoformat() if candidate_dt >= current_dt else current
+    if current is None or candidate_dt >= current:
+        return candidate_dt
+    return current
+
+
+# Per-client "last *" timestamps are tracked as datetimes under the private key and
+# serialized once after aggregation.
+_CLIENT_LAST_AT_FIELDS = {
+    "last_seen_at": "_last_seen_dt",
+    "last_read_at": "_last_read_dt",
+    "last_write_at": "_last_write_dt",
+    "last_feedback_at": "_last_feedback_dt",
+}
+
+
+# Single-entry memo of (llm_client_keys snapshot, parsed clients): the section only
+# changes on config saves, so an equality check replaces re-normalizing every request.
+_configured_clients_memo: tuple[dict, dict[str, dict]] | None = None
 
 
 def _configured_clients_from_config(cfg: dict) -> dict[str, dict]:
+    """Configured MCP clients by name. The result is shared between calls; do not mutate it."""
+    global _configured_clients_memo
     raw = cfg.get("llm_client_keys", {}) if isinstance(cfg.get("llm_client_keys"), dict) else {}
+    memo = _configured_clients_memo
+    if memo is not None and memo[0] == raw:
+        return memo[1]
     out: dict[str, dict] = {}
     for key_name, key_value in raw.items():
         name = str(key_name or "").strip().lower()
@@ -396,9 +569,79 @@ def _configured_clients_from_config(cfg: dict) -> dict[str, dict]:
         else:
             scopes = sorted(normalize_client_scopes(None))
         out[name] = {"name": name, "configured": True, "scopes": scopes}
+    _configured_clients_memo = (copy.deepcopy(raw), out)
     return out
 
 
+# Only the columns observability aggregates; vectors/blobs and unused fields stay on disk.
+_RUNTIME_METRIC_COLUMNS = (
+    "client",
+    "captured_at",
+    "delta_requests",
+    "delta_errors",
+    "avg_latency_ms",
+    "p95_latency_ms",
+)
+_SESSION_OBSERVABILITY_COLUMNS = [*SESSION_ACTIVITY_PROJECTION, "started_at", "ended_at"]
+
+
+@dataclass(slots=True)
+class _RuntimeWindowAgg:
+    """Per-client accumulator for runtime metric windows; plain attributes keep the scan loop cheap."""
+
+    requests: int = 0
+    errors: int = 0
+    windows: int = 0
+    p95_latency: float = 0.0
+    last_captured: datetime | None = None
+    latency_weight_sum: float = 0.0
+    latency_weight: int = 0
+    latency_sample_sum: float = 0.0
+    latency_sample_count: int = 0
+
+    def to_dict(self) -> dict:
+        if self.latency_weight > 0:
+            avg_latency = self.latency_weight_sum / float(self.latency_weight)
+        elif self.latency_sample_count > 0:
+            avg_latency = self.latency_sample_sum / float(self.latency_sample_count)
+        else:
+            avg_latency = 0.0
+        return {
+            "requests_24h": self.requests,
+            "errors_24h": self.errors,
+            "windows_24h": self.windows,
+            "avg_latency_24h_ms": round(avg_latency, 2),
+            "p95_latency_24h_ms": round(self.p95_latency, 2),
+            "last_captured_at": self.last_captured.isoformat() if self.last_captured else None,
+        }
+
+
+def _timestamp_micros(column) -> np.ndarray:
+    """UTC epoch microseconds of a timestamp column; nulls become the epoch."""
+    micros = pc.cast(pc.cast(column, pa.timestamp("us")), pa.int64())
+    return pc.fill_null(micros, 0).to_numpy(zero_copy_only=False)
+
+
+def _from_micros(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _numeric_column(table: pa.Table, name: str, dtype) -> np.ndarray:
+    return pc.fill_null(table.column(name), 0).to_numpy(zero_copy_only=False).astype(dtype)
+
+
+def _normalized_client_names(column) -> pa.ChunkedArray:
+    # Row-wise equivalent: str(client or "unknown").strip().lower() or "unknown".
+    name = pc.utf8_lower(pc.utf8_trim_whitespace(pc.fill_null(column.cast(pa.string()), "")))
+    return pc.if_else(pc.equal(name, ""), "unknown", name)
+
+
+def _at_or_after_filter(column: str, cutoff: datetime) -> str:
+    # LanceDB stores timestamps as naive UTC.
+    naive = cutoff.astimezone(timezone.utc).replace(tzinfo=None)
+    return f"{column} >= timestamp '{naive.isoformat(sep=' ')}'"
+
+
 def _collect_runtime_metrics_history(
     db,
     *,
@@ -415,88 +658,184 @@ def _collect_runtime_metrics_history(
     if "client_runtime_metrics" not in db.table_names():
         return default
 
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=max(1, int(period_hours)))
     try:
-        rows = db.open_table("client_runtime_metrics").search().limit(max(1, int(limit))).to_list()
+        table = (
+            db.open_table("client_runtime_metrics")
+            .search()
+            .where(_at_or_after_filter("captured_at", cutoff))
+            .select(list(_RUNTIME_METRIC_COLUMNS))
+            .limit(max(1, int(limit)))
+            .to_arrow()
+        )
     except Exception:
         return default
 
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=max(1, int(period_hours)))
-    by_client: dict[str, dict] = {}
-    recent_rows: list[dict] = []
-
-    for row in rows:
-        captured = _to_dt(row.get("captured_at"))
-        if captured < cutoff:
-            continue
-        client = str(row.get("client") or "unknown").strip().lower() or "unknown"
-        delta_requests = max(0, int(row.get("delta_requests", row.get("total_requests", 0)) or 0))
-        delta_errors = max(0, int(row.get("delta_errors", row.get("error_requests", 0)) or 0))
-        avg_latency = float(row.get("avg_latency_ms", 0.0) or 0.0)
-        p95_latency = float(row.get("p95_latency_ms", 0.0) or 0.0)
-
-        entry = by_client.setdefault(
-            client,
-            {
-                "requests_24h": 0,
-                "errors_24h": 0,
-                "windows_24h": 0,
-                "avg_latency_24h_ms": 0.0,
-                "p95_latency_24h_ms": 0.0,
-                "last_captured_at": None,
-                "_latency_weight_sum": 0.0,
-                "_latency_weight": 0,
-                "_latency_sample_sum": 0.0,
-                "_latency_sample_count": 0,
-            },
-        )
-        entry["requests_24h"] = int(entry.get("requests_24h", 0) or 0) + delta_requests
-        entry["errors_24h"] = int(entry.get("errors_24h", 0) or 0) + delta_errors
-        entry["windows_24h"] = int(entry.get("windows_24h", 0) or 0) + 1
-        entry["last_captured_at"] = _merge_max_iso(entry.get("last_captured_at"), captured)
-        entry["p95_latency_24h_ms"] = round(max(float(entry.get("p95_latency_24h_ms", 0.0) or 0.0), p95_latency), 2)
-        if delta_requests > 0:
-            entry["_latency_weight_sum"] = float(entry.get("_latency_weight_sum", 0.0) or 0.0) + (
-                avg_latency * float(delta_requests)
-            )
-            entry["_latency_weight"] = int(entry.get("_latency_weight", 0) or 0) + delta_requests
-        else:
-            entry["_latency_sample_sum"] = float(entry.get("_latency_sample_sum", 0.0) or 0.0) + avg_latency
-            entry["_latency_sample_count"] = int(entry.get("_latency_sample_count", 0) or 0) + 1
+    # Keep only in-window rows, then aggregate per client with numpy reductions over
+    # dense client codes; Python objects are built only for the returned recent rows.
+    captured_us = _timestamp_micros(table.column("captured_at"))
+    in_window = captured_us >= int(cutoff.timestamp() * 1_000_000)
+    captured_us = captured_us[in_window]
+    clients = _normalized_client_names(table.column("client")).filter(pa.array(in_window)).combine_chunks()
+    clients = clients.dictionary_encode()
+    codes = clients.indices.to_numpy(zero_copy_only=False).astype(np.int64)
+    names = clients.dictionary.to_pylist()
+    delta_requests = np.maximum(_numeric_column(table, "delta_requests", np.int64)[in_window], 0)
+    delta_errors = np.maximum(_numeric_column(table, "delta_errors", np.int64)[in_window], 0)
+    avg_latency = _numeric_column(table, "avg_latency_ms", np.float64)[in_window]
+    p95_latency = _numeric_column(table, "p95_latency_ms", np.float64)[in_window]
+
+    n = len(names)
+    requests = np.zeros(n, dtype=np.int64)
+    errors = np.zeros(n, dtype=np.int64)
+    p95_max = np.zeros(n, dtype=np.float64)
+    last_us = np.full(n, np.iinfo(np.int64).min, dtype=np.int64)
+    np.add.at(requests, codes, delta_requests)
+    np.add.at(errors, codes, delta_errors)
+    np.maximum.at(p95_max, codes, p95_latency)
+    np.maximum.at(last_us, codes, captured_us)
+    windows = np.bincount(codes, minlength=n)
+    # Windows with traffic weight their average by request count; idle ones are plain samples.
+    weighted = delta_requests > 0
+    weight_sum = np.bincount(codes[weighted], weights=avg_latency[weighted] * delta_requests[weighted], minlength=n)
+    weight = np.bincount(codes[weighted], weights=delta_requests[weighted], minlength=n)
+    sample_sum = np.bincount(codes[~weighted], weights=avg_latency[~weighted], minlength=n)
+    sample_count = np.bincount(codes[~weighted], minlength=n)
+
+    by_client = {
+        name: _RuntimeWindowAgg(
+            requests=int(requests[k]),
+            errors=int(errors[k]),
+            windows=int(windows[k]),
+            p95_latency=float(p95_max[k]),
+            last_captured=_from_micros(int(last_us[k])),
+            latency_weight_sum=float(weight_sum[k]),
+            latency_weight=int(weight[k]),
+            latency_sample_sum=float(sample_sum[k]),
+            latency_sample_count=int(sample_count[k]),
+        ).to_dict()
+        for k, name in enumerate(names)
+    }
 
-        recent_rows.append(
+    newest_first = np.argsort(-captured_us, kind="stable")[: max(1, int(recent_limit))]
+    recent = []
+    for k in newest_first.tolist():
+        recent.append(
             {
-                "client": client,
-                "captured_at": captured.isoformat(),
-                "delta_requests": delta_requests,
-                "delta_errors": delta_errors,
-                "avg_latency_ms": round(avg_latency, 2),
-                "p95_latency_ms": round(p95_latency, 2),
+                "client": names[codes[k]],
+                "captured_at": _from_micros(int(captured_us[k])).isoformat(),
+                "delta_requests": int(delta_requests[k]),
+                "delta_errors": int(delta_errors[k]),
+                "avg_latency_ms": round(float(avg_latency[k]), 2),
+                "p95_latency_ms": round(float(p95_latency[k]), 2),
             }
         )
-
-    for entry in by_client.values():
-        weight = int(entry.get("_latency_weight", 0) or 0)
-        if weight > 0:
-            avg_24h = float(entry.get("_latency_weight_sum", 0.0) or 0.0) / float(weight)
-        else:
-            sample_count = int(entry.get("_latency_sample_count", 0) or 0)
-            sample_sum = float(entry.get("_latency_sample_sum", 0.0) or 0.0)
-            avg_24h = (sample_sum / float(sample_count)) if sample_count > 0 else 0.0
-        entry["avg_latency_24h_ms"] = round(avg_24h, 2)
-        entry.pop("_latency_weight_sum", None)
-        entry.pop("_latency_weight", None)
-        entry.pop("_latency_sample_sum", None)
-        entry.pop("_latency_sample_count", None)
-
-    recent_rows.sort(key=lambda item: _to_dt(item.get("captured_at")), reverse=True)
     return {
         "period_hours": int(max(1, period_hours)),
-        "rows_considered": len(recent_rows),
+        "rows_considered": int(len(captured_us)),
         "by_client": by_client,
-        "recent": recent_rows[: max(1, int(recent_limit))],
+        "recent": recent,
     }
 
 
+def _session_client_names(table: pa.Table) -> pa.Array:
+    # Same rule as the row-wise form: api_key_id, else source_llm, stripped/lowercased, else "unknown".
+    blank = pa.scalar(None, pa.string())
+    api_key_id = table.column("api_key_id").cast(pa.string())
+    source_llm = table.column("source_llm").cast(pa.string())
+    name = pc.coalesce(
+        pc.if_else(pc.equal(api_key_id, ""), blank, api_key_id),
+        pc.if_else(pc.equal(source_llm, ""), blank, source_llm),
+        pa.scalar("", pa.string()),
+    )
+    name = pc.utf8_lower(pc.utf8_trim_whitespace(name))
+    return pc.if_else(pc.equal(name, ""), "unknown", name)
+
+
+def _nonempty_id_counts(column) -> np.ndarray:
+    """Per-row count of non-empty ids in a list<string> column."""
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    counts = pc.fill_null(pc.list_value_length(column), 0).to_numpy(zero_copy_only=False).astype(np.int64)
+    # Empty-string ids are rare: only locate their rows when there are any to subtract.
+    empty = pc.fill_null(pc.equal(pc.list_flatten(column).cast(pa.string()), ""), False)
+    if pc.any(empty).as_py():
+        parents = pc.list_parent_indices(column).filter(empty)
+        counts -= np.bincount(parents.to_numpy(zero_copy_only=False), minlength=len(column))
+    return counts
+
+
+def _aggregate_sessions_by_client(table: pa.Table | None) -> list[dict]:
+    """Columnar group-by of session activity per client (counts, id totals, latest timestamps)."""
+    if table is None or table.num_rows == 0:
+        return []
+    reads = _nonempty_id_counts(table.column("memory_ids_read"))
+    writes = _nonempty_id_counts(table.column("memory_ids_written"))
+    feedback = _nonempty_id_counts(table.column("memory_ids_feedback"))
+    has_read, has_write, has_feedback = reads > 0, writes > 0, feedback > 0
+
+    started_at = table.column("started_at")
+    ts = pc.coalesce(table.column("ended_at").cast(started_at.type), started_at)
+    # Sessions with neither timestamp count as the epoch, like _to_dt(None).
+    ts = pc.fill_null(ts, pa.scalar(_EPOCH.replace(tzinfo=None)).cast(ts.type))
+    no_ts = pa.nulls(table.num_rows, ts.type)
+
+    grouped = pa.table(
+        {
+            "client": _session_client_names(table),
+            "sessions": np.ones(table.num_rows, dtype=np.int64),
+            "with_reads": has_read.astype(np.int64),
+            "with_writes": has_write.astype(np.int64),
+            "with_feedback": has_feedback.astype(np.int64),
+            "read_before_write": (has_read & has_write).astype(np.int64),
+            "write_without_read": (has_write & ~has_read).astype(np.int64),
+            "reads": reads,
+            "writes": writes,
+            "feedback": feedback,
+            "ts": ts,
+            "read_ts": pc.if_else(pa.array(has_read), ts, no_ts),
+            "write_ts": pc.if_else(pa.array(has_write), ts, no_ts),
+            "feedback_ts": pc.if_else(pa.array(has_feedback), ts, no_ts),
+        }
+    ).group_by("client").aggregate(
+        [
+            (name, "sum")
+            for name in (
+                "sessions",
+                "with_reads",
+                "with_writes",
+                "with_feedback",
+                "read_before_write",
+                "write_without_read",
+                "reads",
+                "writes",
+                "feedback",
+            )
+        ]
+        + [(name, "max") for name in ("ts", "read_ts", "write_ts", "feedback_ts")]
+    )
+    return grouped.to_pylist()
+
+
+# Dashboards poll /background/status every few seconds; the in-memory request
+# metrics snapshot (a sort per client under the store lock) is reused briefly.
+_REQUEST_METRICS_TTL_SECONDS = 1.0
+_request_metrics_cache: tuple[float, dict] | None = None
+_request_metrics_lock = threading.Lock()
+
+
+def _cached_request_metrics_snapshot() -> dict:
+    global _request_metrics_cache
+    with _request_metrics_lock:
+        now = time.monotonic()
+        cached = _request_metrics_cache
+        if cached is not None and now - cached[0] < _REQUEST_METRICS_TTL_SECONDS:
+            return cached[1]
+        snapshot = get_request_metrics_snapshot()
+        _request_metrics_cache = (now, snapshot)
+        return snapshot
+
+
 def _collect_client_observability(
     db,
     cfg: dict,
@@ -512,7 +851,7 @@ def _collect_client_observability(
         limit=max(1, int(runtime_history_limit)),
         recent_limit=max(1, int(runtime_recent_limit)),
     )
-    runtime_metrics = get_request_metrics_snapshot()
+    runtime_metrics = _cached_request_metrics_snapshot()
 
     def _new_entry(name: str, *, configured_flag: bool, scopes: list[str]) -> dict:
         return {
@@ -552,92 +891,101 @@ def _collect_client_observability(
         name: _new_entry(name, configured_flag=True, scopes=data.get("scopes", []))
         for name, data in configured.items()
     }
+    clients_get = clients.get
+
+    def _entry_for(name: str) -> dict:
+        # setdefault() would build a full default entry on every call; only create one on a miss.
+        entry = clients_get(name)
+        if entry is None:
+            entry = clients[name] = _new_entry(
+                name,
+                configured_flag=(name in configured),
+                scopes=configured.get(name, {}).get("scopes", []),
+            )
+        return entry
 
-    all_sessions: list[dict] = []
+    sessions_table = None
     if "sessions" in db.table_names():
         try:
-            all_sessions = db.open_table("sessions").search().limit(max(1, int(session_limit))).to_list()
+            sessions_table = (
+                db.open_table("sessions")
+                .search()
+                .select(_SESSION_OBSERVABILITY_COLUMNS)
+                .limit(max(1, int(session_limit)))
+                .to_arrow()
+            )
         except Exception:
-            all_sessions = []
-
-    for row in all_sessions:
-        client_name = str(row.get("api_key_id") or row.get("source_llm") or "").strip().lower()
-        if not client_name:
-            client_name = "unknown"
-        entry = clients.setdefault(
-            client_name,
-            _new_entry(
-                client_name,
-                configured_flag=(client_name in configured),
-                scopes=configured.get(client_name, {}).get("scopes", []),
-            ),
-        )
-
-        ts = _to_dt(row.get("ended_at") or row.get("started_at"))
-        entry["sessions_total"] = int(entry.get("sessions_total", 0) or 0) + 1
-        entry["last_seen_at"] = _merge_max_iso(entry.get("last_seen_at"), ts)
-
-        read_ids = [str(v) for v in (row.get("memory_ids_read") or []) if str(v)]
-        write_ids = [str(v) for v in (row.get("memory_ids_written") or []) if str(v)]
-        feedback_ids = [str(v) for v in (row.get("memory_ids_feedback") or []) if str(v)]
-
-        if read_ids:
-            entry["sessions_with_reads"] = int(entry.get("sessions_with_reads", 0) or 0) + 1
-            entry["memory_reads_total"] = int(entry.get("memory_reads_total", 0) or 0) + len(read_ids)
-            entry["last_read_at"] = _merge_max_iso(entry.get("last_read_at"), ts)
-        if write_ids:
-            entry["sessions_with_writes"] = int(entry.get("sessions_with_writes", 0) or 0) + 1
-            entry["memory_writes_total"] = int(entry.get("memory_writes_total", 0) or 0) + len(write_ids)
-            entry["last_write_at"] = _merge_max_iso(entry.get("last_write_at"), ts)
-            if read_ids:
-                entry["read_before_write_sessions"] = int(entry.get("read_before_write_sessions", 0) or 0) + 1
-            else:
-                entry["write_without_read_sessions"] = int(entry.get("write_without_read_sessions", 0) or 0) + 1
-        if feedback_ids:
-            entry["sessions_with_feedback"] = int(entry.get("sessions_with_feedback", 0) or 0) + 1
-            entry["memory_feedback_total"] = int(entry.get("memory_feedback_total", 0) or 0) + len(feedback_ids)
-            entry["last_feedback_at"] = _merge_max_iso(entry.get("last_feedback_at"), ts)
+            sessions_table = None
+        if sessions_table is not None:
+            try:
+                sessions_table = merge_session_activity_table(db, sessions_table)
+            except Exception as e:
+                logger.warning(f"Session activity merge failed: {e}")
+
+    for stats in _aggregate_sessions_by_client(sessions_table):
+        entry = _entry_for(stats["client"])
+        entry["sessions_total"] += int(stats["sessions_sum"])
+        entry["sessions_with_reads"] += int(stats["with_reads_sum"])
+        entry["sessions_with_writes"] += int(stats["with_writes_sum"])
+        entry["sessions_with_feedback"] += int(stats["with_feedback_sum"])
+        entry["read_before_write_sessions"] += int(stats["read_before_write_sum"])
+        entry["write_without_read_sessions"] += int(stats["write_without_read_sum"])
+        entry["memory_reads_total"] += int(stats["reads_sum"])
+        entry["memory_writes_total"] += int(stats["writes_sum"])
+        entry["memory_feedback_total"] += int(stats["feedback_sum"])
+        entry_get = entry.get
+        entry["_last_seen_dt"] = _merge_max_dt(entry_get("_last_seen_dt"), stats["ts_max"])
+        entry["_last_read_dt"] = _merge_max_dt(entry_get("_last_read_dt"), stats["read_ts_max"])
+        entry["_last_write_dt"] = _merge_max_dt(entry_get("_last_write_dt"), stats["write_ts_max"])
+        entry["_last_feedback_dt"] = _merge_max_dt(entry_get("_last_feedback_dt"), stats["feedback_ts_max"])
 
     for client_name, metrics in (runtime_metrics or {}).items():
-        key = str(client_name or "").strip().lower() or "unknown"
-        entry = clients.setdefault(
-            key,
-            _new_entry(
-                key,
-                configured_flag=(key in configured),
-                scopes=configured.get(key, {}).get("scopes", []),
-            ),
-        )
-        entry["runtime_total_requests"] = int(metrics.get("total_requests", 0) or 0)
-        entry["runtime_error_requests"] = int(metrics.get("error_requests", 0) or 0)
-        entry["runtime_avg_latency_ms"] = float(metrics.get("avg_latency_ms", 0.0) or 0.0)
-        entry["runtime_p95_latency_ms"] = float(metrics.get("p95_latency_ms", 0.0) or 0.0)
-        entry["runtime_last_error_at"] = metrics.get("last_error_at")
-        entry["last_seen_at"] = _merge_max_iso(entry.get("last_seen_at"), metrics.get("last_seen_at"))
+        entry = _entry_for(str(client_name or "").strip().lower() or "unknown")
+        metrics_get = metrics.get
+        entry["runtime_total_requests"] = int(metrics_get("total_requests", 0) or 0)
+        entry["runtime_error_requests"] = int(metrics_get("error_requests", 0) or 0)
+        entry["runtime_avg_latency_ms"] = float(metrics_get("avg_latency_ms", 0.0) or 0.0)
+        entry["runtime_p95_latency_ms"] = float(metrics_get("p95_latency_ms", 0.0) or 0.0)
+        entry["runtime_last_error_at"] = metrics_get("last_error_at")
+        entry["_last_seen_dt"] = _merge_max_dt(entry.get("_last_seen_dt"), metrics_get("last_seen_at"))
 
     history_by_client = runtime_history.get("by_client", {}) if isinstance(runtime_history, dict) else {}
     if isinstance(history_by_client, dict):
         for client_name, stats in history_by_client.items():
-            key = str(client_name or "").strip().lower() or "unknown"
-            entry = clients.setdefault(
-                key,
-                _new_entry(
-                    key,
-                    configured_flag=(key in configured),
-                    scopes=configured.get(key, {}).get("scopes", []),
-                ),
-            )
-            entry["runtime_requests_24h"] = int(stats.get("requests_24h", 0) or 0)
-            entry["runtime_errors_24h"] = int(stats.get("errors_24h", 0) or 0)
-            entry["runtime_windows_24h"] = int(stats.get("windows_24h", 0) or 0)
-            entry["runtime_avg_latency_24h_ms"] = float(stats.get("avg_latency_24h_ms", 0.0) or 0.0)
-            entry["runtime_p95_latency_24h_ms"] = float(stats.get("p95_latency_24h_ms", 0.0) or 0.0)
-            entry["runtime_last_captured_at"] = stats.get("last_captured_at")
-
-    total_sessions = max(1, sum(int(item.get("sessions_total", 0) or 0) for item in clients.values()))
+            entry = _entry_for(str(client_name or "").strip().lower() or "unknown")
+            # by_client rows come from _RuntimeWindowAgg.to_dict(), so every field is present and typed.
+            entry["runtime_requests_24h"] = stats["requests_24h"]
+            entry["runtime_errors_24h"] = stats["errors_24h"]
+            entry["runtime_windows_24h"] = stats["windows_24h"]
+            entry["runtime_avg_latency_24h_ms"] = stats["avg_latency_24h_ms"]
+            entry["runtime_p95_latency_24h_ms"] = stats["p95_latency_24h_ms"]
+            entry["runtime_last_captured_at"] = stats["last_captured_at"]
+
+    # Entries are created by _new_entry with plain int/float counters, so no `or 0` guards below.
+    # One pass for every summary total instead of a sum() per field.
+    sessions_total = write_sessions_total = read_before_write_total = 0
+    runtime_requests_24h_total = runtime_errors_24h_total = 0
+    configured_clients = active_clients = 0
+    for entry in clients.values():
+        sessions_total += entry["sessions_total"]
+        write_sessions_total += entry["sessions_with_writes"]
+        read_before_write_total += entry["read_before_write_sessions"]
+        runtime_requests_24h_total += entry["runtime_requests_24h"]
+        runtime_errors_24h_total += entry["runtime_errors_24h"]
+        if entry["configured"]:
+            configured_clients += 1
+        if entry["sessions_total"] > 0 or entry["runtime_total_requests"] > 0:
+            active_clients += 1
+    total_sessions = max(1, sessions_total)
+    last_at_fields = tuple(_CLIENT_LAST_AT_FIELDS.items())
     for entry in clients.values():
-        write_sessions = int(entry.get("sessions_with_writes", 0) or 0)
-        read_write_sessions = int(entry.get("read_before_write_sessions", 0) or 0)
+        entry_pop = entry.pop
+        for field, key in last_at_fields:
+            last_dt = entry_pop(key, None)
+            if last_dt is not None:
+                entry[field] = last_dt.isoformat()
+        write_sessions = entry["sessions_with_writes"]
+        read_write_sessions = entry["read_before_write_sessions"]
         if write_sessions > 0:
             rate = read_write_sessions / float(write_sessions)
             entry["read_before_response_rate"] = round(rate, 4)
@@ -645,37 +993,28 @@ def _collect_client_observability(
         else:
             entry["read_before_response_rate"] = 0.0
             entry["reads_before_response"] = "no-data"
-        entry["usage_rate"] = round((int(entry.get("sessions_total", 0) or 0) / float(total_sessions)), 4)
+        entry["usage_rate"] = round(entry["sessions_total"] / float(total_sessions), 4)
 
     rows = sorted(
         list(clients.values()),
         key=lambda x: (
-            1 if x.get("configured") else 0,
-            int(x.get("sessions_total", 0) or 0),
-            int(x.get("runtime_total_requests", 0) or 0),
+            1 if x["configured"] else 0,
+            x["sessions_total"],
+            x["runtime_total_requests"],
         ),
         reverse=True,
     )
 
-    write_sessions_total = sum(int(item.get("sessions_with_writes", 0) or 0) for item in rows)
-    read_before_write_total = sum(int(item.get("read_before_write_sessions", 0) or 0) for item in rows)
     cross_llm_read_reliability = (
         (read_before_write_total / float(write_sessions_total)) if write_sessions_total > 0 else 0.0
     )
-    active_clients = [
-        item
-        for item in rows
-        if int(item.get("sessions_total", 0) or 0) > 0 or int(item.get("runtime_total_requests", 0) or 0) > 0
-    ]
-    runtime_requests_24h_total = sum(int(item.get("runtime_requests_24h", 0) or 0) for item in rows)
-    runtime_errors_24h_total = sum(int(item.get("runtime_errors_24h", 0) or 0) for item in rows)
     return {
         "clients": rows,
         "summary": {
             "total_clients": len(rows),
-            "configured_clients": sum(1 for item in rows if item.get("configured")),
-            "active_clients": len(active_clients),
-            "sessions_total": sum(int(item.get("sessions_total", 0) or 0) for item in rows),
+            "configured_clients": configured_clients,
+            "active_clients": active_clients,
+            "sessions_total": sessions_total,
             "write_sessions_total": write_sessions_total,
             "read_before_write_sessions_total": read_before_write_total,
             "cross_llm_read_reliability": round(cross_llm_read_reliability, 4),
@@ -769,7 +1108,9 @@ def _release_gates(
 @router.get("/sync/status")
 async def get_sync_status():
     try:
-        return get_sync_public_status()
+        from backend.sync.service import get_sync_public_status
+
+        return _respond(get_sync_public_status())
     except Exception as e:
         raise _internal_error("Internal server error.", e)
 
@@ -777,8 +1118,10 @@ async def get_sync_status():
 @router.post("/sync/config")
 async def save_sync_config(payload: SyncConfigUpdate):
     try:
+        from backend.sync.service import update_sync_config
+
         partial = payload.model_dump(exclude_none=True)
-        return update_sync_config(partial)
+        return _respond(update_sync_config(partial))
     except Exception as e:
         raise _bad_request("Invalid request.", e)
 
@@ -786,7 +1129,9 @@ async def save_sync_config(payload: SyncConfigUpdate):
 @router.post("/sync/unlock")
 async def unlock_sync_key(payload: SyncUnlockPayload):
     try:
-        return unlock_sync(payload.passphrase)
+        from backend.sync.service import unlock_sync
+
+        return _respond(unlock_sync(payload.passphrase))
     except Exception as e:
         raise _bad_request("Invalid request.", e)
 
@@ -794,7 +1139,9 @@ async def unlock_sync_key(payload: SyncUnlockPayload):
 @router.post("/sync/lock")
 async def lock_sync_key():
     try:
-        return lock_sync()
+        from backend.sync.service import lock_sync
+
+        return _respond(lock_sync())
     except Exception as e:
         raise _internal_error("Internal server error.", e)
 
@@ -802,48 +1149,88 @@ async def lock_sync_key():
 @router.post("/sync/run")
 async def run_sync(payload: SyncRunPayload):
     try:
-        return await run_sync_now(passphrase=payload.passphrase, source=payload.source or "manual")
+        from backend.sync.service import run_sync_now
+
+        return _respond(await run_sync_now(passphrase=payload.passphrase, source=payload.source or "manual"))
     except Exception as e:
         raise _bad_request("Invalid request.", e)
 
 
+_http_client = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _shared_http_client():
+    """Pooled AsyncClient for the connection-test endpoints, reused across requests."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            # Never carry session cookies from one credentials check into the next.
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_shared_http_client() -> None:
+    global _http_client, _http_client_loop
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+@lru_cache(maxsize=32)
+def _get_s3_client(endpoint_url: str | None, access_key_id: str | None, secret_access_key: str | None, region: str):
+    """S3 client per endpoint/credentials; repeat connection tests reuse its parsed models and pool."""
+    # Imported here, like backend.sync.storage does: boto3 costs ~120ms to import
+    # and this body only runs on a client-cache miss.
+    import boto3
+    from botocore.config import Config as BotocoreConfig
+
+    return boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name=region,
+        config=BotocoreConfig(connect_timeout=5, read_timeout=5, max_pool_connections=32),
+    )
+
+
 @router.post("/sync/test")
 async def test_sync_connection(payload: SyncTestPayload):
     """Verify sync credentials without saving config or triggering a sync."""
     provider = str(payload.provider or "").strip().lower()
     try:
         if provider in ("s3", "r2"):
-            import boto3
-            from botocore.config import Config as BotocoreConfig
-
-            s3 = boto3.client(
-                "s3",
-                endpoint_url=payload.endpoint_url or None,
-                aws_access_key_id=payload.access_key_id or None,
-                aws_secret_access_key=payload.secret_access_key or None,
-                region_name=payload.region or "auto",
-                config=BotocoreConfig(connect_timeout=5, read_timeout=5),
-            )
             bucket = str(payload.bucket or "").strip()
             if not bucket:
                 raise HTTPException(status_code=400, detail="bucket is required")
-            s3.head_bucket(Bucket=bucket)
-            return {"ok": True, "provider": provider}
+            s3 = _get_s3_client(
+                payload.endpoint_url or None,
+                payload.access_key_id or None,
+                payload.secret_access_key or None,
+                payload.region or "auto",
+            )
+            # head_bucket is a blocking network call; keep it off the event loop.
+            await asyncio.to_thread(s3.head_bucket, Bucket=bucket)
+            return _respond({"ok": True, "provider": provider})
 
         elif provider == "webdav":
-            import httpx
-
             url = str(payload.webdav_url or "").rstrip("/")
             if not url:
                 raise HTTPException(status_code=400, detail="webdav_url is required")
             auth = None
             if payload.webdav_username:
                 auth = (payload.webdav_username, payload.webdav_password or "")
-            async with httpx.AsyncClient(timeout=6) as client:
-                r = await client.request("PROPFIND", url + "/", auth=auth,
-                                         headers={"Depth": "0"})
+            r = await _shared_http_client().request(
+                "PROPFIND", url + "/", auth=auth, headers={"Depth": "0"}, timeout=6
+            )
             if r.status_code in (207, 200, 301, 302):
-                return {"ok": True, "provider": provider}
+                return _respond({"ok": True, "provider": provider})
             raise HTTPException(status_code=400, detail=f"WebDAV server returned {r.status_code}")
 
         else:
@@ -858,7 +1245,7 @@ async def test_sync_connection(payload: SyncTestPayload):
 @router.get("/insights/config")
 async def get_insights_config():
     try:
-        return get_insights_config_public()
+        return _respond(get_insights_config_public())
     except Exception as e:
         raise _internal_error("Internal server error.", e)
 
@@ -867,7 +1254,7 @@ async def get_insights_config():
 async def save_insights_config(payload: InsightsConfigUpdate):
     try:
         partial = payload.model_dump(exclude_none=True)
-        return update_insights_config(partial)
+        return _respond(update_insights_config(partial))
     except Exception as e:
         raise _bad_request("Invalid request.", e)
 
@@ -878,7 +1265,7 @@ async def run_mcp_autoconfigure(payload: McpAutoconfigPayload):
         from backend.config_watcher import run_first_launch_autoconfigure
 
         result = run_first_launch_autoconfigure(force=bool(payload.force))
-        return {"status": "ok", "result": result}
+        return _respond({"status": "ok", "result": result})
     except Exception as e:
         raise _internal_error("Internal server error.", e)
 
@@ -897,26 +1284,30 @@ async def get_mcp_auth_status():
         client_keys_count = len(client_keys)
         token_configured = bool(str(token or "").strip())
 
-        return {
+        return _respond({
             "token_configured": token_configured,
             "client_keys_count": client_keys_count,
             "allow_snapshot_fallback": allow_snapshot_fallback,
             "auth_mode": "dedicated_keys" if client_keys_count > 0 else "snapshot_token",
-        }
+        })
     except Exception as e:
         raise _internal_error("Failed to get MCP auth status.", e)
 
 
+# Static parts of the one-token "ping" that /insights/test sends; only the model
+# and API key vary per call.
+_PING_MESSAGES = ({"role": "user", "content": "ping"},)
+_ANTHROPIC_BASE_DEFAULT = "https://api.anthropic.com/v1"
+_ANTHROPIC_STATIC_HEADERS = {"anthropic-version": "2023-06-01", "content-type": "application/json"}
+_OLLAMA_BASE_DEFAULT = "http://127.0.0.1:11434"
+_OLLAMA_PING_OPTIONS = {"num_predict": 1}
+_OPENAI_BASE_DEFAULT = "https://api.openai.com/v1"
+_OPENAI_STATIC_HEADERS = {"Content-Type": "application/json"}
+
+
 @router.post("/insights/test")
 async def test_insights_connection():
     """Test the configured LLM connection for memory analysis without running any analysis."""
-    import time
-
-    try:
-        import httpx
-    except ImportError:
-        raise HTTPException(status_code=500, detail="httpx not available")
-
     try:
         config = load_config()
         insights = config.get("insights", {})
@@ -934,50 +1325,27 @@ async def test_insights_connection():
         start = time.monotonic()
 
         if provider == "anthropic":
-            base = (api_base_url or "https://api.anthropic.com/v1").rstrip("/")
-            headers = {
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            }
-            body = {
-                "model": model,
-                "max_tokens": 1,
-                "messages": [{"role": "user", "content": "ping"}],
-            }
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                r = await client.post(f"{base}/messages", headers=headers, json=body)
+            base = (api_base_url or _ANTHROPIC_BASE_DEFAULT).rstrip("/")
+            headers = {"x-api-key": api_key, **_ANTHROPIC_STATIC_HEADERS}
+            body = {"model": model, "max_tokens": 1, "messages": _PING_MESSAGES}
+            r = await _shared_http_client().post(f"{base}/messages", headers=headers, json=body, timeout=10.0)
             r.raise_for_status()
 
         elif provider == "ollama":
-            base = (api_base_url or "http://127.0.0.1:11434").rstrip("/")
-            body = {
-                "model": model,
-                "messages": [{"role": "user", "content": "ping"}],
-                "stream": False,
-                "options": {"num_predict": 1},
-            }
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                r = await client.post(f"{base}/api/chat", json=body)
+            base = (api_base_url or _OLLAMA_BASE_DEFAULT).rstrip("/")
+            body = {"model": model, "messages": _PING_MESSAGES, "stream": False, "options": _OLLAMA_PING_OPTIONS}
+            r = await _shared_http_client().post(f"{base}/api/chat", json=body, timeout=10.0)
             r.raise_for_status()
 
         else:  # openai-compatible
-            base = (api_base_url or "https://api.openai.com/v1").rstrip("/")
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            }
-            body = {
-                "model": model,
-                "messages": [{"role": "user", "content": "ping"}],
-                "max_tokens": 1,
-            }
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                r = await client.post(f"{base}/chat/completions", headers=headers, json=body)
+            base = (api_base_url or _OPENAI_BASE_DEFAULT).rstrip("/")
+            headers = {"Authorization": f"Bearer {api_key}", **_OPENAI_STATIC_HEADERS}
+            body = {"model": model, "messages": _PING_MESSAGES, "max_tokens": 1}
+            r = await _shared_http_client().post(f"{base}/chat/completions", headers=headers, json=body, timeout=10.0)
             r.raise_for_status()
 
         latency_ms = int((time.monotonic() - start) * 1000)
-        return {"ok": True, "provider": provider, "model": model, "latency_ms": latency_ms}
+        return _respond({"ok": True, "provider": provider, "model": model, "latency_ms": latency_ms})
 
     except HTTPException:
         raise
@@ -998,68 +1366,69 @@ async def test_insights_connection():
         raise HTTPException(status_code=400, detail=f"Connection failed: {e}")
 
 
-@router.get("/background/status")
-async def get_background_status(include_heavy: bool = False, db=Depends(get_db_dep)):
-    cfg = load_config(force_reload=True)
-    state = _load_scheduler_state()
-    scan_limits = {
-        "memories": 300000 if include_heavy else 60000,
-        "conversations": 300000 if include_heavy else 60000,
-        "candidates": 500000 if include_heavy else 80000,
-        "sessions": 500000 if include_heavy else 80000,
-        "runtime_metrics": 120000 if include_heavy else 30000,
-        "runtime_recent": 120 if include_heavy else 40,
-    }
-    analysis_runtime = {}
-    analysis_jobs = {"counts": {}, "recent": []}
-    analysis_worker = {}
-    try:
-        from backend.memory.conversation_mining import (
-            get_analysis_llm_gate_status,
-            get_analysis_runtime_status,
-        )
+def _projected_scan(tbl, columns: dict[str, pa.DataType], limit: int) -> pa.Table:
+    """Arrow scan of just `columns`; ones the table does not have come back as nulls."""
+    names = getattr(getattr(tbl, "schema", None), "names", None)
+    present = [name for name in columns if names is None or name in names]
+    table = tbl.search().select(present).limit(max(1, int(limit))).to_arrow()
+    for name, type_ in columns.items():
+        if name not in table.column_names:
+            table = table.append_column(name, pa.nulls(table.num_rows, type_))
+    return table
 
-        analysis_runtime = get_analysis_runtime_status()
-        if isinstance(analysis_runtime, dict):
-            try:
-                gate = await get_analysis_llm_gate_status(preflight=False)
-                analysis_runtime["llm_gate"] = {
-                    "required": bool(gate.get("required", True)),
-                    "analysis_allowed": bool(gate.get("analysis_allowed", True)),
-                    "llm_enabled": bool(gate.get("llm_enabled", False)),
-                    "configured": bool(gate.get("configured", False)),
-                    "reason": gate.get("reason"),
-                    "runtime": gate.get("runtime_public", {}),
-                }
-            except Exception as gate_error:
-                analysis_runtime["llm_gate"] = {
-                    "required": bool(analysis_runtime.get("llm_required", True)),
-                    "analysis_allowed": bool(not analysis_runtime.get("llm_required", True) or analysis_runtime.get("llm_configured", False)),
-                    "llm_enabled": bool(analysis_runtime.get("llm_configured", False)),
-                    "configured": bool(analysis_runtime.get("llm_configured", False)),
-                    "reason": str(gate_error)[:220],
-                    "runtime": {
-                        "provider": str(analysis_runtime.get("llm_provider") or ""),
-                        "model": "",
-                        "api_base_url": "",
-                    },
-                }
-    except Exception:
-        analysis_runtime = {}
-    try:
-        from backend.memory.conversation_analysis_jobs import (
-            get_analysis_jobs_overview,
-            get_analysis_worker_state,
-        )
 
-        analysis_jobs = get_analysis_jobs_overview(limit=12)
-        analysis_worker = get_analysis_worker_state()
-    except Exception:
-        analysis_jobs = {"counts": {}, "recent": []}
-        analysis_worker = {}
+def _normalized_strings(column):
+    return pc.fill_null(pc.utf8_lower(pc.utf8_trim_whitespace(column.cast(pa.string()))), "")
+
+
+def _bool_mask(column) -> np.ndarray:
+    return np.asarray(pc.fill_null(column, False).to_numpy(zero_copy_only=False), dtype=bool)
+
+
+def _rows_with_tag(tags, predicate) -> np.ndarray:
+    """Per row: does any stripped/lowercased tag satisfy `predicate` (an Arrow compute call)?"""
+    if isinstance(tags, pa.ChunkedArray):
+        tags = tags.combine_chunks()
+    hits = np.zeros(len(tags), dtype=bool)
+    flat = _normalized_strings(pc.list_flatten(tags))
+    parents = pc.list_parent_indices(tags).filter(predicate(flat))
+    hits[parents.to_numpy(zero_copy_only=False)] = True
+    return hits
+
+
+def _value_counts(column) -> dict[str, int]:
+    counts = pc.value_counts(column)
+    return dict(zip(counts.field("values").to_pylist(), counts.field("counts").to_pylist()))
+
+
+# Read-only handles for the status scans, reused across polls. A cached handle
+# stays pinned to the version it opened, so it is moved forward with
+# checkout_latest() (about a third of the cost of open_table's schema load);
+# a schema-generation bump (migrations, table rebuilds) forces a reopen.
+_status_table_handles: dict[str, tuple] = {}
+
+
+def _status_table(db, name: str):
+    generation = schema_generation()
+    cached = _status_table_handles.get(name)
+    if cached is not None and cached[0] is db and cached[1] == generation:
+        tbl = cached[2]
+        tbl.checkout_latest()
+        return tbl
+    tbl = db.open_table(name)
+    _status_table_handles[name] = (db, generation, tbl)
+    return tbl
+
+
+_MEMORY_COUNT_COLUMNS = {"status": pa.string(), "source_llm": pa.string(), "tags": pa.list_(pa.string())}
+_CONVERSATION_COUNT_COLUMNS = {"status": pa.string(), "tags": pa.list_(pa.string())}
+_CANDIDATE_COUNT_COLUMNS = {"status": pa.string()}
+
+
+def _scan_memory_counts(db, tables: set[str], limit: int) -> tuple[dict, list[str], list[str]]:
+    """Status/auto-analysis tallies over the memories table, plus its schema columns."""
     memory_schema_columns: list[str] = []
     memory_schema_missing_temporal: list[str] = []
-
     memory_counts = {
         "total": 0,
         "active": 0,
@@ -1069,25 +1438,10 @@ async def get_background_status(include_heavy: bool = False, db=Depends(get_db_d
         "auto_nonarchived": 0,
         "auto_pending_review": 0,
     }
-    conversation_counts = {
-        "total": 0,
-        "active": 0,
-        "tagged_analysis": 0,
-        "tagged_msgcount": 0,
-    }
-    candidate_counts = {
-        "total": 0,
-        "pending": 0,
-        "promoted": 0,
-        "merged": 0,
-        "rejected": 0,
-        "conflict_pending": 0,
-    }
-
     try:
-        if "memories" in db.table_names():
+        if "memories" in tables:
+            mem_tbl = _status_table(db, "memories")
             try:
-                mem_tbl = db.open_table("memories")
                 schema = getattr(mem_tbl, "schema", None)
                 names = list(getattr(schema, "names", []) or [])
                 memory_schema_columns = [str(n) for n in names]
@@ -1097,65 +1451,176 @@ async def get_background_status(include_heavy: bool = False, db=Depends(get_db_d
             except Exception:
                 memory_schema_columns = []
                 memory_schema_missing_temporal = []
-            rows = db.open_table("memories").search().limit(scan_limits["memories"]).to_list()
-            memory_counts["scan_limit"] = int(scan_limits["memories"])
-            memory_counts["scan_rows"] = len(rows)
-            memory_counts["scan_truncated"] = len(rows) >= int(scan_limits["memories"])
-            memory_counts["total"] = len(rows)
-            for row in rows:
-                status = str(row.get("status") or "").strip().lower() or "active"
-                if status in memory_counts:
-                    memory_counts[status] += 1
-                else:
-                    memory_counts[status] = memory_counts.get(status, 0) + 1
-
-                source_llm = str(row.get("source_llm") or "").strip().lower()
-                tags = [str(t) for t in (row.get("tags") or []) if t]
-                has_auto_tag = any(str(t).strip().lower() == "auto:conversation-analysis" for t in tags)
-                is_auto = source_llm.startswith("conversation-analyzer:") or has_auto_tag
-                if is_auto and status != "archived":
-                    memory_counts["auto_nonarchived"] += 1
-                if is_auto and status == "pending_review":
-                    memory_counts["auto_pending_review"] += 1
+            # Only the three tallied columns leave storage; counting happens in Arrow.
+            table = _projected_scan(mem_tbl, _MEMORY_COUNT_COLUMNS, limit)
+            memory_counts["scan_limit"] = int(limit)
+            memory_counts["scan_rows"] = table.num_rows
+            memory_counts["scan_truncated"] = table.num_rows >= int(limit)
+            memory_counts["total"] = table.num_rows
+            status = _normalized_strings(table.column("status"))
+            status = pc.if_else(pc.equal(status, ""), "active", status)
+            for name, count in _value_counts(status).items():
+                memory_counts[name] = memory_counts.get(name, 0) + count
+            is_auto = _bool_mask(
+                pc.starts_with(_normalized_strings(table.column("source_llm")), _ANALYZER_SOURCE_PREFIX)
+            ) | _rows_with_tag(table.column("tags"), lambda flat: pc.equal(flat, _ANALYSIS_TAG))
+            auto_live = is_auto & ~_bool_mask(pc.equal(status, "archived"))
+            memory_counts["auto_nonarchived"] += int(auto_live.sum())
+            memory_counts["auto_pending_review"] += int((auto_live & _bool_mask(pc.equal(status, "pending_review"))).sum())
     except Exception as e:
         memory_counts["error"] = "unavailable"
         logger.warning(f"Failed to collect memory counts: {e}")
+    return memory_counts, memory_schema_columns, memory_schema_missing_temporal
+
 
+def _scan_conversation_counts(db, tables: set[str], limit: int) -> dict:
+    """Active/analysis-tag tallies over the conversations table."""
+    conversation_counts = {
+        "total": 0,
+        "active": 0,
+        "tagged_analysis": 0,
+        "tagged_msgcount": 0,
+    }
     try:
-        if "conversations" in db.table_names():
-            rows = db.open_table("conversations").search().limit(scan_limits["conversations"]).to_list()
-            conversation_counts["scan_limit"] = int(scan_limits["conversations"])
-            conversation_counts["scan_rows"] = len(rows)
-            conversation_counts["scan_truncated"] = len(rows) >= int(scan_limits["conversations"])
-            conversation_counts["total"] = len(rows)
-            for row in rows:
-                status = str(row.get("status") or "").strip().lower()
-                if status != "deleted":
-                    conversation_counts["active"] += 1
-                tags = [str(t) for t in (row.get("tags") or []) if t]
-                has_analysis, has_msgcount = _analysis_tag_info(tags)
-                if has_analysis:
-                    conversation_counts["tagged_analysis"] += 1
-                if has_msgcount:
-                    conversation_counts["tagged_msgcount"] += 1
+        if "conversations" in tables:
+            table = _projected_scan(_status_table(db, "conversations"), _CONVERSATION_COUNT_COLUMNS, limit)
+            conversation_counts["scan_limit"] = int(limit)
+            conversation_counts["scan_rows"] = table.num_rows
+            conversation_counts["scan_truncated"] = table.num_rows >= int(limit)
+            conversation_counts["total"] = table.num_rows
+            deleted = _bool_mask(pc.equal(_normalized_strings(table.column("status")), "deleted"))
+            conversation_counts["active"] += int((~deleted).sum())
+            tags = table.column("tags")
+            conversation_counts["tagged_analysis"] += int(
+                _rows_with_tag(tags, lambda flat: pc.equal(flat, _ANALYSIS_TAG)).sum()
+            )
+            conversation_counts["tagged_msgcount"] += int(
+                _rows_with_tag(tags, lambda flat: pc.starts_with(flat, _ANALYSIS_MSGCOUNT_PREFIX)).sum()
+            )
     except Exception as e:
         conversation_counts["error"] = "unavailable"
         logger.warning(f"Failed to collect conversation counts: {e}")
+    return conversation_counts
 
+
+def _scan_candidate_counts(db, tables: set[str], limit: int) -> dict:
+    """Status tallies over the conversation analysis candidates table."""
+    candidate_counts = {
+        "total": 0,
+        "pending": 0,
+        "promoted": 0,
+        "merged": 0,
+        "rejected": 0,
+        "conflict_pending": 0,
+    }
     try:
-        if "conversation_analysis_candidates" in db.table_names():
-            rows = db.open_table("conversation_analysis_candidates").search().limit(scan_limits["candidates"]).to_list()
-            candidate_counts["scan_limit"] = int(scan_limits["candidates"])
-            candidate_counts["scan_rows"] = len(rows)
-            candidate_counts["scan_truncated"] = len(rows) >= int(scan_limits["candidates"])
-            candidate_counts["total"] = len(rows)
-            for row in rows:
-                status = str(row.get("status") or "").strip().lower()
-                if status in candidate_counts:
-                    candidate_counts[status] += 1
+        if "conversation_analysis_candidates" in tables:
+            table = _projected_scan(
+                _status_table(db, "conversation_analysis_candidates"), _CANDIDATE_COUNT_COLUMNS, limit
+            )
+            candidate_counts["scan_limit"] = int(limit)
+            candidate_counts["scan_rows"] = table.num_rows
+            candidate_counts["scan_truncated"] = table.num_rows >= int(limit)
+            candidate_counts["total"] = table.num_rows
+            tracked = ("pending", "promoted", "merged", "rejected", "conflict_pending")
+            for status, count in _value_counts(_normalized_strings(table.column("status"))).items():
+                if status in tracked:
+                    candidate_counts[status] += count
     except Exception as e:
         candidate_counts["error"] = "unavailable"
         logger.warning(f"Failed to collect candidate counts: {e}")
+    return candidate_counts
+
+
+async def _analysis_runtime_status() -> dict:
+    """Conversation-analysis runtime status with its LLM gate, both fetched concurrently."""
+    try:
+        analysis_runtime, gate = await asyncio.gather(
+            asyncio.to_thread(get_analysis_runtime_status),
+            get_analysis_llm_gate_status(preflight=False),
+            return_exceptions=True,
+        )
+    except Exception:
+        return {}
+    if isinstance(analysis_runtime, BaseException):
+        return {}
+    if isinstance(analysis_runtime, dict):
+        if not isinstance(gate, BaseException):
+            analysis_runtime["llm_gate"] = {
+                "required": bool(gate.get("required", True)),
+                "analysis_allowed": bool(gate.get("analysis_allowed", True)),
+                "llm_enabled": bool(gate.get("llm_enabled", False)),
+                "configured": bool(gate.get("configured", False)),
+                "reason": gate.get("reason"),
+                "runtime": gate.get("runtime_public", {}),
+            }
+        else:
+            analysis_runtime["llm_gate"] = {
+                "required": bool(analysis_runtime.get("llm_required", True)),
+                "analysis_allowed": bool(not analysis_runtime.get("llm_required", True) or analysis_runtime.get("llm_configured", False)),
+                "llm_enabled": bool(analysis_runtime.get("llm_configured", False)),
+                "configured": bool(analysis_runtime.get("llm_configured", False)),
+                "reason": str(gate)[:220],
+                "runtime": {
+                    "provider": str(analysis_runtime.get("llm_provider") or ""),
+                    "model": "",
+                    "api_base_url": "",
+                },
+            }
+    return analysis_runtime
+
+
+def _analysis_jobs_status() -> tuple[dict, dict]:
+    try:
+        return get_analysis_jobs_overview(limit=12), get_analysis_worker_state()
+    except Exception:
+        return {"counts": {}, "recent": []}, {}
+
+
+# Lite /background/status payloads are reused for a few seconds, so dashboards
+# polling every couple of seconds share one round of table scans. Heavy mode
+# always recomputes; admin writes to config or scheduler state drop the entry.
+_LITE_STATUS_TTL_SECONDS = 3.0
+_lite_status_cache: tuple[float, Any, dict] | None = None
+_lite_status_lock = asyncio.Lock()
+
+
+def _invalidate_status_cache() -> None:
+    global _lite_status_cache
+    _lite_status_cache = None
+
+
+async def _cached_lite_status(db) -> dict:
+    global _lite_status_cache
+    async with _lite_status_lock:
+        cached = _lite_status_cache
+        if cached is not None and cached[1] is db and time.monotonic() - cached[0] < _LITE_STATUS_TTL_SECONDS:
+            return cached[2]
+        content = await _build_background_status(False, db)
+        _lite_status_cache = (time.monotonic(), db, content)
+        return content
+
+
+@router.get("/background/status")
+async def get_background_status(request: Request, include_heavy: bool = False, db=Depends(get_db_dep)):
+    if include_heavy:
+        content = await _build_background_status(True, db)
+    else:
+        content = await _cached_lite_status(db)
+    return _conditional_respond(request, content, volatile=(content["security"]["runtime"].get("generated_at"),))
+
+
+async def _build_background_status(include_heavy: bool, db) -> dict:
+    cfg = load_config(force_reload=True)
+    state = _load_scheduler_state()
+    scan_limits = {
+        "memories": 300000 if include_heavy else 60000,
+        "conversations": 300000 if include_heavy else 60000,
+        "candidates": 500000 if include_heavy else 80000,
+        "sessions": 500000 if include_heavy else 80000,
+        "runtime_metrics": 120000 if include_heavy else 30000,
+        "runtime_recent": 120 if include_heavy else 40,
+    }
 
     auto_cfg = cfg.get("conversation_analysis", {}) if isinstance(cfg.get("conversation_analysis"), dict) else {}
     auto_stats = state.get("last_auto_conversation_analysis_stats", {})
@@ -1186,18 +1651,48 @@ async def get_background_status(include_heavy: bool = False, db=Depends(get_db_d
     security_last_result = state.get("last_security_audit_result")
     if not isinstance(security_last_result, dict):
         security_last_result = {}
-    if include_heavy and not security_last_result:
+    run_audit = include_heavy and not security_last_result
+
+    async def _security_audit() -> dict:
+        if not run_audit:
+            return security_last_result
         try:
-            security_last_result = collect_security_audit(config=cfg)
+            return await asyncio.to_thread(collect_security_audit, config=cfg)
         except Exception:
-            security_last_result = {}
+            return {}
 
-    client_observability = _collect_client_observability(
-        db,
-        cfg,
-        session_limit=scan_limits["sessions"],
-        runtime_history_limit=scan_limits["runtime_metrics"],
-        runtime_recent_limit=scan_limits["runtime_recent"],
+    try:
+        tables = set(db.table_names())
+    except Exception as e:
+        tables = set()
+        logger.warning(f"Failed to list tables for background status: {e}")
+
+    # Every section below is an independent blocking read (LanceDB scans, job state,
+    # the audit): run them all side by side in worker threads, so the response takes
+    # as long as the slowest one and the event loop stays free.
+    (
+        analysis_runtime,
+        (analysis_jobs, analysis_worker),
+        (memory_counts, memory_schema_columns, memory_schema_missing_temporal),
+        conversation_counts,
+        candidate_counts,
+        security_last_result,
+        client_observability,
+    ) = await asyncio.gather(
+        _analysis_runtime_status(),
+        asyncio.to_thread(_analysis_jobs_status),
+        asyncio.to_thread(_scan_memory_counts, db, tables, scan_limits["memories"]),
+        asyncio.to_thread(_scan_conversation_counts, db, tables, scan_limits["conversations"]),
+        asyncio.to_thread(_scan_candidate_counts, db, tables, scan_limits["candidates"]),
+        _security_audit(),
+        asyncio.to_thread(
+            _collect_client_observability,
+            db,
+            cfg,
+            session_limit=scan_limits["sessions"],
+            runtime_history_limit=scan_limits["runtime_metrics"],
+            runtime_recent_limit=scan_limits["runtime_recent"],
+        ),
     )
     release_gates = _release_gates(
         security_result=security_last_result,
@@ -1205,7 +1700,6 @@ async def get_background_status(include_heavy: bool = False, db=Depends(get_db_d
         client_observability=client_observability,
     )
     remote_access = get_remote_access_status()
-
     return {
         "config": {
             "config_path": CONFIG_PATH,
@@ -1262,57 +1756,82 @@ async def get_background_status(include_heavy: bool = False, db=Depends(get_db_d
     }
 
 
-@router.get("/security/status")
-async def get_security_status():
-    cfg = load_config(force_reload=True)
+def get_config_dep() -> dict:
+    """FastAPI dependency: the current config, reloaded when the file changed on disk."""
+    return load_config(force_reload=True)
+
+
+def get_scheduler_state_dep() -> dict:
+    """FastAPI dependency: the scheduler state file, read once per request."""
+    return _load_scheduler_state()
+
+
+def _record_security_audit(cfg: dict) -> dict:
+    """Run the security audit against `cfg` and persist it as the latest result."""
+    report = collect_security_audit(config=cfg)
     state = _load_scheduler_state()
+    state["last_security_audit"] = report.get("generated_at")
+    state["last_security_audit_result"] = report
+    _save_scheduler_state(state)
+    return report
+
+
+def _persist_security_config(cfg: dict, security: dict, *, config_changed: bool = False) -> dict:
+    """
+    Store `security` in cfg and record a fresh audit against it. The config file is
+    only rewritten when something actually changed. Blocking; run it in a worker thread.
+    """
+    if config_changed or security != cfg.get("security"):
+        cfg["security"] = security
+        save_config(cfg)
+        _invalidate_status_cache()
+    return _record_security_audit(cfg)
+
+
+@router.get("/security/status")
+async def get_security_status(
+    request: Request,
+    cfg: dict = Depends(get_config_dep),
+    state: dict = Depends(get_scheduler_state_dep),
+):
     latest = state.get("last_security_audit_result")
     if not isinstance(latest, dict):
         latest = collect_security_audit(config=cfg)
-    return {
+    runtime = security_runtime_overview(cfg)
+    return _conditional_respond(request, {
         "config_path": CONFIG_PATH,
-        "runtime": security_runtime_overview(cfg),
+        "runtime": runtime,
         "last_audit": state.get("last_security_audit"),
         "audit": latest,
-    }
+    }, volatile=(runtime.get("generated_at"),))
 
 
 @router.get("/security/config")
-async def get_security_config():
-    cfg = load_config(force_reload=True)
+async def get_security_config(cfg: dict = Depends(get_config_dep)):
     security = cfg.get("security", {}) if isinstance(cfg.get("security"), dict) else {}
-    return {
+    return _respond({
         "status": "ok",
         "security": security,
         "runtime": security_runtime_overview(cfg),
-    }
+    })
 
 
 @router.post("/security/config")
-async def update_security_config(payload: SecurityConfigUpdate):
-    cfg = load_config(force_reload=True)
+async def update_security_config(payload: SecurityConfigUpdate, cfg: dict = Depends(get_config_dep)):
     patch = payload.model_dump(exclude_none=True)
     current_security = cfg.get("security", {}) if isinstance(cfg.get("security"), dict) else {}
-    cfg["security"] = _merge_security_config(current_security, patch)
-    save_config(cfg)
+    report = await asyncio.to_thread(_persist_security_config, cfg, _merge_security_config(current_security, patch))
 
-    report = collect_security_audit(config=cfg)
-    state = _load_scheduler_state()
-    state["last_security_audit"] = report.get("generated_at")
-    state["last_security_audit_result"] = report
-    _save_scheduler_state(state)
-
-    return {
+    return _respond({
         "status": "ok",
         "security": cfg.get("security", {}),
         "runtime": security_runtime_overview(cfg),
         "audit": report,
-    }
+    })
 
 
 @router.post("/security/harden")
-async def harden_security_config(payload: SecurityHardenPayload):
-    cfg = load_config(force_reload=True)
+async def harden_security_config(payload: SecurityHardenPayload, cfg: dict = Depends(get_config_dep)):
     bootstrap_meta = {"created": False, "reason": "disabled"}
     if payload.bootstrap_bridge_key:
         bootstrap_meta = bootstrap_bridge_mcp_key(config=cfg)
@@ -1325,16 +1844,14 @@ async def harden_security_config(payload: SecurityHardenPayload):
             "forced_snapshot_mcp_fallback_disabled": True,
         }
     current_security = cfg.get("security", {}) if isinstance(cfg.get("security"), dict) else {}
-    cfg["security"] = _merge_security_config(current_security, strict_patch)
-    save_config(cfg)
-
-    report = collect_security_audit(config=cfg)
-    state = _load_scheduler_state()
-    state["last_security_audit"] = report.get("generated_at")
-    state["last_security_audit_result"] = report
-    _save_scheduler_state(state)
+    report = await asyncio.to_thread(
+        _persist_security_config,
+        cfg,
+        _merge_security_config(current_security, strict_patch),
+        config_changed=bool(bootstrap_meta.get("created")),
+    )
 
-    return {
+    return _respond({
         "status": "ok",
         "meta": {
             **(meta if isinstance(meta, dict) else {}),
@@ -1343,27 +1860,22 @@ async def harden_security_config(payload: SecurityHardenPayload):
         "security": cfg.get("security", {}),
         "runtime": security_runtime_overview(cfg),
         "audit": report,
-    }
+    })
 
 
 @router.post("/security/audit/run")
-async def run_security_audit():
-    cfg = load_config(force_reload=True)
-    report = collect_security_audit(config=cfg)
-    state = _load_scheduler_state()
-    state["last_security_audit"] = report.get("generated_at")
-    state["last_security_audit_result"] = report
-    _save_scheduler_state(state)
-    return {"status": "ok", "audit": report}
+async def run_security_audit(cfg: dict = Depends(get_config_dep)):
+    report = await asyncio.to_thread(_record_security_audit, cfg)
+    return _respond({"status": "ok", "audit": report})
 
 
 @router.get("/remote/status")
 async def get_remote_status():
-    return {
+    return _respond({
         "status": "disabled",
         "mode": "byo_tunnel",
         "message": "Managed relay is disabled. Use BYO tunnel (see BYO_TUNNEL.md).",
-    }
+    })
 
 
 @router.post("/remote/config")
@@ -1384,20 +1896,6 @@ async def poll_remote_now():
 
 @router.post("/background/analysis/run")
 async def run_background_analysis_now(payload: RunBackgroundAnalysisPayload):
-    try:
-        from backend.memory.conversation_analysis_jobs import (
-            enqueue_analysis_job,
-            get_analysis_job,
-            get_analysis_jobs_overview,
-            get_analysis_worker_state,
-        )
-        from backend.memory.conversation_mining import (
-            get_analysis_llm_gate_status,
-            get_analysis_runtime_status,
-        )
-    except Exception as e:
-        raise _internal_error("Internal server error.", e)
-
     cfg = load_config(force_reload=True)
     auto_cfg = cfg.get("conversation_analysis", {}) if isinstance(cfg.get("conversation_analysis"), dict) else {}
     provider = payload.provider or str(auto_cfg.get("provider", "auto"))
@@ -1464,29 +1962,22 @@ async def run_background_analysis_now(payload: RunBackgroundAnalysisPayload):
         job_id = str(job.get("id") or "")
 
         if payload.wait_for_completion and job_id:
-            deadline = asyncio.get_running_loop().time() + 1800.0
-            while asyncio.get_running_loop().time() < deadline:
-                current = get_analysis_job(job_id)
-                if not current:
-                    await asyncio.sleep(0.6)
-                    continue
-                current_status = str(current.get("status") or "").strip().lower()
-                if current_status in {"completed", "failed", "cancelled"}:
-                    if current_status == "completed":
-                        return {
-                            "status": "ok",
-                            "trigger": "manual",
-                            "job": current,
-                            "result": current.get("result", {}),
-                        }
-                    return {
-                        "status": current_status,
-                        "trigger": "manual",
-                        "job": current,
-                        "message": current.get("error") or "Conversation analysis did not complete successfully.",
-                    }
-                await asyncio.sleep(0.6)
-            current = get_analysis_job(job_id)
+            current = await wait_for_analysis_job(job_id, timeout=1800.0)
+            current_status = str((current or {}).get("status") or "").strip().lower()
+            if current_status == "completed":
+                return {
+                    "status": "ok",
+                    "trigger": "manual",
+                    "job": current,
+                    "result": current.get("result", {}),
+                }
+            if current_status in {"failed", "cancelled"}:
+                return {
+                    "status": current_status,
+                    "trigger": "manual",
+                    "job": current,
+                    "message": current.get("error") or "Conversation analysis did not complete successfully.",
+                }
             return {
                 "status": "accepted",
                 "trigger": "manual",
@@ -1524,8 +2015,6 @@ async def run_background_analysis_now(payload: RunBackgroundAnalysisPayload):
 @router.get("/background/analysis/jobs")
 async def list_background_analysis_jobs(limit: int = 20):
     try:
-        from backend.memory.conversation_analysis_jobs import get_analysis_jobs_overview
-
         return get_analysis_jobs_overview(limit=limit)
     except Exception as e:
         raise _internal_error("Internal server error.", e)
@@ -1534,8 +2023,6 @@ async def list_background_analysis_jobs(limit: int = 20):
 @router.post("/background/analysis/jobs/{job_id}/cancel")
 async def cancel_background_analysis_job(job_id: str):
     try:
-        from backend.memory.conversation_analysis_jobs import cancel_analysis_job
-
         job = await cancel_analysis_job(job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -1562,51 +2049,26 @@ async def deduplicate_conversations(payload: DeduplicateConversationsPayload, db
 
     conv_tbl = db.open_table("conversations")
     conv_rows = conv_tbl.search().limit(500000).to_list()
-    conv_by_key: dict[tuple, dict] = {}
-    conv_dup = 0
-    conv_duplicate_ids_preview: list[str] = []
-    for row in conv_rows:
-        key = _conversation_key(row)
-        existing = conv_by_key.get(key)
-        if existing is None:
-            conv_by_key[key] = row
-            continue
-        conv_dup += 1
-        dup_id = row.get("id")
-        if dup_id and len(conv_duplicate_ids_preview) < 40:
-            conv_duplicate_ids_preview.append(str(dup_id))
-        if _is_newer(row, existing):
-            conv_by_key[key] = row
+    conv_kept, conv_dup, conv_duplicate_ids_preview = _dedupe_newest(conv_rows, _conversation_key)
 
     msg_rows: list[dict] = []
-    msg_by_key: dict[tuple, dict] = {}
+    msg_kept_rows: list[dict] = []
     msg_dup = 0
     msg_duplicate_ids_preview: list[str] = []
     if payload.include_messages and "messages" in db.table_names():
         msg_tbl = db.open_table("messages")
         msg_rows = msg_tbl.search().limit(2000000).to_list()
-        for row in msg_rows:
-            key = _message_key(row)
-            existing = msg_by_key.get(key)
-            if existing is None:
-                msg_by_key[key] = row
-                continue
-            msg_dup += 1
-            dup_id = row.get("id")
-            if dup_id and len(msg_duplicate_ids_preview) < 40:
-                msg_duplicate_ids_preview.append(str(dup_id))
-            if _is_newer(row, existing):
-                msg_by_key[key] = row
+        msg_kept_rows, msg_dup, msg_duplicate_ids_preview = _dedupe_newest(msg_rows, _message_key)
 
     if payload.dry_run:
         return {
             "status": "ok",
             "dry_run": True,
             "conversations_total": len(conv_rows),
-            "conversations_kept": len(conv_by_key),
+            "conversations_kept": len(conv_kept),
             "conversations_duplicates": conv_dup,
             "messages_total": len(msg_rows),
-            "messages_kept": len(msg_by_key),
+            "messages_kept": len(msg_kept_rows),
             "messages_duplicates": msg_dup,
             "conversation_duplicate_ids_preview": conv_duplicate_ids_preview,
             "message_duplicate_ids_preview": msg_duplicate_ids_preview,
@@ -1614,7 +2076,7 @@ async def deduplicate_conversations(payload: DeduplicateConversationsPayload, db
 
     async def _write_op():
         db_write = db
-        conv_clean = [_sanitize_conversation_row(r) for r in conv_by_key.values()]
+        conv_clean = [_sanitize_conversation_row(r) for r in conv_kept]
         conv_clean.sort(key=lambda x: x.started_at, reverse=True)
 
         db_write.drop_table("conversations")
@@ -1622,14 +2084,15 @@ async def deduplicate_conversations(payload: DeduplicateConversationsPayload, db
         if conv_clean:
             db_write.open_table("conversations").add(conv_clean)
 
-        msg_kept = len(msg_by_key)
+        msg_kept = len(msg_kept_rows)
         if payload.include_messages and "messages" in db_write.table_names():
-            msg_clean = [_sanitize_message_row(r) for r in msg_by_key.values()]
+            msg_clean = [_sanitize_message_row(r) for r in msg_kept_rows]
             db_write.drop_table("messages")
             db_write.create_table("messages", schema=Message)
             if msg_clean:
                 db_write.open_table("messages").add(msg_clean)
             msg_kept = len(msg_clean)
+        bump_schema_generation()
 
         return {
             "status": "ok",
@@ -1750,6 +2213,7 @@ async def purge_conversations(payload: PurgeConversationsPayload, db=Depends(get
             if "messages" in db_write.table_names():
                 db_write.drop_table("messages")
             db_write.create_table("messages", schema=Message)
+        bump_schema_generation()
 
         return {
             "status": "ok",
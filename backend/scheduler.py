@@ -149,9 +149,13 @@ async def run_weekly_maintenance():
             cutoff = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
             try:
                 sessions_tbl = db.open_table("sessions")
+                from backend.memory.sessions import compact_session_activity
                 from backend.memory.write_queue import enqueue_write
 
                 async def _write_op():
+                    folded = compact_session_activity(db)
+                    if folded:
+                        logger.info(f"Folded {folded} session activity events into sessions")
                     sessions_tbl.delete(f"ended_at IS NOT NULL AND ended_at < '{cutoff}'")
 
                 await enqueue_write(_write_op)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import copy
 import hashlib
 import io
@@ -60,6 +61,7 @@ SYNC_TABLES = [
     "conflicts",
     "pending_conflicts",
     "sessions",
+    "session_activity_events",
     "context_route_logs",
     "memory_graph_edges",
     "memory_events",
@@ -488,7 +490,8 @@ async def run_sync_now(passphrase: Optional[str] = None, source: str = "manual")
         raise ValueError("Sync key is locked. Provide passphrase first.")
 
     try:
-        remote_doc = download_latest_encrypted_snapshot(sync_cfg)
+        # Storage backends use blocking clients (boto3, sync httpx); keep them off the event loop.
+        remote_doc = await asyncio.to_thread(download_latest_encrypted_snapshot, sync_cfg)
         merge_report = {
             "memories_added": 0,
             "memories_updated": 0,
@@ -527,7 +530,7 @@ async def run_sync_now(passphrase: Optional[str] = None, source: str = "manual")
             "payload": encrypted_payload,
         }
         key_name = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}_{sync_cfg.get('device_id', 'device')}"
-        upload_info = upload_encrypted_snapshot(sync_cfg, snapshot_document, key_name=key_name)
+        upload_info = await asyncio.to_thread(upload_encrypted_snapshot, sync_cfg, snapshot_document, key_name=key_name)
 
         report = {
             "status": "ok",
@@ -233,6 +233,9 @@ export interface RemoteAccessConfig {
     poll_interval_seconds: number
     request_timeout_seconds: number
     max_tasks_per_poll: number
+    max_task_concurrency?: number
+    signature_alg?: 'hmac-sha256' | 'b2b-256'
+    wire_format?: 'json' | 'msgpack'
     has_device_secret?: boolean
 }
 
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import threading
+
+import pyarrow as pa
+import pytest
+from starlette.requests import Request
+
+from backend.routers import admin
+
+
+def _request(**headers):
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+class FakeDb:
+    def table_names(self):
+        return []
+
+
+@pytest.fixture
+def quiet_status(monkeypatch):
+    monkeypatch.setattr(admin, "load_config", lambda force_reload=False: {})
+    monkeypatch.setattr(admin, "_load_scheduler_state", lambda: {})
+    monkeypatch.setattr(admin, "_collect_client_observability", lambda db, cfg, **_: {"clients": [], "summary": {}})
+    monkeypatch.setattr(admin, "get_remote_access_status", lambda: {})
+    monkeypatch.setattr(admin, "_lite_status_cache", None)
+    monkeypatch.setattr(admin, "_lite_status_lock", asyncio.Lock())
+    return monkeypatch
+
+
+def test_table_scans_run_concurrently_off_the_event_loop(quiet_status):
+    barrier = threading.Barrier(3, timeout=5)
+    threads = []
+
+    def _scan(result):
+        def _run(db, tables, limit):
+            threads.append(threading.current_thread() is threading.main_thread())
+            barrier.wait()
+            return result
+        return _run
+
+    quiet_status.setattr(admin, "_scan_memory_counts", _scan(({"total": 3}, ["id"], [])))
+    quiet_status.setattr(admin, "_scan_conversation_counts", _scan({"total": 2}))
+    quiet_status.setattr(admin, "_scan_candidate_counts", _scan({"total": 1}))
+
+    status = json.loads(asyncio.run(admin.get_background_status(_request(), include_heavy=False, db=FakeDb())).body)
+
+    assert threads == [False, False, False]
+    assert status["counts"]["memories"]["total"] == 3
+    assert status["counts"]["conversations"]["total"] == 2
+    assert status["counts"]["analysis_candidates"]["total"] == 1
+
+
+_ROW_SCHEMA = pa.schema(
+    [("status", pa.string()), ("source_llm", pa.string()), ("tags", pa.list_(pa.string())), ("content", pa.string())]
+)
+
+
+class _RowsQuery:
+    def __init__(self, rows, columns=None):
+        self._rows = rows
+        self.columns = columns
+
+    def select(self, columns):
+        self.columns = list(columns)
+        return self
+
+    def limit(self, n):
+        self._rows = self._rows[: int(n)]
+        return self
+
+    def to_arrow(self):
+        schema = pa.schema([_ROW_SCHEMA.field(name) for name in self.columns])
+        return pa.Table.from_pylist([{c: row.get(c) for c in self.columns} for row in self._rows], schema=schema)
+
+
+class _RowsTable:
+    schema = _ROW_SCHEMA
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.checkouts = 0
+
+    def checkout_latest(self):
+        self.checkouts += 1
+
+    def search(self):
+        self.queries.append(_RowsQuery(self.rows))
+        return self.queries[-1]
+
+
+class _RowsDb:
+    def __init__(self, **tables):
+        self.tables = {name: _RowsTable(rows) for name, rows in tables.items()}
+        self.opened = []
+
+    def table_names(self):
+        return list(self.tables)
+
+    def open_table(self, name):
+        self.opened.append(name)
+        return self.tables[name]
+
+
+def test_memory_counts_tally_statuses_and_auto_memories():
+    rows = [
+        {"status": "active", "source_llm": "Conversation-Analyzer:gpt", "tags": []},
+        {"status": " Pending_Review ", "source_llm": "claude", "tags": [None, "auto:conversation-analysis"]},
+        {"status": "pending_review", "source_llm": "claude", "tags": ["other"]},
+        {"status": "archived", "source_llm": "conversation-analyzer:x", "tags": []},
+        {"status": None, "source_llm": None, "tags": None},
+        {"status": "snoozed", "source_llm": "", "tags": []},
+    ]
+
+    db = _RowsDb(memories=rows)
+    counts, columns, _ = admin._scan_memory_counts(db, set(db.tables), 10)
+
+    assert db.tables["memories"].queries[0].columns == ["status", "source_llm", "tags"]
+    assert "content" in columns
+
+    assert counts["total"] == 6 and counts["scan_truncated"] is False
+    assert counts["active"] == 2 and counts["pending_review"] == 2
+    assert counts["archived"] == 1 and counts["rejected"] == 0 and counts["snoozed"] == 1
+    assert counts["auto_nonarchived"] == 2 and counts["auto_pending_review"] == 1
+
+
+def test_candidate_counts_only_track_known_statuses():
+    rows = [{"status": "pending"}, {"status": "Pending"}, {"status": "merged"}, {"status": "total"}, {}]
+
+    db = _RowsDb(conversation_analysis_candidates=rows)
+
+    counts = admin._scan_candidate_counts(db, set(db.tables), 10)
+
+    assert counts["total"] == 5
+    assert counts["pending"] == 2 and counts["merged"] == 1 and counts["promoted"] == 0
+
+
+def test_conversation_counts_read_status_and_tags_only():
+    rows = [
+        {"status": "active", "tags": ["auto:conversation-analysis", "auto:conversation-analysis:msgcount:4"]},
+        {"status": " DELETED ", "tags": [" Auto:Conversation-Analysis "]},
+        {"status": None, "tags": None},
+    ]
+    db = _RowsDb(conversations=rows)
+
+    counts = admin._scan_conversation_counts(db, set(db.tables), 2)
+
+    assert db.tables["conversations"].queries[0].columns == ["status", "tags"]
+    assert counts["total"] == 2 and counts["scan_truncated"] is True
+    assert counts["active"] == 1
+    assert counts["tagged_analysis"] == 2 and counts["tagged_msgcount"] == 1
+
+
+def test_status_scans_reuse_table_handles_until_the_schema_changes(monkeypatch):
+    monkeypatch.setattr(admin, "_status_table_handles", {})
+    db = _RowsDb(conversations=[{"status": "active", "tags": []}])
+    tbl = db.tables["conversations"]
+
+    admin._scan_conversation_counts(db, {"conversations"}, 10)
+    admin._scan_conversation_counts(db, {"conversations"}, 10)
+    assert db.opened == ["conversations"] and tbl.checkouts == 1
+
+    admin.bump_schema_generation()
+    admin._scan_conversation_counts(db, {"conversations"}, 10)
+    assert db.opened == ["conversations", "conversations"]
+
+
+def test_analysis_status_falls_back_when_the_gate_fails(monkeypatch):
+    async def _failing_gate(preflight=False):
+        raise RuntimeError("gate offline")
+
+    monkeypatch.setattr(
+        admin,
+        "get_analysis_runtime_status",
+        lambda: {"llm_required": True, "llm_configured": False, "llm_provider": "ollama"},
+    )
+    monkeypatch.setattr(admin, "get_analysis_llm_gate_status", _failing_gate)
+
+    status = asyncio.run(admin._analysis_runtime_status())
+
+    assert status["llm_gate"]["reason"] == "gate offline"
+    assert status["llm_gate"]["analysis_allowed"] is False
+    assert status["llm_gate"]["runtime"]["provider"] == "ollama"
+
+
+def test_admin_routes_render_through_the_fast_json_response():
+    routes = [route for route in admin.router.routes if getattr(route, "path", "").endswith("/background/status")]
+
+    assert routes and routes[0].response_class is admin._FAST_JSON_RESPONSE
+
+
+def test_direct_responses_fall_back_to_jsonable_encoder_for_unusual_values():
+    class Payload(admin.BaseModel):
+        name: str
+
+    response = admin._respond({"ids": frozenset(["a"]), "model": Payload(name="x"), 1: "one"})
+
+    assert json.loads(response.body) == {"ids": ["a"], "model": {"name": "x"}, "1": "one"}
+
+
+def test_unchanged_status_polls_get_a_304(quiet_status):
+    for name in ("_scan_memory_counts", "_scan_conversation_counts", "_scan_candidate_counts"):
+        quiet_status.setattr(admin, name, lambda db, tables, limit, _name=name: (
+            ({"total": 0}, [], []) if _name == "_scan_memory_counts" else {"total": 0}
+        ))
+
+    first = asyncio.run(admin.get_background_status(_request(), db=FakeDb()))
+    etag = first.headers["etag"]
+    again = asyncio.run(admin.get_background_status(_request(if_none_match=f"W/{etag}"), db=FakeDb()))
+    stale = asyncio.run(admin.get_background_status(_request(if_none_match='"other"'), db=FakeDb()))
+
+    assert first.status_code == 200 and first.headers["cache-control"] == "no-cache"
+    assert again.status_code == 304 and again.body == b"" and again.headers["etag"] == etag
+    assert stale.status_code == 200 and stale.headers["etag"] == etag
+
+
+def test_lite_status_is_reused_within_the_ttl(quiet_status):
+    scans = []
+
+    def _scan(db, tables, limit):
+        scans.append(limit)
+        return {"total": len(scans)}
+
+    quiet_status.setattr(admin, "_scan_memory_counts", lambda db, tables, limit: ({"total": 0}, [], []))
+    quiet_status.setattr(admin, "_scan_conversation_counts", _scan)
+    quiet_status.setattr(admin, "_scan_candidate_counts", lambda db, tables, limit: {"total": 0})
+    db = FakeDb()
+
+    async def _conversation_totals(*calls):
+        totals = []
+        for include_heavy in calls:
+            response = await admin.get_background_status(_request(), include_heavy=include_heavy, db=db)
+            totals.append(json.loads(response.body)["counts"]["conversations"]["total"])
+        return totals
+
+    assert asyncio.run(_conversation_totals(False, False, True, False)) == [1, 1, 2, 1]
+    admin._invalidate_status_cache()
+    assert asyncio.run(_conversation_totals(False)) == [3]
@@ -0,0 +1,350 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pytest
+from starlette.requests import Request
+
+from backend.database.schema import ClientRuntimeMetric, Session
+from backend.routers import admin
+
+_SCHEMAS = {
+    "client_runtime_metrics": ClientRuntimeMetric.to_arrow_schema(),
+    "sessions": Session.to_arrow_schema(),
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_request_metrics_cache(monkeypatch):
+    monkeypatch.setattr(admin, "_request_metrics_cache", None)
+
+
+class FakeQuery:
+    def __init__(self, rows, columns=None, schema=None):
+        self._rows = list(rows)
+        self._columns = columns
+        self._schema = schema
+        self.clauses = []
+
+    def where(self, clause):
+        self.clauses.append(clause)
+        return self
+
+    def select(self, columns):
+        self._columns = list(columns)
+        return self
+
+    def limit(self, n):
+        self._rows = self._rows[: int(n)]
+        return self
+
+    def to_list(self):
+        if self._columns is None:
+            return [dict(row) for row in self._rows]
+        return [{c: row.get(c) for c in self._columns} for row in self._rows]
+
+    def to_arrow(self):
+        rows = self.to_list()
+        columns = self._columns or sorted({key for row in rows for key in row})
+        if self._schema is None:
+            return pa.table({c: [row.get(c) for row in rows] for c in columns})
+        schema = pa.schema([self._schema.field(c).with_nullable(True) for c in columns])
+        return pa.Table.from_pylist([{c: row.get(c) for c in columns} for row in rows], schema=schema)
+
+
+class FakeTable:
+    def __init__(self, rows, schema=None):
+        self.rows = rows
+        self.schema = schema
+        self.queries = []
+
+    def search(self, *_args, **_kwargs):
+        query = FakeQuery(self.rows, schema=self.schema)
+        self.queries.append(query)
+        return query
+
+
+class FakeDb:
+    def __init__(self, **tables):
+        self.tables = {name: FakeTable(rows, _SCHEMAS.get(name)) for name, rows in tables.items()}
+
+    def table_names(self):
+        return list(self.tables)
+
+    def open_table(self, name):
+        return self.tables[name]
+
+
+def test_to_dt_normalizes_strings_numbers_and_blanks():
+    assert admin._to_dt("2025-01-02T03:04:05Z") == datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert admin._to_dt("2025-01-02T05:04:05+02:00") == datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert admin._to_dt("86400") == datetime(1970, 1, 2, tzinfo=timezone.utc)
+    assert admin._to_dt(86400.0) == datetime(1970, 1, 2, tzinfo=timezone.utc)
+    assert admin._to_dt(None) == admin._to_dt("") == admin._to_dt("garbage") == admin._EPOCH
+    assert admin._to_dt(datetime(2025, 1, 1)).tzinfo == timezone.utc
+
+
+def test_runtime_history_sorts_recent_rows_newest_first():
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"client": "Claude", "captured_at": now - timedelta(hours=h), "delta_requests": 2}
+        for h in (3, 1, 2, 30)
+    ]
+
+    history = admin._collect_runtime_metrics_history(FakeDb(client_runtime_metrics=rows), recent_limit=2)
+
+    assert history["rows_considered"] == 3
+    assert [admin._to_dt(r["captured_at"]) for r in history["recent"]] == [
+        admin._to_dt(rows[1]["captured_at"]),
+        admin._to_dt(rows[2]["captured_at"]),
+    ]
+    assert all("_sort_ts" not in r for r in history["recent"])
+    assert history["by_client"]["claude"]["requests_24h"] == 6
+
+
+def _session(client, *, started, ended=None, read=(), written=(), feedback=(), source_llm=""):
+    return {
+        "id": f"s-{client}-{started}",
+        "api_key_id": client,
+        "source_llm": source_llm,
+        "started_at": datetime(2025, 1, started),
+        "ended_at": datetime(2025, 1, ended) if ended else None,
+        "memory_ids_read": list(read),
+        "memory_ids_written": list(written),
+        "memory_ids_feedback": list(feedback),
+    }
+
+
+def test_client_last_activity_timestamps_keep_the_latest_value(monkeypatch):
+    monkeypatch.setattr(admin, "get_request_metrics_snapshot", lambda: {"claude": {"last_seen_at": "2025-01-05T00:00:00Z"}})
+    sessions = [
+        _session("claude", started=1, read=["m1"]),
+        _session("claude", started=2, ended=3, written=["m2"]),
+        _session("claude", started=2, read=["m3"]),
+    ]
+
+    result = admin._collect_client_observability(FakeDb(sessions=sessions), {})
+
+    claude = next(c for c in result["clients"] if c["name"] == "claude")
+    assert claude["last_read_at"] == "2025-01-02T00:00:00+00:00"
+    assert claude["last_write_at"] == "2025-01-03T00:00:00+00:00"
+    assert claude["last_feedback_at"] is None
+    assert claude["last_seen_at"] == "2025-01-05T00:00:00+00:00"
+    assert not any(key.startswith("_") for key in claude)
+
+
+def test_session_aggregation_counts_per_client(monkeypatch):
+    monkeypatch.setattr(admin, "get_request_metrics_snapshot", lambda: {})
+    sessions = [
+        _session("Claude ", started=1, read=["m1", "m2", ""], written=["w1"]),
+        _session("claude", started=2, written=["w2"], feedback=["m1"]),
+        _session("", started=3, source_llm="GPT", read=["m3"]),
+        _session("", started=4),
+    ]
+
+    result = admin._collect_client_observability(FakeDb(sessions=sessions), {})
+
+    by_name = {c["name"]: c for c in result["clients"]}
+    claude = by_name["claude"]
+    assert claude["sessions_total"] == 2
+    assert claude["memory_reads_total"] == 2 and claude["memory_writes_total"] == 2
+    assert claude["read_before_write_sessions"] == 1 and claude["write_without_read_sessions"] == 1
+    assert claude["sessions_with_feedback"] == 1 and claude["read_before_response_rate"] == 0.5
+    assert by_name["gpt"]["sessions_with_reads"] == 1
+    assert by_name["unknown"]["sessions_total"] == 1
+    summary = result["summary"]
+    assert summary["sessions_total"] == 4 and summary["total_clients"] == 3
+    assert summary["active_clients"] == 3 and summary["configured_clients"] == 0
+    assert summary["write_sessions_total"] == 2 and summary["read_before_write_sessions_total"] == 1
+    assert summary["cross_llm_read_reliability"] == 0.5
+
+
+def test_runtime_history_pushes_cutoff_and_projection_into_the_scan():
+    db = FakeDb(client_runtime_metrics=[])
+
+    admin._collect_runtime_metrics_history(db, period_hours=24)
+
+    query = db.tables["client_runtime_metrics"].queries[0]
+    assert query.clauses and query.clauses[0].startswith("captured_at >= timestamp '")
+    assert query._columns == list(admin._RUNTIME_METRIC_COLUMNS)
+
+
+def test_runtime_history_weights_latency_by_requests():
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"client": "claude", "captured_at": now, "delta_requests": 3, "avg_latency_ms": 10.0, "p95_latency_ms": 40.0},
+        {"client": "claude", "captured_at": now, "delta_requests": 1, "avg_latency_ms": 50.0, "p95_latency_ms": 90.0},
+        {"client": "idle", "captured_at": now, "delta_requests": 0, "avg_latency_ms": 7.0, "p95_latency_ms": 0.0},
+    ]
+
+    by_client = admin._collect_runtime_metrics_history(FakeDb(client_runtime_metrics=rows))["by_client"]
+
+    assert by_client["claude"]["avg_latency_24h_ms"] == 20.0
+    assert by_client["claude"]["p95_latency_24h_ms"] == 90.0
+    assert by_client["claude"]["windows_24h"] == 2
+    assert by_client["idle"]["avg_latency_24h_ms"] == 7.0
+
+
+def test_background_status_runs_audit_and_observability_side_by_side(monkeypatch):
+    import asyncio
+    import threading
+
+    observability_started = threading.Event()
+
+    def _audit(config=None):
+        assert observability_started.wait(timeout=5), "audit ran before observability started"
+        return {"summary": {"fail": 0}, "score": 100, "grade": "A"}
+
+    def _observability(db, cfg, **_kwargs):
+        observability_started.set()
+        return {"clients": [], "summary": {}, "history": {}}
+
+    monkeypatch.setattr(admin, "load_config", lambda force_reload=False: {})
+    monkeypatch.setattr(admin, "_load_scheduler_state", lambda: {})
+    monkeypatch.setattr(admin, "collect_security_audit", _audit)
+    monkeypatch.setattr(admin, "_collect_client_observability", _observability)
+    monkeypatch.setattr(admin, "get_remote_access_status", lambda: {})
+
+    status = json.loads(asyncio.run(admin.get_background_status(Request({"type": "http", "headers": []}), include_heavy=True, db=FakeDb())).body)
+
+    assert status["security"]["last_audit_score"] == 100
+    assert status["clients"]["clients"] == []
+
+
+def test_configured_clients_are_reused_until_the_keys_change(monkeypatch):
+    monkeypatch.setattr(admin, "_configured_clients_memo", None)
+    cfg = {"llm_client_keys": {"Claude": {"scopes": ["read"]}, "off": {"enabled": False}}}
+
+    first = admin._configured_clients_from_config(cfg)
+    assert admin._configured_clients_from_config({"llm_client_keys": {"Claude": {"scopes": ["read"]}, "off": {"enabled": False}}}) is first
+    assert list(first) == ["claude"]
+
+    cfg["llm_client_keys"]["gpt"] = "token"
+    second = admin._configured_clients_from_config(cfg)
+    assert second is not first and set(second) == {"claude", "gpt"}
+
+
+def test_dedupe_keeps_the_newest_row_per_key():
+    rows = [
+        {"id": "a", "k": 1, "updated_at": "2025-01-02T00:00:00Z"},
+        {"id": "b", "k": 2, "updated_at": "2025-01-01T00:00:00Z"},
+        {"id": "c", "k": 1, "updated_at": "2025-01-01T00:00:00Z"},
+        {"id": "d", "k": 1, "updated_at": "2025-01-02T00:00:00Z"},
+    ]
+
+    kept, duplicates, preview = admin._dedupe_newest(rows, lambda row: (row["k"],))
+
+    assert [row["id"] for row in kept] == ["d", "b"]
+    assert duplicates == 2 and preview == ["c", "d"]
+
+
+def test_security_config_patch_merges_nested_sections():
+    existing = {
+        "enforce_mcp_auth": True,
+        "rate_limit": {"enabled": True, "buckets": {"read": 10, "write": 5}},
+        "audit": {"enabled": False},
+    }
+    patch = {
+        "enforce_mcp_auth": None,
+        "allowed_mutation_origins": ["app://mnesis"],
+        "rate_limit": {"buckets": {"write": 9}},
+        "audit": "off",
+    }
+
+    merged = admin._merge_security_config(existing, patch)
+
+    assert merged == {
+        "enforce_mcp_auth": True,
+        "allowed_mutation_origins": ["app://mnesis"],
+        "rate_limit": {"enabled": True, "buckets": {"read": 10, "write": 9}},
+        "audit": "off",
+    }
+    assert existing["rate_limit"]["buckets"] == {"read": 10, "write": 5}
+
+
+def test_scheduler_state_round_trips_through_disk(tmp_path, monkeypatch):
+    path = tmp_path / "scheduler_state.json"
+    monkeypatch.setattr(admin, "_scheduler_state_path", lambda: str(path))
+    stamp = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    admin._save_scheduler_state({"last_run": stamp, "counts": {1: 2}, "ok": True})
+
+    state = admin._load_scheduler_state()
+    assert admin._to_dt(state.pop("last_run")) == stamp
+    assert state == {"counts": {"1": 2}, "ok": True}
+
+
+def test_request_metrics_snapshot_is_reused_within_the_ttl(monkeypatch):
+    calls = []
+    clock = [100.0]
+    monkeypatch.setattr(admin.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(admin, "get_request_metrics_snapshot", lambda: calls.append(1) or {"n": len(calls)})
+
+    first = admin._cached_request_metrics_snapshot()
+    clock[0] += admin._REQUEST_METRICS_TTL_SECONDS / 2
+    second = admin._cached_request_metrics_snapshot()
+    clock[0] += admin._REQUEST_METRICS_TTL_SECONDS
+    third = admin._cached_request_metrics_snapshot()
+
+    assert first is second and first == {"n": 1}
+    assert third == {"n": 2}
+
+
+def test_analysis_tag_info_detects_both_markers():
+    assert admin._analysis_tag_info([" Auto:Conversation-Analysis ", None, "auto:conversation-analysis:msgcount:12"]) == (
+        True,
+        True,
+    )
+    assert admin._analysis_tag_info(["auto:conversation-analysis:msgcount:3", "other"]) == (False, True)
+    assert admin._analysis_tag_info([None, 7, ""]) == (False, False)
+
+
+def test_nonempty_id_counts_skip_blank_ids():
+    column = pa.chunked_array([pa.array([["a", "", "b"], None, [], ["", ""]]), pa.array([["c", None]])])
+
+    assert admin._nonempty_id_counts(column).tolist() == [2, 0, 0, 0, 2]
+    assert admin._nonempty_id_counts(pa.array([["a"], ["b", "c"]], pa.list_(pa.string()))).tolist() == [1, 2]
+
+
+def test_safe_config_masks_secrets_and_reuses_the_view(monkeypatch):
+    monkeypatch.setattr(admin, "_safe_config_memo", None)
+    config = {"snapshot_read_token": "tok", "webdav_password": "pw", "sync": {"enabled": False}}
+
+    first = admin._safe_config(config)
+    assert first == {"snapshot_read_token": "***", "webdav_password": "***", "sync": {"enabled": False}}
+    assert admin._safe_config(config) is first
+
+    config["secret_access_key"] = "s3"
+    assert admin._safe_config(config)["secret_access_key"] == "***"
+    assert admin._safe_config(dict(config)) is not first
+
+
+def test_security_routes_resolve_config_and_state_through_dependencies(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    loads = []
+    monkeypatch.setattr(admin, "load_config", lambda force_reload=False: loads.append("cfg") or {"security": {}})
+    monkeypatch.setattr(admin, "_load_scheduler_state", lambda: loads.append("state") or {})
+    monkeypatch.setattr(admin, "collect_security_audit", lambda config: {"score": 90})
+    app = FastAPI()
+    app.include_router(admin.router)
+
+    response = TestClient(app).get("/api/v1/admin/security/status")
+
+    assert response.status_code == 200 and response.json()["audit"] == {"score": 90}
+    assert loads == ["cfg", "state"]
+
+
+def test_unchanged_security_config_is_not_rewritten(monkeypatch):
+    saves = []
+    monkeypatch.setattr(admin, "save_config", lambda cfg: saves.append(dict(cfg["security"])))
+    monkeypatch.setattr(admin, "_record_security_audit", lambda cfg: {"score": 100})
+    cfg = {"security": {"enforce_mcp_auth": True}}
+
+    assert admin._persist_security_config(cfg, {"enforce_mcp_auth": True}) == {"score": 100}
+    assert saves == []
+    admin._persist_security_config(cfg, {"enforce_mcp_auth": True}, config_changed=True)
+    admin._persist_security_config(cfg, {"enforce_mcp_auth": False})
+    assert saves == [{"enforce_mcp_auth": True}, {"enforce_mcp_auth": False}]
+    assert cfg["security"] == {"enforce_mcp_auth": False}
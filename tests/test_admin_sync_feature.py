@@ -0,0 +1,101 @@
+import asyncio
+import json
+import threading
+
+from backend.routers import admin
+
+
+def test_s3_clients_are_reused_per_endpoint_and_credentials():
+    admin._get_s3_client.cache_clear()
+
+    first = admin._get_s3_client("https://r2.example", "key", "secret", "auto")
+    again = admin._get_s3_client("https://r2.example", "key", "secret", "auto")
+    other = admin._get_s3_client("https://r2.example", "key", "rotated", "auto")
+
+    assert first is again
+    assert other is not first
+    admin._get_s3_client.cache_clear()
+
+
+def test_sync_connection_check_runs_head_bucket_off_the_event_loop(monkeypatch):
+    calls = []
+
+    class _FakeS3:
+        def head_bucket(self, Bucket):
+            calls.append((Bucket, threading.current_thread() is threading.main_thread()))
+
+    monkeypatch.setattr(admin, "_get_s3_client", lambda *args: _FakeS3())
+    payload = admin.SyncTestPayload(provider="r2", endpoint_url="https://r2.example", bucket=" backups ")
+
+    assert json.loads(asyncio.run(admin.test_sync_connection(payload)).body) == {"ok": True, "provider": "r2"}
+    assert calls == [("backups", False)]
+
+
+def test_connection_checks_share_one_pooled_client(monkeypatch):
+    monkeypatch.setattr(admin, "_http_client", None)
+    monkeypatch.setattr(admin, "_http_client_loop", None)
+
+    async def _run():
+        first = admin._shared_http_client()
+        second = admin._shared_http_client()
+        await admin.close_shared_http_client()
+        return first, second
+
+    first, second = asyncio.run(_run())
+    assert first is second and first.is_closed
+    assert admin._http_client is None
+
+
+def test_webdav_check_does_not_replay_server_cookies(monkeypatch):
+    import httpx
+
+    seen = []
+
+    def _handler(request):
+        seen.append(request.headers.get("cookie"))
+        return httpx.Response(207, headers={"set-cookie": "sid=abc; Path=/"})
+
+    monkeypatch.setattr(admin, "_http_client", None)
+    monkeypatch.setattr(admin, "_http_client_loop", None)
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: real_client(transport=httpx.MockTransport(_handler), **kw))
+    payload = admin.SyncTestPayload(provider="webdav", webdav_url="https://dav.example", webdav_username="u")
+
+    async def _run():
+        try:
+            return [json.loads((await admin.test_sync_connection(payload)).body) for _ in range(2)]
+        finally:
+            await admin.close_shared_http_client()
+
+    assert asyncio.run(_run()) == [{"ok": True, "provider": "webdav"}] * 2
+    assert seen == [None, None]
+
+
+def test_insights_ping_sends_the_configured_model_and_key(monkeypatch):
+    import httpx
+
+    seen = []
+
+    def _handler(request):
+        seen.append((str(request.url), dict(request.headers), json.loads(request.content)))
+        return httpx.Response(200, json={})
+
+    monkeypatch.setattr(admin, "_http_client", None)
+    monkeypatch.setattr(admin, "_http_client_loop", None)
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: real_client(transport=httpx.MockTransport(_handler), **kw))
+    monkeypatch.setattr(
+        admin, "load_config", lambda: {"insights": {"provider": "anthropic", "model": "m1", "api_key": "k1"}}
+    )
+
+    async def _run():
+        try:
+            return json.loads((await admin.test_insights_connection()).body)
+        finally:
+            await admin.close_shared_http_client()
+
+    assert asyncio.run(_run())["model"] == "m1"
+    url, headers, body = seen[0]
+    assert url == "https://api.anthropic.com/v1/messages"
+    assert headers["x-api-key"] == "k1" and headers["anthropic-version"] == "2023-06-01"
+    assert body == {"model": "m1", "max_tokens": 1, "messages": [{"role": "user", "content": "ping"}]}
@@ -130,6 +130,47 @@ def test_chatgpt_memory_parser_ignores_conversation_rows():
     assert len(conversations) == 1
 
 
+def test_chatgpt_memory_parser_streams_large_exports(monkeypatch):
+    from backend.memory.importers import base as importer_base
+
+    payload = [
+        {"memory": "The user prefers concise answers when reviewing code."},
+        {"memory": "The user works as a backend engineer."},
+    ]
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as fh:
+        json.dump(payload, fh)
+        tmp_path = fh.name
+
+    monkeypatch.setattr(importer_base, "STREAMING_THRESHOLD_BYTES", 1)
+    importer = ChatGPTImporter()
+    memories = importer.parse_memories(tmp_path)
+    os.unlink(tmp_path)
+
+    assert [m.content for m in memories] == [item["memory"] for item in payload]
+    assert memories[1].original_category == "identity"
+
+
+def test_chatgpt_memory_parser_drops_duplicate_content():
+    payload = [
+        {"memory": "The user prefers concise answers."},
+        {"memory": "  the user prefers CONCISE answers.  "},
+        {"memory": "The user works as a backend engineer."},
+    ]
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as fh:
+        json.dump(payload, fh)
+        tmp_path = fh.name
+
+    deduplicated = ChatGPTImporter().parse_memories(tmp_path)
+    raw = ChatGPTImporter(deduplicate=False).parse_memories(tmp_path)
+    os.unlink(tmp_path)
+
+    assert len(deduplicated) == 2
+    assert deduplicated[0].content == "The user prefers concise answers."
+    assert len(raw) == 3
+
+
 def test_chatgpt_parser_generates_stable_id_when_missing():
     payload = [
         {
@@ -0,0 +1,38 @@
+import yaml
+
+from backend import config
+
+
+def _use_tmp_config(monkeypatch, tmp_path):
+    path = tmp_path / "config.yaml"
+    monkeypatch.setattr(config, "CONFIG_PATH", str(path))
+    monkeypatch.setattr(config, "_config_cache", None)
+    monkeypatch.setattr(config, "_config_disk_state", None)
+    return path
+
+
+def test_force_reload_skips_parsing_an_unchanged_file(monkeypatch, tmp_path):
+    _use_tmp_config(monkeypatch, tmp_path)
+    config.load_config(force_reload=True)
+
+    parses = []
+    real_safe_load = yaml.safe_load
+    monkeypatch.setattr(config.yaml, "safe_load", lambda f: parses.append(1) or real_safe_load(f))
+
+    first = config.load_config(force_reload=True)
+    first["remote_access"]["enabled"] = "mutated"
+    second = config.load_config(force_reload=True)
+
+    assert parses == []
+    assert second is not first
+    assert second["remote_access"]["enabled"] is False
+
+
+def test_force_reload_picks_up_external_edits(monkeypatch, tmp_path):
+    path = _use_tmp_config(monkeypatch, tmp_path)
+    cfg = config.load_config(force_reload=True)
+
+    cfg["remote_access"]["relay_url"] = "https://edited.example"
+    path.write_text(yaml.dump(cfg) + "\n# edited\n")
+
+    assert config.load_config(force_reload=True)["remote_access"]["relay_url"] == "https://edited.example"
@@ -17,3 +17,46 @@ def test_analysis_stats_sample_errors_only_include_error_actions():
     assert stats["rejected"] == 2
     assert stats["duration_ms"] == 1200
     assert stats["sample_errors"] == ["Field 'decay_profile' not found in target schema"]
+
+
+def test_waiters_wake_when_the_job_settles(monkeypatch):
+    import asyncio
+
+    status = {"value": "running"}
+    reads = []
+
+    def _get_job(job_id):
+        reads.append(job_id)
+        return {"id": job_id, "status": status["value"]}
+
+    monkeypatch.setattr(conversation_analysis_jobs, "get_analysis_job", _get_job)
+    monkeypatch.setattr(conversation_analysis_jobs, "_settled_events", {})
+
+    async def _run():
+        loop = asyncio.get_running_loop()
+        waiter = asyncio.create_task(conversation_analysis_jobs.wait_for_analysis_job("job-1", timeout=60))
+        await asyncio.sleep(0.01)
+        status["value"] = "completed"
+        started = loop.time()
+        conversation_analysis_jobs._signal_job_settled("job-1", "completed")
+        job = await waiter
+        return job, loop.time() - started
+
+    job, elapsed = asyncio.run(_run())
+
+    assert job["status"] == "completed"
+    assert elapsed < 1.0
+    assert reads == ["job-1", "job-1"]
+    assert conversation_analysis_jobs._settled_events == {}
+
+
+def test_waiting_gives_up_at_the_timeout(monkeypatch):
+    import asyncio
+
+    monkeypatch.setattr(conversation_analysis_jobs, "get_analysis_job", lambda job_id: {"id": job_id, "status": "pending"})
+    monkeypatch.setattr(conversation_analysis_jobs, "_settled_events", {})
+
+    job = asyncio.run(conversation_analysis_jobs.wait_for_analysis_job("job-2", timeout=0.05))
+
+    assert job["status"] == "pending"
+    assert conversation_analysis_jobs._settled_events == {}
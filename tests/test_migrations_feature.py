@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+from backend import migrations
+from backend.database.schema import Memory
+
+
+def test_legacy_memory_rows_are_normalized_column_wise():
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    legacy = pa.Table.from_pylist(
+        [
+            {
+                "id": "a",
+                "content": "hello",
+                "level": "",
+                "importance_score": 0.0,
+                "tags": ["t"],
+                "source_conversation_id": "",
+                "version": 3,
+                "created_at": "2024-01-01T00:00:00Z",
+                "vector": [0.5, 0.5, 0.5],
+            },
+            {
+                "id": None,
+                "content": "bye",
+                "level": "episodic",
+                "importance_score": 0.3,
+                "tags": None,
+                "source_conversation_id": "conv",
+                "version": 0,
+                "created_at": None,
+                "vector": [0.25, 0.25],
+            },
+        ]
+    )
+    schema = Memory.to_arrow_schema()
+    dim = schema.field("vector").type.list_size
+
+    out = migrations._normalize_legacy_memories(legacy.to_batches()[0], schema, dim, now).to_pylist()
+
+    first, second = out
+    assert first["id"] == "a" and second["id"]
+    assert first["level"] == "semantic" and second["level"] == "episodic"
+    assert first["importance_score"] == 0.5 and second["importance_score"] == 0.3
+    assert first["tags"] == ["t"] and second["tags"] == []
+    assert first["source_conversation_id"] is None and second["source_conversation_id"] == "conv"
+    assert first["version"] == 3 and second["version"] == 1
+    assert first["created_at"] == datetime(2024, 1, 1)
+    assert second["created_at"] == datetime(2025, 1, 1)
+    assert first["expires_at"] is None and first["needs_review"] is False
+    assert first["decay_profile"] == "stable" and first["workspace_id"] == "default"
+    assert second["vector"] == [0.0] * dim
+
+
+def test_schema_version_is_replaced_atomically(tmp_path, monkeypatch):
+    path = tmp_path / "data" / "schema_version.txt"
+    monkeypatch.setattr(migrations, "_get_schema_file", lambda: str(path))
+
+    migrations._write_version(7)
+    migrations._write_version(8)
+
+    assert migrations._read_version() == 8
+    assert sorted(p.name for p in path.parent.iterdir()) == ["schema_version.txt"]
@@ -0,0 +1,273 @@
+import asyncio
+import hashlib
+import hmac
+
+import httpx
+import pytest
+
+from backend.remote import relay_client
+
+
+def _remote_cfg(**overrides):
+    cfg = relay_client._normalize_remote_cfg(
+        {
+            "enabled": True,
+            "relay_url": "https://relay.example",
+            "project_id": "proj",
+            "device_id": "dev",
+            "device_secret": "s3cret",
+        }
+    )
+    cfg.update(overrides)
+    return cfg
+
+
+def test_signed_headers_default_to_hmac_sha256():
+    body = b'{"ok":true}'
+    headers = relay_client._signed_headers(remote_cfg=_remote_cfg(), body_bytes=body)
+
+    signed = f"{headers['X-Mnesis-Timestamp']}.{headers['X-Mnesis-Nonce']}.{hashlib.sha256(body).hexdigest()}"
+    expected = hmac.new(b"s3cret", signed.encode("utf-8"), hashlib.sha256).hexdigest()
+    assert headers["X-Mnesis-Alg"] == "hmac-sha256"
+    assert headers["X-Mnesis-Signature"] == expected
+
+
+def test_signed_headers_support_keyed_blake2b():
+    body = b'{"ok":true}'
+    headers = relay_client._signed_headers(remote_cfg=_remote_cfg(signature_alg="b2b-256"), body_bytes=body)
+
+    payload_hash = hashlib.blake2b(body, digest_size=32).hexdigest()
+    signed = f"{headers['X-Mnesis-Timestamp']}.{headers['X-Mnesis-Nonce']}.{payload_hash}"
+    expected = hashlib.blake2b(signed.encode("utf-8"), key=b"s3cret", digest_size=32).hexdigest()
+    assert headers["X-Mnesis-Alg"] == "b2b-256"
+    assert headers["X-Mnesis-Signature"] == expected
+
+
+def test_unknown_signature_alg_falls_back_to_hmac():
+    assert relay_client._normalize_remote_cfg({"signature_alg": "md5"})["signature_alg"] == "hmac-sha256"
+
+
+def test_poll_once_uses_the_shared_client_for_every_request(monkeypatch):
+    monkeypatch.setattr(relay_client, "_last_registration", None)
+    seen = []
+
+    def _handler(request):
+        seen.append(request.url.path)
+        if request.url.path.endswith("/poll"):
+            return httpx.Response(204)
+        return httpx.Response(404)
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            cfg = _remote_cfg()
+            await relay_client._poll_once(cfg, client)
+            return await relay_client._poll_once(cfg, client)
+
+    assert asyncio.run(_run()) == 12
+    assert seen == [relay_client._REGISTER_PATH, relay_client._POLL_PATH, relay_client._POLL_PATH]
+
+
+def test_registration_is_repeated_when_the_window_lapses_or_identity_changes(monkeypatch):
+    monkeypatch.setattr(relay_client, "_last_registration", None)
+    registers = []
+
+    def _handler(request):
+        if request.url.path.endswith("/register"):
+            registers.append(request.headers["X-Mnesis-Device-Id"])
+            return httpx.Response(204)
+        return httpx.Response(204)
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            await relay_client._poll_once(_remote_cfg(), client)
+            await relay_client._poll_once(_remote_cfg(device_id="dev-2"), client)
+            identity, at = relay_client._last_registration
+            relay_client._last_registration = (identity, at - relay_client._REGISTER_INTERVAL_SECONDS)
+            await relay_client._poll_once(_remote_cfg(device_id="dev-2"), client)
+
+    asyncio.run(_run())
+
+    assert registers == ["dev", "dev-2", "dev-2"]
+
+
+def test_task_results_are_sanitized_to_plain_json():
+    result = relay_client._json_serialize({"n": 1, 2: "two", "obj": object(), "items": ({"a": None},)})
+
+    assert result["n"] == 1
+    assert result["2"] == "two"
+    assert isinstance(result["obj"], str)
+    assert result["items"] == [{"a": None}]
+
+
+def test_msgpack_wire_format_round_trips_poll_requests():
+    import msgpack
+
+    bodies = []
+
+    def _handler(request):
+        if not request.url.path.endswith("/poll"):
+            return httpx.Response(404)
+        bodies.append((request.headers["content-type"], msgpack.unpackb(request.content, raw=False)))
+        return httpx.Response(
+            200,
+            content=msgpack.packb({"tasks": [], "poll_after_seconds": 30}),
+            headers={"content-type": "application/msgpack"},
+        )
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            return await relay_client._poll_once(_remote_cfg(wire_format="msgpack"), client)
+
+    assert asyncio.run(_run()) == 30
+    content_type, body = bodies[0]
+    assert content_type == "application/msgpack"
+    assert body["project_id"] == "proj" and body["max_tasks"] == 4
+
+
+def test_tool_args_are_filtered_to_the_handler_signature():
+    handler = relay_client._TASK_HANDLERS["memory_write"]
+    allowed = relay_client._TASK_HANDLER_PARAMS[handler]
+
+    args = relay_client._tool_args_for_handler(handler, {"not_a_param": 1, **{name: name for name in allowed}})
+
+    assert set(args) == set(allowed)
+
+
+def test_runtime_counters_increment_in_place(monkeypatch):
+    monkeypatch.setattr(relay_client, "_runtime", {"polls_total": 2, "status": "running"})
+
+    relay_client._incr_runtime({"polls_total": 1, "polls_failed": 1}, status="error")
+
+    assert relay_client._runtime == {"polls_total": 3, "polls_failed": 1, "status": "error"}
+
+
+def test_poll_runs_tasks_concurrently_and_reports_in_order(monkeypatch):
+    running = []
+    peak = []
+    reported = []
+
+    async def _fake_execute(remote_cfg, task):
+        running.append(task["id"])
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(task["id"])
+        return {"task_id": task["id"], "tool": "memory_write", "ok": True, "result": None}
+
+    monkeypatch.setattr(relay_client, "_execute_task", _fake_execute)
+
+    def _handler(request):
+        if request.url.path.endswith("/poll"):
+            tasks = [{"id": f"t{i}"} for i in range(4)]
+            return httpx.Response(200, json={"tasks": tasks})
+        if request.url.path.endswith("/report"):
+            reported.extend(r["task_id"] for r in relay_client.json.loads(request.content)["results"])
+            return httpx.Response(200)
+        return httpx.Response(404)
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            await relay_client._poll_once(_remote_cfg(max_tasks_per_poll=4, max_task_concurrency=2), client)
+
+    asyncio.run(_run())
+
+    assert max(peak) == 2
+    assert reported == ["t0", "t1", "t2", "t3"]
+
+
+def test_last_results_keep_the_newest_entries_first(monkeypatch):
+    monkeypatch.setattr(
+        relay_client, "_runtime", {"last_results": relay_client.deque(maxlen=relay_client._LAST_RESULTS_MAX)}
+    )
+
+    relay_client._commit_poll_runtime({}, [{"task_id": i} for i in range(relay_client._LAST_RESULTS_MAX + 3)], {})
+
+    snapshot = relay_client._snapshot_runtime()["last_results"]
+    assert isinstance(snapshot, list)
+    assert [row["task_id"] for row in snapshot] == list(range(10, 2, -1))
+
+
+def test_poll_commits_runtime_once_even_when_it_fails(monkeypatch):
+    monkeypatch.setattr(relay_client, "_last_registration", None)
+    commits = []
+    monkeypatch.setattr(relay_client, "_commit_poll_runtime", lambda *args: commits.append(args))
+
+    def _handler(request):
+        if request.url.path.endswith("/poll"):
+            return httpx.Response(500)
+        return httpx.Response(204)
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            await relay_client._poll_once(_remote_cfg(), client)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_run())
+
+    assert len(commits) == 1
+    deltas, recent, patch = commits[0]
+    assert patch["last_http_status"] == 500 and "registered_at" in patch
+    assert recent == [] and deltas["tasks_received"] == 0
+
+
+def test_request_signer_reuses_static_headers_without_mutating_them():
+    signer = relay_client._RequestSigner(_remote_cfg())
+
+    first = signer.sign(b"a")
+    second = signer.sign(b"b", content_type="application/msgpack")
+
+    assert set(signer.headers) == {"X-Mnesis-Project-Id", "X-Mnesis-Device-Id", "X-Mnesis-Alg"}
+    assert first["X-Mnesis-Project-Id"] == second["X-Mnesis-Project-Id"] == "proj"
+    assert first["X-Mnesis-Nonce"] != second["X-Mnesis-Nonce"]
+    assert second["Content-Type"] == "application/msgpack"
+
+
+def test_json_responses_decode_from_raw_bytes():
+    res = httpx.Response(200, content='{"tasks": [{"id": "t1", "args": {"q": "café"}}]}'.encode("utf-8"))
+
+    assert relay_client._decode_response(res) == {"tasks": [{"id": "t1", "args": {"q": "café"}}]}
+    assert relay_client._decode_response(httpx.Response(204)) == {}
+
+
+def test_request_signer_tracks_the_config_it_was_built_from():
+    cfg = _remote_cfg()
+    signer = relay_client._RequestSigner(cfg)
+
+    assert signer.source == relay_client._RequestSigner.inputs(_remote_cfg())
+    assert signer.source != relay_client._RequestSigner.inputs(_remote_cfg(device_secret="rotated"))
+
+
+def test_task_results_are_reported_in_chunks(monkeypatch):
+    batches = []
+
+    async def _fake_execute(remote_cfg, task):
+        return {"task_id": task["id"], "tool": "memory_write", "ok": True, "result": None}
+
+    monkeypatch.setattr(relay_client, "_execute_task", _fake_execute)
+
+    def _handler(request):
+        if request.url.path.endswith("/poll"):
+            return httpx.Response(200, json={"tasks": [{"id": f"t{i}"} for i in range(10)]})
+        if request.url.path.endswith("/report"):
+            batches.append([r["task_id"] for r in relay_client.json.loads(request.content)["results"]])
+            return httpx.Response(200)
+        return httpx.Response(404)
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            await relay_client._poll_once(_remote_cfg(max_tasks_per_poll=10), client)
+
+    asyncio.run(_run())
+
+    assert [len(batch) for batch in batches] == [relay_client._REPORT_BATCH_SIZE, 2]
+    assert sorted(t for batch in batches for t in batch) == sorted(f"t{i}" for i in range(10))
+
+
+def test_http_client_skips_environment_lookup():
+    async def _run():
+        client = relay_client._build_http_client(_remote_cfg())
+        try:
+            return client.trust_env
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(_run()) is False
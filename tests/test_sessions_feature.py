@@ -0,0 +1,266 @@
+import asyncio
+import re
+from copy import deepcopy
+from types import SimpleNamespace
+
+from backend.memory import sessions
+
+
+def _row_to_dict(row):
+    if isinstance(row, dict):
+        return deepcopy(row)
+    return deepcopy(row.model_dump())
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def where(self, clause):
+        match = re.search(r"(\w+)\s*=\s*'([^']+)'", str(clause or ""))
+        if not match:
+            return FakeQuery(self._rows)
+        column, value = match.groups()
+        return FakeQuery([row for row in self._rows if str(row.get(column) or "") == value])
+
+    def select(self, columns):
+        return FakeQuery([{c: row.get(c) for c in columns} for row in self._rows])
+
+    def limit(self, n):
+        return FakeQuery(self._rows[: int(n)])
+
+    def to_list(self):
+        return [deepcopy(row) for row in self._rows]
+
+
+class FakeTable:
+    def __init__(self):
+        self.rows = []
+        self.searches = 0
+        self.writes = 0
+
+    def search(self, *_args, **_kwargs):
+        self.searches += 1
+        return FakeQuery(self.rows)
+
+    def add(self, rows):
+        self.writes += 1
+        for row in rows:
+            self.rows.append(_row_to_dict(row))
+
+    def delete(self, where):
+        ids = set(re.findall(r"'([^']+)'", str(where or "")))
+        self.rows = [row for row in self.rows if str(row.get("id") or "") not in ids]
+
+    def update(self, where, values):
+        self.writes += 1
+        match = re.search(r"id\s*=\s*'([^']+)'", str(where or ""))
+        version = re.search(r"version\s*=\s*(\d+)", str(where or ""))
+        updated = 0
+        for row in self.rows:
+            if not match or str(row.get("id") or "") != match.group(1):
+                continue
+            if version and int(row.get("version") or 0) != int(version.group(1)):
+                continue
+            row.update(deepcopy(values or {}))
+            updated += 1
+        return SimpleNamespace(rows_updated=updated)
+
+
+class FakeDb:
+    def __init__(self):
+        self.tables = {"sessions": FakeTable(), "session_activity_events": FakeTable()}
+        self.opened = []
+
+    def table_names(self):
+        return list(self.tables.keys())
+
+    def open_table(self, name):
+        self.opened.append(name)
+        return self.tables[name]
+
+
+def _install_fake_db(monkeypatch):
+    fake_db = FakeDb()
+    monkeypatch.setattr(sessions, "get_db", lambda: fake_db)
+
+    async def _run_inline(write_op, *args, **kwargs):
+        return await write_op()
+
+    async def _add_inline(table, rows, *args, **kwargs):
+        table.add(rows)
+
+    monkeypatch.setattr(sessions, "enqueue_write", _run_inline)
+    monkeypatch.setattr(sessions, "enqueue_add", _add_inline)
+    return fake_db
+
+
+def test_concurrent_activity_updates_coalesce_into_one_write(monkeypatch):
+    fake_db = _install_fake_db(monkeypatch)
+    tbl = fake_db.tables["session_activity_events"]
+
+    async def _run():
+        session_id = await sessions.start_session("claude", api_key_id="claude")
+        writes_before = tbl.writes
+        await asyncio.gather(
+            sessions.update_session_activity(session_id, read_ids=["m1", "m2"]),
+            sessions.update_session_activity(session_id, read_ids=["m2", "m3"]),
+            sessions.update_session_activity(session_id, write_ids=["m4"], feedback_ids=["m1"]),
+        )
+        return session_id, tbl.writes - writes_before
+
+    session_id, writes = asyncio.run(_run())
+
+    assert writes == 1
+    sessions._cache_evict(session_id)
+    row = sessions.get_session(session_id)
+    assert row["memory_ids_read"] == ["m1", "m2", "m3"]
+    assert row["memory_ids_written"] == ["m4"]
+    assert row["memory_ids_feedback"] == ["m1"]
+
+
+def test_activity_updates_append_events_instead_of_rewriting_session(monkeypatch):
+    fake_db = _install_fake_db(monkeypatch)
+    sessions_tbl = fake_db.tables["sessions"]
+    events_tbl = fake_db.tables["session_activity_events"]
+
+    async def _run():
+        session_id = await sessions.start_session("claude", api_key_id="claude")
+        await sessions.update_session_activity(session_id, read_ids=["m1"])
+        await sessions.update_session_activity(session_id, read_ids=["m1", "m2"])
+        return session_id
+
+    session_id = asyncio.run(_run())
+
+    assert sessions_tbl.writes == 1
+    assert [(e["kind"], e["memory_id"]) for e in events_tbl.rows] == [("read", "m1"), ("read", "m2")]
+    assert all(e["session_id"] == session_id for e in events_tbl.rows)
+
+
+def test_compaction_folds_events_into_session_rows(monkeypatch):
+    fake_db = _install_fake_db(monkeypatch)
+
+    async def _run():
+        session_id = await sessions.start_session("claude", api_key_id="claude")
+        await sessions.update_session_activity(session_id, read_ids=["m1"], write_ids=["m2"])
+        return session_id
+
+    session_id = asyncio.run(_run())
+
+    assert sessions.compact_session_activity(fake_db) == 2
+    assert fake_db.tables["session_activity_events"].rows == []
+    row = next(r for r in fake_db.tables["sessions"].rows if r["id"] == session_id)
+    assert row["memory_ids_read"] == ["m1"]
+    assert row["memory_ids_written"] == ["m2"]
+
+
+def test_activity_updates_for_known_sessions_skip_the_lookup(monkeypatch):
+    fake_db = _install_fake_db(monkeypatch)
+    tbl = fake_db.tables["sessions"]
+
+    async def _run():
+        session_id = await sessions.start_session("claude", api_key_id="claude")
+        await sessions.update_session_activity(session_id, read_ids=["m1"])
+        await sessions.update_session_activity(session_id, write_ids=["m2"])
+        return session_id
+
+    session_id = asyncio.run(_run())
+
+    assert tbl.searches == 0
+    assert fake_db.tables["session_activity_events"].searches == 0
+    row = sessions.get_session(session_id)
+    assert row["memory_ids_read"] == ["m1"]
+    assert row["memory_ids_written"] == ["m2"]
+
+    asyncio.run(sessions.end_session(session_id, reason="done"))
+    assert session_id not in sessions._SESSION_CACHE
+
+
+def test_noop_and_repeat_activity_updates_skip_lancedb(monkeypatch):
+    fake_db = _install_fake_db(monkeypatch)
+    events_tbl = fake_db.tables["session_activity_events"]
+    flushed = []
+
+    async def _record_flush(*args):
+        flushed.append(args)
+
+    monkeypatch.setattr(sessions._session_coalescer, "_flush", _record_flush)
+
+    async def _run():
+        session_id = await sessions.start_session("claude", api_key_id="claude")
+        sessions._cache_put(session_id, {**sessions._cache_get(session_id), "memory_ids_read": ["m1"]})
+        await sessions.update_session_activity(session_id)
+        await sessions.update_session_activity(session_id, read_ids=["m1"])
+
+    asyncio.run(_run())
+
+    assert flushed == []
+    assert events_tbl.writes == 0
+
+
+def test_sessions_table_handle_is_opened_once(monkeypatch):
+    fake_db = _install_fake_db(monkeypatch)
+
+    async def _run():
+        session_id = await sessions.start_session("claude", api_key_id="claude")
+        await sessions.update_session_activity(session_id, read_ids=["m1"])
+        await sessions.update_session_activity(session_id, read_ids=["m2"])
+        await sessions.end_session(session_id, reason="done")
+
+    asyncio.run(_run())
+
+    assert fake_db.opened.count("sessions") == 1
+
+
+def test_compaction_retries_when_the_session_version_moves(monkeypatch):
+    fake_db = _install_fake_db(monkeypatch)
+    sessions_tbl = fake_db.tables["sessions"]
+
+    async def _run():
+        session_id = await sessions.start_session("claude", api_key_id="claude")
+        await sessions.update_session_activity(session_id, read_ids=["m1"])
+        return session_id
+
+    session_id = asyncio.run(_run())
+
+    original_update = sessions_tbl.update
+    raced = []
+
+    def _racing_update(where, values):
+        if not raced:
+            raced.append(True)
+            row = next(r for r in sessions_tbl.rows if r["id"] == session_id)
+            row["version"] = int(row.get("version") or 0) + 1
+        return original_update(where, values)
+
+    sessions_tbl.update = _racing_update
+
+    assert sessions.compact_session_activity(fake_db) == 1
+    row = next(r for r in sessions_tbl.rows if r["id"] == session_id)
+    assert row["memory_ids_read"] == ["m1"]
+    assert row["version"] == 2
+
+
+def test_arrow_session_scan_merges_pending_events(monkeypatch):
+    import pyarrow as pa
+
+    fake_db = _install_fake_db(monkeypatch)
+    fake_db.tables["session_activity_events"].rows = [
+        {"id": "e1", "session_id": "s1", "kind": "read", "memory_id": "m2"},
+        {"id": "e2", "session_id": "s1", "kind": "read", "memory_id": "m1"},
+    ]
+    table = pa.table(
+        {
+            "id": ["s1", "s2"],
+            "memory_ids_read": [["m1"], ["m9"]],
+            "memory_ids_written": [[], []],
+            "memory_ids_feedback": [[], []],
+        }
+    )
+
+    merged = sessions.merge_session_activity_table(fake_db, table)
+
+    rows = {row["id"]: row for row in merged.to_pylist()}
+    assert merged.schema == table.schema
+    assert rows["s1"]["memory_ids_read"] == ["m1", "m2"]
+    assert rows["s2"]["memory_ids_read"] == ["m9"]
@@ -0,0 +1,125 @@
+import asyncio
+
+from backend.memory import write_queue
+
+
+def _run_with_fresh_queues(monkeypatch, coro_factory):
+    async def _run():
+        monkeypatch.setattr(
+            write_queue,
+            "_queues",
+            [asyncio.Queue(maxsize=write_queue.WRITE_QUEUE_MAXSIZE) for _ in range(write_queue.WRITE_QUEUE_SHARDS)],
+        )
+        await write_queue.start_write_worker()
+        try:
+            return await coro_factory()
+        finally:
+            for task in write_queue._worker_tasks:
+                task.cancel()
+
+    return asyncio.run(_run())
+
+
+def test_writes_with_the_same_key_run_in_submission_order(monkeypatch):
+    order = []
+
+    def _op(tag, delay):
+        async def _write():
+            await asyncio.sleep(delay)
+            order.append(tag)
+            return tag
+        return _write
+
+    async def _scenario():
+        return await asyncio.gather(
+            write_queue.enqueue_write(_op("a1", 0.02), key="session-a"),
+            write_queue.enqueue_write(_op("a2", 0.0), key="session-a"),
+            write_queue.enqueue_write(_op("a3", 0.0), key="session-a"),
+        )
+
+    results = _run_with_fresh_queues(monkeypatch, _scenario)
+
+    assert results == ["a1", "a2", "a3"]
+    assert order == ["a1", "a2", "a3"]
+
+
+def test_writes_for_unrelated_keys_do_not_wait_on_each_other(monkeypatch):
+    keys = {}
+    for candidate in (f"session-{i}" for i in range(100)):
+        keys.setdefault(write_queue._queue_for(candidate), candidate)
+        if len(keys) == 2:
+            break
+    slow_key, fast_key = list(keys.values())
+    order = []
+
+    def _op(tag, delay):
+        async def _write():
+            await asyncio.sleep(delay)
+            order.append(tag)
+        return _write
+
+    async def _scenario():
+        await asyncio.gather(
+            write_queue.enqueue_write(_op("slow", 0.05), key=slow_key),
+            write_queue.enqueue_write(_op("fast", 0.0), key=fast_key),
+        )
+
+    _run_with_fresh_queues(monkeypatch, _scenario)
+
+    assert order == ["fast", "slow"]
+
+
+def test_queued_appends_to_one_table_share_a_single_commit(monkeypatch):
+    class _Table:
+        name = "events"
+
+        def __init__(self):
+            self.commits = []
+
+        def add(self, rows):
+            self.commits.append(list(rows))
+
+    table = _Table()
+
+    async def _block():
+        await asyncio.sleep(0.01)
+
+    async def _scenario():
+        blocker = asyncio.ensure_future(write_queue.enqueue_write(_block))
+        await asyncio.sleep(0)
+        await asyncio.gather(*(write_queue.enqueue_add(table, [i]) for i in range(5)))
+        await blocker
+
+    _run_with_fresh_queues(monkeypatch, _scenario)
+
+    assert table.commits == [[0, 1, 2, 3, 4]]
+
+
+def test_interleaved_appends_are_grouped_per_table(monkeypatch):
+    class _Table:
+        def __init__(self, name):
+            self.name = name
+            self.commits = []
+
+        def add(self, rows):
+            self.commits.append(list(rows))
+
+    events, logs = _Table("events"), _Table("logs")
+
+    async def _block():
+        await asyncio.sleep(0.01)
+
+    async def _scenario():
+        blocker = asyncio.ensure_future(write_queue.enqueue_write(_block))
+        await asyncio.sleep(0)
+        await asyncio.gather(
+            write_queue.enqueue_add(events, ["e1"]),
+            write_queue.enqueue_add(logs, ["l1"]),
+            write_queue.enqueue_add(events, ["e2"]),
+        )
+        await blocker
+
+    _run_with_fresh_queues(monkeypatch, _scenario)
+
+    assert events.commits == [["e1", "e2"]]
+    assert logs.commits == [["l1"]]